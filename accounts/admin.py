@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, Profile, ResumeReview, Notification
+from .models import User, Profile, ResumeReview, Notification, NotificationArchive, NotificationCounter
+from .services.notifications import delete_notifications, mark_read, recount, send
 
 
 
@@ -92,7 +93,42 @@ class NotificationAdmin(admin.ModelAdmin):
     actions = ["mark_as_read"]
 
     def mark_as_read(self, request, queryset):
-        queryset.update(is_read=True)
+        mark_read(queryset)
+
+    # keep NotificationCounter in step with admin edits
+    def save_model(self, request, obj, form, change):
+        if not change:
+            send([obj])
+            return
+
+        old_user_id = Notification.objects.filter(pk=obj.pk).values_list("user_id", flat=True).first()
+        super().save_model(request, obj, form, change)
+        recount({old_user_id, obj.user_id})
+
+    def delete_model(self, request, obj):
+        delete_notifications(Notification.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        delete_notifications(queryset)
+
+
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+    list_display = ("created_at", "count", "oldest", "newest", "first_id", "last_id")
+    exclude = ("data",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(NotificationCounter)
+class NotificationCounterAdmin(admin.ModelAdmin):
+    list_display = ("user", "type", "unread")
+    list_filter = ("type",)
+    search_fields = ("user__email",)
 
     
 @admin.register(ResumeReview)
@@ -2,8 +2,11 @@ import os
 import re
 from openai import OpenAI, OpenAIError
 from jobs.utils import visible_jobs_for_user
-from django.db.models import Q
-from jobs.models import Job
+from jobs.models import Job, Location
+from jobs.services.search import order_by_relevance
+from jobs.services.locations import filter_by_location, find_locations
+from jobs.services.skills import match_jobs_for_profile
+from jobs.services.recommendations import recommended_jobs
 
 
 # -------------------------------------------------
@@ -35,6 +38,12 @@ def format_ai_response(text: str) -> str:
 # DYNAMIC LOCATION DETECTOR (DB BASED)
 # -------------------------------------------------
 def extract_location_from_db(question: str):
+    # one Aho–Corasick pass over the question (gazetteer + aliases)
+    found = find_locations(question)
+    if found:
+        return Location.objects.filter(id=found[0]).values_list("name", flat=True).first()
+
+    # towns outside the gazetteer: any place a published job names
     q = question.lower()
 
     locations = (
@@ -108,7 +117,9 @@ def get_ai_help(user, question, page=None):
                     location = profile.location
 
             if location:
-                jobs = visible_jobs_for_user(user).filter(location__icontains=location)[:10]
+                jobs = order_by_relevance(
+                    filter_by_location(visible_jobs_for_user(user), location)
+                )[:10]
 
                 if jobs.exists():
                     job_lines = "\n".join([f"• {job.title} — {job.location}" for job in jobs])
@@ -132,13 +143,8 @@ def get_ai_help(user, question, page=None):
                 "jobs for my skills"
             ]):
                 try:
-                    skills_list = [s.strip() for s in profile.skills.split(",") if s.strip()]
-
-                    query = Q()
-                    for skill in skills_list:
-                        query |= Q(skills__icontains=skill) | Q(title__icontains=skill)
-
-                    jobs = visible_jobs_for_user(user).filter(query).order_by("-created_at")[:5]
+                    jobs = match_jobs_for_profile(visible_jobs_for_user(user), profile)
+                    jobs = order_by_relevance(jobs)[:5]
 
                     if jobs.exists():
                         job_lines = "\n".join([f"• {job.title} — {job.location}" for job in jobs])
@@ -227,18 +233,10 @@ Plain text only.
         # -------------------------------------------------
         if intent == "job_match" and profile:
             try:
-                jobs = visible_jobs_for_user(user)
-
                 if profile.skills:
-                    skills_list = [s.strip() for s in profile.skills.split(",") if s.strip()]
+                    jobs = recommended_jobs(user, limit=5)
 
-                    query = Q()
-                    for skill in skills_list:
-                        query |= Q(skills__icontains=skill) | Q(title__icontains=skill)
-
-                    jobs = jobs.filter(query).order_by("-created_at")[:5]
-
-                    if jobs.exists():
+                    if jobs:
                         job_lines = "\n".join([f"• {job.title} — {job.location}" for job in jobs])
                         ai_text += "\n\nRecommended jobs:\n" + job_lines
                     else:
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from accounts.services.retention import BATCH_SIZE, compact_notifications, retention_stats
+
+
+class Command(BaseCommand):
+    help = "Archive and delete read notifications past their retention (run daily)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Retention for every type (default: settings.NOTIFICATION_RETENTION_DAYS)"
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--file",
+            help="Append to this .jsonl.gz file instead of NotificationArchive rows"
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be compacted"
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            stats = retention_stats(options["days"])
+            policy = ", ".join(f"{k}={v}d" for k, v in stats["policy"].items())
+            self.stdout.write(f"Policy: {policy}")
+            self.stdout.write(
+                f"{stats['total']} read notifications to compact "
+                f"({stats['admin']} admin alerts)."
+            )
+            if stats["total"]:
+                self.stdout.write(f"Oldest {stats['oldest']:%Y-%m-%d}, newest {stats['newest']:%Y-%m-%d}.")
+                for type, n in sorted(stats["by_type"].items()):
+                    self.stdout.write(f"  {type:<8} {n}")
+            return
+
+        total = compact_notifications(
+            days=options["days"],
+            batch_size=max(options["batch_size"], 1),
+            path=options["file"],
+            pause=max(options["pause"], 0),
+            progress=lambda n: self.stdout.write(f"  {n} compacted"),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Compacted {total} notifications."))
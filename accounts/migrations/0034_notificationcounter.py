@@ -0,0 +1,48 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Notification = apps.get_model("accounts", "Notification")
+    NotificationCounter = apps.get_model("accounts", "NotificationCounter")
+
+    rows = (
+        Notification.objects.filter(is_read=False)
+        .values("user_id", "type")
+        .annotate(unread=Count("id"))
+        .order_by()
+    )
+    NotificationCounter.objects.bulk_create(
+        [
+            NotificationCounter(user_id=row["user_id"], type=row["type"], unread=row["unread"])
+            for row in rows
+        ],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0033_notification_notif_user_unread_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('GENERAL', 'General'), ('TRAINER', 'Trainer'), ('JOB', 'Job'), ('SYSTEM', 'System')], max_length=20)),
+                ('unread', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notification_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'type'), name='notifcounter_user_type_uniq'), models.UniqueConstraint(condition=models.Q(('user__isnull', True)), fields=('type',), name='notifcounter_admin_type_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,6 @@
+import json
+import zlib
+
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
 from django.conf import settings
@@ -265,7 +268,102 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # partial indexes on the unread rows only: Django renders
+        # is_read=False as NOT "is_read", which can match an index
+        # condition but not an index column
+        indexes = [
+            # candidate dashboard: my unread notifications, newest first
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=models.Q(is_read=False),
+                name="notif_user_unread_idx",
+            ),
+            # admin alerts (user IS NULL): unread counters by type
+            models.Index(
+                fields=["type", "-created_at"],
+                condition=models.Q(user__isnull=True, is_read=False),
+                name="notif_admin_unread_idx",
+            ),
+            # admin priority box
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(user__isnull=True, is_read=False, is_admin_alert=True),
+                name="notif_admin_priority_idx",
+            ),
+            # retention: oldest read rows first (accounts.services.retention)
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_read=True),
+                name="notif_read_created_idx",
+            ),
+        ]
+
     def __str__(self):
         if self.user:
             return f"{self.user.email} - {self.title}"
         return f"ADMIN ALERT - {self.title}"
+
+
+class NotificationArchive(models.Model):
+    """
+    One batch of old read notifications compacted by
+    accounts.services.retention: the rows as zlib-compressed JSON lines.
+    """
+
+    count = models.PositiveIntegerField()
+    first_id = models.BigIntegerField()
+    last_id = models.BigIntegerField()
+    oldest = models.DateTimeField()
+    newest = models.DateTimeField()
+    data = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def rows(self):
+        """ The archived notifications as dicts. """
+        for line in zlib.decompress(bytes(self.data)).splitlines():
+            yield json.loads(line)
+
+    def __str__(self):
+        return f"{self.count} notifications ({self.oldest:%d %b %Y} – {self.newest:%d %b %Y})"
+
+
+class NotificationCounter(models.Model):
+    """
+    Unread notifications per inbox and type, kept by
+    accounts.services.notifications in the same transaction as the
+    Notification rows. user=None is the admin inbox.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notification_counters",
+        null=True,
+        blank=True
+    )
+
+    type = models.CharField(max_length=20, choices=Notification.TYPE_CHOICES)
+    unread = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "type"],
+                name="notifcounter_user_type_uniq",
+            ),
+            # NULLs are distinct in a unique index, so the admin inbox
+            # needs its own
+            models.UniqueConstraint(
+                fields=["type"],
+                condition=models.Q(user__isnull=True),
+                name="notifcounter_admin_type_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        inbox = self.user.email if self.user else "ADMIN"
+        return f"{inbox} - {self.type}: {self.unread}"
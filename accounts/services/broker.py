@@ -0,0 +1,140 @@
+"""
+Pub/sub for live notifications (accounts.views.notification_poll).
+
+The notification service publishes after commit; each waiting
+long-poll request holds one subscription. The backend is picked by settings:
+
+    NOTIFICATION_BROKER = {
+        "BACKEND": "accounts.services.broker.RedisBroker",
+        "OPTIONS": {"url": "redis://localhost:6379/0"},
+    }
+
+InProcessBroker (the default) only reaches polls served by the same
+process — fine for runserver and tests; with several gunicorn workers
+use RedisBroker (needs the redis package).
+"""
+import json
+import queue
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+DEFAULT_BROKER = {"BACKEND": "accounts.services.broker.InProcessBroker"}
+
+QUEUE_SIZE = 100     # per subscription; a stuck stream drops, it doesn't grow
+
+
+class BrokerError(Exception):
+    pass
+
+
+# -------------------------------------------------
+# IN-PROCESS
+# -------------------------------------------------
+class InProcessBroker:
+
+    def __init__(self, **options):
+        self._lock = threading.Lock()
+        self._queues = {}       # channel → set of subscriber queues
+
+    def publish(self, channel, message):
+        with self._lock:
+            targets = list(self._queues.get(channel, ()))
+        for q in targets:
+            try:
+                q.put_nowait(message)
+            except queue.Full:
+                pass
+
+    def subscribe(self, channels):
+        return _InProcessSubscription(self, channels)
+
+    def _add(self, channels, q):
+        with self._lock:
+            for channel in channels:
+                self._queues.setdefault(channel, set()).add(q)
+
+    def _remove(self, channels, q):
+        with self._lock:
+            for channel in channels:
+                subscribers = self._queues.get(channel)
+                if subscribers:
+                    subscribers.discard(q)
+                    if not subscribers:
+                        del self._queues[channel]
+
+
+class _InProcessSubscription:
+
+    def __init__(self, broker, channels):
+        self.broker = broker
+        self.channels = list(channels)
+        self.queue = queue.Queue(QUEUE_SIZE)
+        broker._add(self.channels, self.queue)
+
+    def get(self, timeout):
+        """ Next message, or None after `timeout` seconds. """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.broker._remove(self.channels, self.queue)
+
+
+# -------------------------------------------------
+# REDIS
+# -------------------------------------------------
+class RedisBroker:
+
+    def __init__(self, url="redis://localhost:6379/0", **options):
+        try:
+            import redis
+        except ImportError:
+            raise BrokerError("RedisBroker needs the redis package (pip install redis).")
+        self.client = redis.Redis.from_url(url, **options)
+
+    def publish(self, channel, message):
+        self.client.publish(channel, json.dumps(message))
+
+    def subscribe(self, channels):
+        return _RedisSubscription(self.client, channels)
+
+
+class _RedisSubscription:
+
+    def __init__(self, client, channels):
+        self.pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self.pubsub.subscribe(*channels)
+
+    def get(self, timeout):
+        message = self.pubsub.get_message(timeout=timeout)
+        return None if message is None else json.loads(message["data"])
+
+    def close(self):
+        self.pubsub.close()
+
+
+# -------------------------------------------------
+# CONFIGURED BROKER
+# -------------------------------------------------
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = getattr(settings, "NOTIFICATION_BROKER", DEFAULT_BROKER)
+                _broker = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+    return _broker
+
+
+def user_channel(user_id):
+    """ user_id None = the admin inbox. """
+    return "notifications:admin" if user_id is None else f"notifications:user:{user_id}"
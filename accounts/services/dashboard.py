@@ -0,0 +1,95 @@
+"""
+Admin dashboard metrics.
+
+Every counter on the admin dashboard (accounts.views.admin_dashboard)
+and the admin home (core.views.admin_home) comes from one snapshot:
+one conditional-aggregate query per table (Count(filter=Q(...))),
+cached for METRICS_TIMEOUT seconds, so a dashboard view costs one
+cache read. Unread alert counts are not part of it — they are O(1)
+already (NotificationCounter) and update live (notification_poll).
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from accounts.models import User
+from core.models import Enrollment, Training, TrainingEnquiry
+from jobs.models import Job, JobApplication
+
+
+METRICS_TIMEOUT = 60
+METRICS_KEY = "admin_dashboard_metrics"
+
+ENQUIRY_SLA = timedelta(hours=24)
+
+
+def _enquiry_activity():
+    return TrainingEnquiry.objects.annotate(
+        last_message_at=Max("messages__created_at"),
+        last_reply_at=Max(
+            "messages__created_at",
+            filter=~Q(messages__sender=F("user"))
+        ),
+    )
+
+
+def _delayed(now=None):
+    # last message is the candidate's (no staff reply after it) and past the SLA
+    cutoff = (now or timezone.now()) - ENQUIRY_SLA
+    return (
+        Q(last_reply_at__isnull=True) | Q(last_reply_at__lt=F("last_message_at"))
+    ) & Q(last_message_at__lte=cutoff)
+
+
+def delayed_enquiries(now=None):
+    """
+    Enquiries waiting on a staff reply for longer than the SLA.
+    One GROUP BY, no per-row subquery.
+    """
+    return _enquiry_activity().filter(_delayed(now))
+
+
+def metric_queries(now=None):
+    """ (queryset, {name: aggregate}) — one query per table (check_query_plans EXPLAINs them). """
+    return [
+        (User.objects.filter(is_staff=False), {
+            "total_candidates": Count("id"),
+            "free_users": Count("id", filter=Q(plan=User.FREE)),
+            "paid_users": Count("id", filter=~Q(plan=User.FREE)),
+            "expired_users": Count("id", filter=Q(plan_status=User.EXPIRED)),
+        }),
+        (Job.objects.all(), {
+            "total_jobs": Count("id"),
+            "pending_jobs": Count("id", filter=Q(status="PENDING")),
+            "active_jobs": Count("id", filter=Q(status="PUBLISHED")),
+        }),
+        (JobApplication.objects.all(), {
+            "total_applications": Count("id"),
+            "pending_applications": Count("id", filter=Q(status="APPLIED")),
+            "interview_applications": Count("id", filter=Q(status="INTERVIEW")),
+        }),
+        (Training.objects.all(), {"total_trainings": Count("id")}),
+        (Enrollment.objects.all(), {"total_enrollments": Count("id")}),
+        (_enquiry_activity(), {
+            "total_enquiries": Count("id"),
+            "delayed_enquiries": Count("id", filter=_delayed(now)),
+        }),
+    ]
+
+
+def compute_metrics():
+    now = timezone.now()
+
+    metrics = {}
+    for queryset, aggregates in metric_queries(now):
+        metrics.update(queryset.aggregate(**aggregates))
+
+    metrics["computed_at"] = now
+    return metrics
+
+
+def admin_metrics():
+    """ Cached snapshot (dict) of the dashboard counters. """
+    return cache.get_or_set(METRICS_KEY, compute_metrics, METRICS_TIMEOUT)
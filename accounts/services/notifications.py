@@ -0,0 +1,294 @@
+"""
+Notifications: one API for every app.
+
+Rows are created with send() / notify() / notify_admins(), which
+bulk-insert them and bump the unread counters (NotificationCounter, one
+row per inbox and type) in the same transaction. mark_read() and
+delete_notifications() take the counters back down the same way, so a
+badge is a read of a few counter rows instead of a COUNT over the
+notifications table. user=None is the admin inbox.
+
+After commit, new rows and the fresh counts are published to the
+broker (accounts.services.broker); poll() waits on a subscription for
+accounts.views.notification_poll — a short long-poll the dashboards
+repeat, so a request holds a sync worker for POLL_SECONDS at most.
+
+Usage:
+    notify(admins, "Priority Consultation Request", message)
+    notify_admins("Mock Interview Request", message, type=Notification.TRAINER, priority=True)
+    unread_count(request.user)
+"""
+import logging
+from collections import Counter, defaultdict
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Q, Sum, Value
+from django.db.models.functions import Greatest
+
+from accounts.models import Notification, NotificationCounter
+from accounts.services.broker import get_broker, user_channel
+
+logger = logging.getLogger(__name__)
+
+
+BATCH_SIZE = 500
+
+POLL_SECONDS = 20           # under gunicorn's 30s worker timeout
+CATCH_UP = 20               # rows replayed to a poll that missed them
+
+
+def _chunks(items, size=BATCH_SIZE):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# -------------------------------------------------
+# COUNTERS
+# -------------------------------------------------
+def _inbox(user_ids):
+    match = Q(user_id__in=[u for u in user_ids if u is not None])
+    if None in user_ids:
+        match |= Q(user__isnull=True)
+    return match
+
+
+def _adjust(deltas):
+    """ deltas: {(user_id, type): +n / -n}. Call inside a transaction. """
+    deltas = {key: n for key, n in deltas.items() if n}
+    if not deltas:
+        return
+
+    # every counter row exists first (no-op for the ones that do)
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id, type=type) for user_id, type in deltas],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True
+    )
+
+    # one UPDATE per (type, delta): a fan-out of +1 to N users is one statement
+    groups = defaultdict(list)
+    for (user_id, type), n in deltas.items():
+        groups[type, n].append(user_id)
+
+    for (type, n), user_ids in groups.items():
+        unread = F("unread") + n if n > 0 else Greatest(F("unread") + n, Value(0))
+        for chunk in _chunks(user_ids):
+            NotificationCounter.objects.filter(_inbox(chunk), type=type).update(unread=unread)
+
+
+def recount(user_ids):
+    """ Rebuild the counters of these inboxes (None = admin) from the rows. """
+    user_ids = set(user_ids)
+    with transaction.atomic():
+        transaction.on_commit(partial(publish, user_ids=user_ids))
+        NotificationCounter.objects.filter(_inbox(user_ids)).delete()
+        NotificationCounter.objects.bulk_create(
+            [
+                NotificationCounter(user_id=row["user"], type=row["type"], unread=row["n"])
+                for row in Notification.objects.filter(_inbox(user_ids), is_read=False)
+                .values("user", "type").annotate(n=Count("id")).order_by()
+            ],
+            batch_size=BATCH_SIZE
+        )
+
+
+# -------------------------------------------------
+# SEND
+# -------------------------------------------------
+def send(notifications):
+    """ Bulk-insert unsaved Notification objects and bump their counters. """
+    notifications = list(notifications)
+    if not notifications:
+        return []
+
+    with transaction.atomic():
+        Notification.objects.bulk_create(notifications, batch_size=BATCH_SIZE)
+        _adjust(Counter((n.user_id, n.type) for n in notifications if not n.is_read))
+        transaction.on_commit(partial(publish, notifications))
+
+    return notifications
+
+
+def notify(users, title, message, type=Notification.GENERAL):
+    """ The same notification to each of `users` (users or ids). """
+    user_ids = dict.fromkeys(getattr(user, "pk", user) for user in users)
+    return send(
+        Notification(user_id=user_id, title=title, message=message, type=type)
+        for user_id in user_ids
+    )
+
+
+def notify_admins(title, message="", type=Notification.GENERAL, priority=False):
+    """ Admin inbox row; priority alerts also show in the dashboard red box. """
+    return send([
+        Notification(user=None, title=title, message=message, type=type, is_admin_alert=priority)
+    ])[0]
+
+
+# -------------------------------------------------
+# READ / DELETE
+# -------------------------------------------------
+def mark_read(notifications):
+    """ Mark a Notification queryset read. Returns how many were unread. """
+    with transaction.atomic():
+        # locked, so two requests can't both take the same row off the counter
+        rows = list(
+            Notification.objects
+            .filter(id__in=notifications.values("id"), is_read=False)
+            .select_for_update()
+            .values_list("id", "user_id", "type")
+        )
+        for chunk in _chunks(rows):
+            Notification.objects.filter(id__in=[row[0] for row in chunk]).update(is_read=True)
+
+        _adjust({key: -n for key, n in Counter(row[1:] for row in rows).items()})
+        transaction.on_commit(partial(publish, user_ids={row[1] for row in rows}))
+
+    return len(rows)
+
+
+def delete_notifications(notifications):
+    """ Delete a Notification queryset, unread ones off the counters. Returns the count. """
+    with transaction.atomic():
+        rows = list(
+            Notification.objects
+            .filter(id__in=notifications.values("id"))
+            .select_for_update()
+            .values_list("id", "user_id", "type", "is_read")
+        )
+        for chunk in _chunks(rows):
+            Notification.objects.filter(id__in=[row[0] for row in chunk]).delete()
+
+        _adjust({
+            key: -n
+            for key, n in Counter(row[1:3] for row in rows if not row[3]).items()
+        })
+        transaction.on_commit(partial(publish, user_ids={row[1] for row in rows}))
+
+    return len(rows)
+
+
+def unread_count(user):
+    """ Badge count for a user's inbox. """
+    return NotificationCounter.objects.filter(user=user).aggregate(n=Sum("unread"))["n"] or 0
+
+
+def unread_counts(user_ids):
+    """ {user_id: {type: unread, "total": n}} for many inboxes, one query. """
+    counts = {
+        user_id: dict.fromkeys((type for type, _ in Notification.TYPE_CHOICES), 0)
+        for user_id in user_ids
+    }
+    for user_id, type, unread in NotificationCounter.objects.filter(
+        _inbox(user_ids)
+    ).values_list("user_id", "type", "unread"):
+        counts[user_id][type] = unread
+
+    for inbox in counts.values():
+        inbox["total"] = sum(inbox.values())
+    return counts
+
+
+def admin_unread_counts():
+    """ {type: unread} for the admin inbox, plus "total". """
+    return unread_counts([None])[None]
+
+
+# -------------------------------------------------
+# LIVE UPDATES (long-poll)
+# -------------------------------------------------
+def _payload(notification):
+    return {
+        "id": notification.id,
+        "title": notification.title,
+        "message": notification.message,
+        "type": notification.type,
+        "priority": notification.is_admin_alert,
+        "created_at": notification.created_at.isoformat(),
+    }
+
+
+def _message(user_id, notifications, unread):
+    return {
+        "inbox": "user" if user_id else "admin",
+        "notifications": [_payload(n) for n in notifications],
+        "unread": unread,
+    }
+
+
+def publish(notifications=(), user_ids=()):
+    """ Push new rows and fresh unread counts to open streams. Runs after commit. """
+    by_inbox = defaultdict(list)
+    for notification in notifications:
+        by_inbox[notification.user_id].append(notification)
+
+    inboxes = set(by_inbox) | set(user_ids)
+    if not inboxes:
+        return
+
+    counts = unread_counts(inboxes)
+    broker = get_broker()
+    try:
+        for user_id in inboxes:
+            broker.publish(
+                user_channel(user_id),
+                _message(user_id, by_inbox.get(user_id, ()), counts[user_id])
+            )
+    except Exception as e:
+        # the rows are committed; a live update is best effort
+        logger.error(f"NOTIFICATION PUBLISH FAILED: {e}")
+
+
+def _last_id(messages, since):
+    ids = [n["id"] for message in messages for n in message["notifications"]]
+    return max(ids + [since or 0])
+
+
+def poll(user, since=None, seconds=POLL_SECONDS):
+    """
+    One long-poll: (messages, last notification id).
+
+    With no `since` (page load) it answers at once with the counts.
+    Rows newer than `since` that the client missed between polls are
+    returned at once too; otherwise it waits up to `seconds` for the
+    next publish and returns [] on timeout. The client polls again with
+    the returned id.
+    """
+    inboxes = [user.id] + ([None] if user.is_superuser else [])
+
+    if since is None:
+        latest = Notification.objects.filter(_inbox(inboxes)).aggregate(n=Max("id"))["n"]
+        counts = unread_counts(inboxes)
+        return [_message(i, (), counts[i]) for i in inboxes], latest or 0
+
+    # subscribe first, so nothing published while we read is lost
+    subscription = get_broker().subscribe([user_channel(i) for i in inboxes])
+    try:
+        missed = defaultdict(list)
+        for notification in Notification.objects.filter(
+            _inbox(inboxes), id__gt=since, is_read=False
+        ).order_by("id")[:CATCH_UP]:
+            missed[notification.user_id].append(notification)
+
+        if missed:
+            counts = unread_counts(inboxes)
+            messages = [_message(i, missed[i], counts[i]) for i in inboxes if i in missed]
+            return messages, _last_id(messages, since)
+
+        # nothing more to read; don't hold a DB connection while waiting
+        if not connection.in_atomic_block:
+            connection.close()
+
+        message = subscription.get(timeout=seconds)
+        if message is None:
+            return [], since
+
+        # take whatever else is already queued (e.g. the admin inbox too)
+        messages = [message]
+        while (message := subscription.get(timeout=0)) is not None:
+            messages.append(message)
+        return messages, _last_id(messages, since)
+    finally:
+        subscription.close()
@@ -0,0 +1,138 @@
+"""
+Notification retention.
+
+Read notifications older than the policy (settings.NOTIFICATION_RETENTION_DAYS,
+days per type) are compacted: each batch is written as compressed JSON
+lines — a NotificationArchive row, or appended to a .jsonl.gz file — and
+deleted in the same short transaction, oldest first through
+notif_read_created_idx (manage.py compact_notifications, run daily).
+
+Small batches and an optional pause between them keep each write lock
+brief, so requests keep writing notifications while it runs. Only read
+rows are touched, so the unread counters never change.
+"""
+import gzip
+import json
+import time
+import zlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+
+from accounts.models import Notification, NotificationArchive
+
+
+BATCH_SIZE = 1000
+
+DEFAULT_POLICY = {"default": 90}
+
+ARCHIVE_FIELDS = (
+    "id", "user_id", "title", "message", "type",
+    "is_admin_alert", "created_at",
+)
+
+
+# -------------------------------------------------
+# POLICY
+# -------------------------------------------------
+def retention_policy(days=None):
+    """ {type or "default": days}; `days` overrides every type. """
+    if days is not None:
+        return {"default": days}
+
+    policy = getattr(settings, "NOTIFICATION_RETENTION_DAYS", DEFAULT_POLICY)
+    if isinstance(policy, int):
+        return {"default": policy}
+    return {"default": DEFAULT_POLICY["default"], **policy}
+
+
+def expired_notifications(days=None, now=None):
+    """ Read notifications past their type's retention. """
+    now = now or timezone.now()
+    policy = retention_policy(days)
+
+    typed = {type: n for type, n in policy.items() if type != "default"}
+    match = Q(~Q(type__in=list(typed)), created_at__lt=now - timedelta(days=policy["default"]))
+    for type, n in typed.items():
+        match |= Q(type=type, created_at__lt=now - timedelta(days=n))
+
+    return Notification.objects.filter(match, is_read=True)
+
+
+def retention_stats(days=None, now=None):
+    """ What a compaction run would remove (dry run). """
+    expired = expired_notifications(days, now)
+
+    stats = expired.aggregate(
+        total=Count("id"),
+        admin=Count("id", filter=Q(user__isnull=True)),
+        oldest=Min("created_at"),
+        newest=Max("created_at"),
+    )
+    stats["by_type"] = dict(
+        expired.values_list("type").annotate(n=Count("id")).order_by()
+    )
+    stats["policy"] = retention_policy(days)
+    return stats
+
+
+# -------------------------------------------------
+# COMPACTION
+# -------------------------------------------------
+def _lines(rows):
+    return b"".join(
+        json.dumps(row, cls=DjangoJSONEncoder).encode() + b"\n" for row in rows
+    )
+
+
+def _archive_rows(rows, data, path=None):
+    if path:
+        # one gzip member per batch; `zcat` / gzip.open read them as one file
+        with gzip.open(path, "ab") as f:
+            f.write(data)
+        return
+
+    NotificationArchive.objects.create(
+        count=len(rows),
+        first_id=min(row["id"] for row in rows),
+        last_id=max(row["id"] for row in rows),
+        oldest=rows[0]["created_at"],
+        newest=rows[-1]["created_at"],
+        data=zlib.compress(data, 9),
+    )
+
+
+def compact_notifications(days=None, batch_size=BATCH_SIZE, path=None, pause=0, progress=None):
+    """
+    Archive and delete expired read notifications, batch by batch.
+    `path` writes a .jsonl.gz file instead of NotificationArchive rows;
+    `progress(total)` is called after every batch. Returns the number deleted.
+    """
+    now = timezone.now()
+    total = 0
+
+    while True:
+        rows = list(
+            expired_notifications(days, now)
+            .order_by("created_at", "id")
+            .values(*ARCHIVE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            break
+
+        # archive first: a failed write leaves the batch in place
+        with transaction.atomic():
+            _archive_rows(rows, _lines(rows), path)
+            Notification.objects.filter(id__in=[row["id"] for row in rows], is_read=True).delete()
+
+        total += len(rows)
+        if progress:
+            progress(total)
+        if pause:
+            time.sleep(pause)       # let request writers take the lock
+
+    return total
@@ -1,3 +1,367 @@
+import json
+import threading
+import time
+import zlib
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.ai_helper import extract_location_from_db
+from accounts.models import Notification, NotificationArchive, NotificationCounter, User
+from accounts.services import dashboard, notifications, retention
+from accounts.services.broker import get_broker, user_channel
+from core.models import (
+    EnquiryMessage, Enrollment, ModuleProgress, Training, TrainingEnquiry, TrainingModule,
+)
+from jobs.models import Job, JobApplication
+
+
+class CandidateDashboardTests(TestCase):
+    """ accounts.views.dashboard: fixed query count, whatever the enrollments. """
+
+    # session + user (2), the dashboard (10, profile included),
+    # session save from SESSION_SAVE_EVERY_REQUEST (3)
+    DASHBOARD_QUERIES = 15
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="candidate@example.com", password="pass12345")
+        staff = User.objects.create_user(email="staff@example.com", password="pass12345", is_staff=True)
+
+        jobs = [
+            Job.objects.create(
+                title=f"Python Developer {i}", company_name="Acme", location="Chennai",
+                experience_min=0, experience_max=2, job_type="FT", description="Django",
+                skills="python", deadline=timezone.localdate() + timedelta(days=30),
+                created_by=staff, status="PUBLISHED",
+            )
+            for i in range(3)
+        ]
+        JobApplication.objects.create(user=cls.user, job=jobs[0], status="INTERVIEW")
+        JobApplication.objects.create(user=cls.user, job=jobs[1], status="IN_REVIEW")
+        JobApplication.objects.create(user=cls.user, job=jobs[2], status="APPLIED")
+
+        cls.enroll(cls.user, "Django Bootcamp", completed=1)
+
+    @staticmethod
+    def enroll(user, title, modules=3, completed=0):
+        training = Training.objects.create(
+            title=title, description="-", duration="4 weeks", fee=0
+        )
+        for order in range(modules):
+            TrainingModule.objects.create(training=training, title=f"Module {order}", order=order)
+
+        # the Enrollment signal creates one ModuleProgress per module
+        enrollment = Enrollment.objects.create(user=user, training=training)
+        ModuleProgress.objects.filter(
+            enrollment=enrollment, module__order__lt=completed
+        ).update(is_completed=True)
+        return enrollment
+
+    def get_dashboard(self):
+        self.client.force_login(self.user)
+        with self.assertNumQueries(self.DASHBOARD_QUERIES):
+            response = self.client.get(reverse("dashboard"))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_query_count(self):
+        response = self.get_dashboard()
+
+        [enrollment] = response.context["enrollments"]
+        self.assertEqual(enrollment.progress_percent, 33)
+        self.assertEqual([p.module.title for p in enrollment.completed_modules], ["Module 0"])
+        self.assertEqual(
+            [p.module.title for p in enrollment.pending_modules], ["Module 1", "Module 2"]
+        )
+
+        self.assertEqual(response.context["applications_count"], 3)
+        self.assertEqual(response.context["interviews_count"], 1)
+        self.assertEqual(sum(response.context["chart_data"]), 2)
+        self.assertEqual(len(response.context["chart_labels"]), 4)
+
+    def test_query_count_does_not_grow_with_enrollments(self):
+        self.enroll(self.user, "React Basics", modules=4, completed=4)
+        self.enroll(self.user, "SQL Essentials", modules=2)
+
+        response = self.get_dashboard()
+
+        self.assertEqual(
+            [e.progress_percent for e in response.context["enrollments"]], [33, 100, 0]
+        )
+
+
+# -------------------------------------------------
+# ADMIN DASHBOARD METRICS
+# -------------------------------------------------
+class AdminMetricsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        cls.staff = User.objects.create_user(email="staff@example.com", password="pass12345", is_staff=True)
+
+        cls.candidates = []
+        plans = [
+            (User.FREE, User.ACTIVE), (User.FREE, User.ACTIVE),
+            (User.PRO, User.ACTIVE), (User.PRO, User.EXPIRED),
+        ]
+        for i, (plan, plan_status) in enumerate(plans):
+            user = User.objects.create_user(email=f"candidate{i}@example.com", password="pass12345")
+            User.objects.filter(pk=user.pk).update(plan=plan, plan_status=plan_status)
+            cls.candidates.append(user)
+
+        jobs = [
+            Job.objects.create(
+                title=f"Python Developer {i}", company_name="Acme", location="Chennai",
+                experience_min=0, experience_max=2, job_type="FT", description=f"Django {i}",
+                skills="python", deadline=timezone.localdate() + timedelta(days=30),
+                created_by=cls.staff, status=status,
+            )
+            for i, status in enumerate(("PENDING", "PUBLISHED", "PUBLISHED", "REJECTED"))
+        ]
+        for user, status in zip(cls.candidates, ("APPLIED", "APPLIED", "INTERVIEW")):
+            JobApplication.objects.create(user=user, job=jobs[1], status=status)
+
+        cls.training, _ = [
+            Training.objects.create(title=title, description="-", duration="4 weeks", fee=0)
+            for title in ("Django Bootcamp", "React Bootcamp")
+        ]
+        Enrollment.objects.create(user=cls.candidates[0], training=cls.training)
+
+    def setUp(self):
+        cache.clear()
+
+    def enquiry(self, *messages):
+        """ messages: (sender, hours ago) """
+        enquiry = TrainingEnquiry.objects.create(user=self.candidates[0], training=self.training)
+        for sender, hours in messages:
+            message = EnquiryMessage.objects.create(enquiry=enquiry, sender=sender, message="-")
+            EnquiryMessage.objects.filter(pk=message.pk).update(created_at=self.now - timedelta(hours=hours))
+        return enquiry
+
+    def test_sla_boundary(self):
+        candidate = self.candidates[0]
+        sla = dashboard.ENQUIRY_SLA.total_seconds() / 3600
+
+        at_sla = self.enquiry((candidate, sla))
+        self.enquiry((candidate, sla - 0.01))                           # not yet
+        self.enquiry((candidate, sla + 5), (self.staff, sla + 1))       # answered
+        followed_up = self.enquiry((self.staff, sla + 5), (candidate, sla + 1))
+        self.enquiry()                                                  # no messages
+
+        delayed = dashboard.delayed_enquiries(now=self.now)
+
+        self.assertEqual(sorted(e.id for e in delayed), [at_sla.id, followed_up.id])
+
+    def test_metrics_match_the_fixture(self):
+        self.enquiry((self.candidates[0], 30))
+        self.enquiry((self.candidates[0], 1))
+
+        with self.assertNumQueries(len(dashboard.metric_queries())):
+            metrics = dashboard.compute_metrics()
+
+        metrics.pop("computed_at")
+        self.assertEqual(metrics, {
+            "total_candidates": 4, "free_users": 2, "paid_users": 2, "expired_users": 1,
+            "total_jobs": 4, "pending_jobs": 1, "active_jobs": 2,
+            "total_applications": 3, "pending_applications": 2, "interview_applications": 1,
+            "total_trainings": 2, "total_enrollments": 1,
+            "total_enquiries": 2, "delayed_enquiries": 1,
+        })
+
+    def test_one_query_per_table_then_cached(self):
+        self.assertEqual(len(dashboard.metric_queries()), 6)
+
+        with self.assertNumQueries(6):
+            dashboard.admin_metrics()
+        with self.assertNumQueries(0):
+            cached = dashboard.admin_metrics()
+
+        self.assertEqual(cached["total_jobs"], 4)
+
+
+# -------------------------------------------------
+# NOTIFICATION COUNTERS
+# -------------------------------------------------
+class NotificationCounterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user(email="alice@example.com", password="pass12345")
+        cls.bob = User.objects.create_user(email="bob@example.com", password="pass12345")
+
+    def counters(self):
+        return dict(
+            ((row.user_id, row.type), row.unread)
+            for row in NotificationCounter.objects.exclude(unread=0)
+        )
+
+    def test_fan_out_bumps_every_inbox(self):
+        notifications.notify([self.alice, self.bob, self.alice.id], "Hello", "Welcome aboard")
+        notifications.notify([self.alice], "New job", "Python Developer", type=Notification.JOB)
+        notifications.notify_admins("New Job Application", "alice applied", type=Notification.JOB)
+
+        self.assertEqual(Notification.objects.filter(title="Hello").count(), 2)
+        self.assertEqual(notifications.unread_count(self.alice), 2)
+        self.assertEqual(notifications.unread_count(self.bob), 1)
+        self.assertEqual(notifications.admin_unread_counts()["JOB"], 1)
+        self.assertEqual(notifications.admin_unread_counts()["total"], 1)
+
+    def test_read_and_delete_take_the_counters_down(self):
+        notifications.notify([self.alice], "One", "-")
+        notifications.notify([self.alice], "Two", "-", type=Notification.JOB)
+        notifications.notify([self.alice], "Three", "-", type=Notification.JOB)
+
+        inbox = Notification.objects.filter(user=self.alice)
+        self.assertEqual(notifications.mark_read(inbox.filter(title="Two")), 1)
+        self.assertEqual(notifications.mark_read(inbox.filter(title="Two")), 0)     # already read
+        self.assertEqual(notifications.unread_count(self.alice), 2)
+
+        # a read row leaves the counters alone, an unread one comes off them
+        self.assertEqual(notifications.delete_notifications(inbox.filter(title__in=["One", "Two"])), 2)
+        self.assertEqual(self.counters(), {(self.alice.id, "JOB"): 1})
+
+    def test_recount_repairs_drift(self):
+        notifications.notify([self.alice, self.bob], "Hello", "-")
+        NotificationCounter.objects.filter(user=self.alice).update(unread=9)
+        Notification.objects.filter(user=self.bob).update(is_read=True)
+
+        notifications.recount([self.alice.id, self.bob.id])
+
+        self.assertEqual(self.counters(), {(self.alice.id, "GENERAL"): 1})
+
+    def test_new_rows_are_published_after_commit(self):
+        subscription = get_broker().subscribe([user_channel(self.alice.id), user_channel(None)])
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                notifications.notify([self.alice], "Hello", "Welcome aboard")
+            message = subscription.get(timeout=1)
+        finally:
+            subscription.close()
+
+        self.assertEqual(message["inbox"], "user")
+        self.assertEqual([n["title"] for n in message["notifications"]], ["Hello"])
+        self.assertEqual(message["unread"]["total"], 1)
+
+    def test_first_poll_answers_with_the_counts(self):
+        [notification] = notifications.notify([self.alice], "Hello", "-")
+        self.client.force_login(self.alice)
+
+        data = self.client.get(reverse("notification_poll")).json()
+
+        self.assertEqual(data["since"], notification.id)
+        [message] = data["messages"]
+        self.assertEqual((message["notifications"], message["unread"]["total"]), ([], 1))
+
+    def test_poll_returns_rows_missed_between_polls_at_once(self):
+        [first] = notifications.notify([self.alice], "One", "-")
+        [second] = notifications.notify([self.alice], "Two", "-")
+
+        started = time.monotonic()
+        messages, since = notifications.poll(self.alice, since=first.id, seconds=5)
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(since, second.id)
+        self.assertEqual([n["title"] for n in messages[0]["notifications"]], ["Two"])
+
+    def test_poll_waits_for_the_next_publish_then_times_out(self):
+        [notification] = notifications.notify([self.alice], "One", "-")
+        message = {"inbox": "user", "notifications": [{"id": notification.id + 1}], "unread": {}}
+        timer = threading.Timer(
+            0.1, get_broker().publish, [user_channel(self.alice.id), message]
+        )
+        timer.start()
+
+        self.assertEqual(
+            notifications.poll(self.alice, since=notification.id, seconds=5),
+            ([message], notification.id + 1)
+        )
+        timer.join()
+
+        self.assertEqual(
+            notifications.poll(self.alice, since=notification.id, seconds=0.1),
+            ([], notification.id)
+        )
+
+
+# -------------------------------------------------
+# NOTIFICATION RETENTION
+# -------------------------------------------------
+class NotificationRetentionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="candidate@example.com", password="pass12345")
+
+    def add(self, title, days_old, type=Notification.GENERAL, is_read=True):
+        [notification] = notifications.send([
+            Notification(user=self.user, title=title, message="-", type=type, is_read=is_read)
+        ])
+        Notification.objects.filter(pk=notification.pk).update(
+            created_at=timezone.now() - timedelta(days=days_old)
+        )
+        return notification
+
+    def test_only_old_read_rows_go(self):
+        # policy: 90 days by default, 30 for job alerts
+        self.add("old read", 120)
+        self.add("old unread", 120, is_read=False)
+        self.add("recent read", 10)
+        self.add("old job alert", 45, type=Notification.JOB)
+        self.add("recent job alert", 20, type=Notification.JOB)
+        counters = list(NotificationCounter.objects.values_list("type", "unread"))
+
+        self.assertEqual(retention.retention_stats()["total"], 2)
+        self.assertEqual(retention.compact_notifications(batch_size=1), 2)
+
+        self.assertEqual(
+            set(Notification.objects.values_list("title", flat=True)),
+            {"old unread", "recent read", "recent job alert"}
+        )
+        self.assertEqual(list(NotificationCounter.objects.values_list("type", "unread")), counters)
+
+    def test_archived_batches_decompress_to_the_rows(self):
+        first = self.add("old read", 120)
+        second = self.add("older read", 150)
+
+        retention.compact_notifications()
+
+        [archive] = NotificationArchive.objects.all()
+        rows = [json.loads(line) for line in zlib.decompress(archive.data).splitlines()]
+        self.assertEqual([row["title"] for row in rows], ["older read", "old read"])
+        self.assertEqual((archive.count, archive.first_id, archive.last_id), (2, first.id, second.id))
+
+    def test_days_overrides_the_policy(self):
+        self.add("recent read", 10)
+        self.add("old job alert", 45, type=Notification.JOB)
+
+        self.assertEqual(retention.compact_notifications(days=60), 0)
+        self.assertEqual(retention.compact_notifications(days=5), 2)
+
+
+# -------------------------------------------------
+# CHATBOT LOCATIONS
+# -------------------------------------------------
+class ChatbotLocationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        staff = User.objects.create_user(email="staff@example.com", password="pass12345", is_staff=True)
+        for location, status in (("Hosur", "PUBLISHED"), ("Salem", "PENDING")):
+            Job.objects.create(
+                title="Python Developer", company_name="Acme", location=location,
+                experience_min=0, experience_max=2, job_type="FT", description="Django",
+                skills="python", deadline=timezone.localdate() + timedelta(days=30),
+                created_by=staff, status=status,
+            )
+
+    def test_gazetteer_aliases_first(self):
+        self.assertEqual(extract_location_from_db("any jobs in bombay?"), "Mumbai")
 
-# Create your tests here.
+    def test_unlisted_town_with_published_jobs(self):
+        self.assertEqual(extract_location_from_db("any jobs in hosur?"), "Hosur")
+        self.assertIsNone(extract_location_from_db("any jobs in salem?"))
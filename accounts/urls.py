@@ -39,6 +39,7 @@ urlpatterns = [
     
     path("invoice/<int:payment_id>/", views.download_invoice, name="download_invoice"),
     path("admin-alerts/", views.admin_alerts, name="admin_alerts"),
+    path("notifications/poll/", views.notification_poll, name="notification_poll"),
 
 
     
@@ -1,25 +1,11 @@
-from accounts.models import Notification
-
-from django.contrib.auth import get_user_model
-
-User = get_user_model()
+from accounts.services.notifications import notify, notify_admins
 
 
 # ---------------- USER NOTIFICATION ----------------
 def notify_user(user, title, message):
-    Notification.objects.create(
-        user=user,
-        title=title,
-        message=message,
-        is_admin_alert=False
-    )
+    notify([user], title, message)
 
 
 # ---------------- ADMIN ALERT ----------------
-def admin_alert(title, message):
-    Notification.objects.create(
-        user=None,
-        title=title,
-        message=message,
-        is_admin_alert=True
-    )
+def admin_alert(title, message=""):
+    notify_admins(title, message, priority=True)
@@ -10,8 +10,10 @@ from datetime import timedelta
 from jobs.models import JobApplication
 from django.shortcuts import get_object_or_404
 from accounts.models import Notification
+from accounts.services.notifications import admin_unread_counts, mark_read, notify
 from core.models import Payment
 from accounts.utils.email import safe_send_mail
+from core.utils.pagination import paginate_keyset
 
 
 
@@ -458,6 +460,8 @@ def candidate_list(request):
             job_applications__status="INTERVIEW"
         ).distinct()
 
+    candidates = paginate_keyset(request, candidates, per_page=25, field="date_joined")
+
     return render(request, "accounts/candidate.html", {"candidates": candidates})
 
 #canditate and  admin dashboard
@@ -470,58 +474,22 @@ from core.models import Enrollment   # adjust import if Enrollment is in another
 
 
 #admin dashboard
-from jobs.models import Job, JobApplication
-from core.models import Training, Enrollment, TrainingEnquiry
+from jobs.models import JobApplication
+from core.models import Enrollment
 from accounts.models import Notification
 
 
-from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 from datetime import timedelta
 from accounts.models import Notification
+from accounts.services.dashboard import admin_metrics, delayed_enquiries
 
 @admin_required
 def admin_dashboard(request):
 
-    # ---------------- USERS ----------------
-    candidate_users = User.objects.filter(is_staff=False)
-
-    total_candidates = candidate_users.count()
-    free_users = candidate_users.filter(plan=User.FREE).count()
-    paid_users = candidate_users.exclude(plan=User.FREE).count()
-    expired_users = candidate_users.filter(plan_status=User.EXPIRED).count()
-
-    # ---------------- JOBS ----------------
-    total_jobs = Job.objects.count()
-    pending_jobs = Job.objects.filter(status="PENDING").count()
-    active_jobs = Job.objects.filter(status="PUBLISHED").count()
-
-    # ---------------- APPLICATIONS ----------------
-    total_applications = JobApplication.objects.count()
-    pending_applications = JobApplication.objects.filter(status="APPLIED").count()
-    interview_applications = JobApplication.objects.filter(status="INTERVIEW").count()
-
-    # ---------------- TRAINING ----------------
-    total_trainings = Training.objects.count()
-    total_enrollments = Enrollment.objects.count()
-    total_enquiries = TrainingEnquiry.objects.count()
-
-    # ---------------- SLA MONITORING ----------------
-    one_day_ago = timezone.now() - timedelta(hours=24)
-
-    last_message = EnquiryMessage.objects.filter(
-        enquiry=OuterRef("pk")
-    ).order_by("-created_at")
-
-    delayed_enquiries = TrainingEnquiry.objects.annotate(
-        last_sender=Subquery(last_message.values("sender")[:1]),
-        last_message_time=Subquery(last_message.values("created_at")[:1])
-    ).filter(
-        last_sender__isnull=False,
-        last_message_time__lte=one_day_ago
-    ).exclude(
-        last_sender=request.user
-    ).count()
+    # ---------------- USERS / JOBS / APPLICATIONS / TRAINING / SLA ----------------
+    # one aggregate per table, cached snapshot shared with core.views.admin_home
+    metrics = admin_metrics()
 
     # ---------------- ALERT SYSTEM ----------------
 
@@ -539,38 +507,18 @@ def admin_dashboard(request):
         is_read=False
     ).order_by("-created_at")[:5]
 
-    new_app_count = recent_notifications.count()
+    # 📊 Counters (NotificationCounter, one query)
+    alert_counts = admin_unread_counts()
 
-    # 📊 Counters
-    unread_notifications = admin_alerts.filter(is_read=False).count()
-
-    trainer_alerts = admin_alerts.filter(
-        type=Notification.TRAINER,
-        is_read=False
-    ).count()
+    new_app_count = alert_counts[Notification.JOB]
+    unread_notifications = alert_counts["total"]
+    trainer_alerts = alert_counts[Notification.TRAINER]
 
 
     return render(request, "accounts/admin_dashboard.html", {
 
-        # stats
-        "total_candidates": total_candidates,
-        "free_users": free_users,
-        "paid_users": paid_users,
-        "expired_users": expired_users,
-
-        "total_jobs": total_jobs,
-        "pending_jobs": pending_jobs,
-        "active_jobs": active_jobs,
-
-        "total_applications": total_applications,
-        "pending_applications": pending_applications,
-        "interview_applications": interview_applications,
-
-        "total_trainings": total_trainings,
-        "total_enrollments": total_enrollments,
-        "total_enquiries": total_enquiries,
-
-        "delayed_enquiries": delayed_enquiries,
+        # stats (total_candidates ... delayed_enquiries, computed_at)
+        **metrics,
 
         # alerts
         "notifications": notifications,
@@ -594,7 +542,7 @@ def admin_dashboard(request):
 def candidate_detail(request, user_id):
     candidate = get_object_or_404(User, id=user_id, is_staff=False)
 
-    applications = JobApplication.objects.filter(user=candidate)
+    applications = JobApplication.objects.filter(user=candidate).select_related("job")
 
     enrollments = Enrollment.objects.filter(user=candidate).select_related("training")
 
@@ -694,10 +642,10 @@ def update_application_status(request, app_id):
     application.save()
     
     
-    Notification.objects.create(
-        user=application.user,
-        title="Application Status Updated",
-        message=f"Your application for {application.job.title} is now {new_status}."
+    notify(
+        [application.user],
+        "Application Status Updated",
+        f"Your application for {application.job.title} is now {new_status}."
     )
 
 
@@ -746,12 +694,18 @@ def update_application_status(request, app_id):
 
 from django.contrib.auth.decorators import login_required
 from core.models import Enrollment
-from jobs.models import JobApplication, Job
+from jobs.models import JobApplication
 from jobs.models import SavedJob, JobApplication
 from core.models import Enrollment
 from collections import OrderedDict
 from consultation.models import ConsultantSession
 from core.models import ModuleProgress
+from jobs.services.quota import quota_status
+from django.db.models import DateField, Prefetch, Q
+from datetime import datetime, time
+
+RESPONSE_STATUSES = ["IN_REVIEW", "INTERVIEW", "CLOSED"]
+
 @login_required
 def dashboard(request):
 
@@ -765,27 +719,30 @@ def dashboard(request):
     profile = getattr(user, "profile", None)
 
     # ---------------- DATA ----------------
-    enrollments = Enrollment.objects.filter(user=user).select_related("training")
-    
-    for e in enrollments:
-
-        progress_qs = ModuleProgress.objects.filter(
-            enrollment=e
-        ).select_related("module").order_by("module__order")
-
-        total = progress_qs.count()
-        completed_qs = progress_qs.filter(is_completed=True)
-        pending_qs = progress_qs.filter(is_completed=False)
+    # progress counts in the enrollment query, module rows in one prefetch
+    enrollments = list(
+        Enrollment.objects.filter(user=user)
+        .select_related("training")
+        .annotate(
+            total_modules=Count("module_progress"),
+            completed_count=Count("module_progress", filter=Q(module_progress__is_completed=True)),
+        )
+        .prefetch_related(Prefetch(
+            "module_progress",
+            queryset=ModuleProgress.objects.select_related("module").order_by("module__order"),
+            to_attr="progress_rows",
+        ))
+    )
 
-        completed = completed_qs.count()
+    for e in enrollments:
 
         # percentage
-        e.progress_percent = int((completed / total) * 100) if total else 0
+        total = e.total_modules
+        e.progress_percent = int((e.completed_count / total) * 100) if total else 0
 
         # attach module lists
-        e.completed_modules = completed_qs
-        e.pending_modules = pending_qs
-        e.total_modules = total
+        e.completed_modules = [p for p in e.progress_rows if p.is_completed]
+        e.pending_modules = [p for p in e.progress_rows if not p.is_completed]
 
     one_day_ago = timezone.now() - timedelta(hours=24)
     notifications = user.notifications.filter(
@@ -793,32 +750,36 @@ def dashboard(request):
         created_at__gte=one_day_ago
     ).order_by("-created_at")[:5]
 
-    applications = JobApplication.objects.filter(user=user)
-    interviews = applications.filter(status="INTERVIEW")
+    application_counts = JobApplication.objects.filter(user=user).aggregate(
+        total=Count("id"),
+        interviews=Count("id", filter=Q(status="INTERVIEW")),
+    )
 
     # ---------------- RESPONSE ANALYTICS (LAST 4 WEEKS RANGE) ----------------
-    today = timezone.now().date()
+    # one GROUP BY week (Monday, local time) over the last 4 weeks
+    today = timezone.localdate()
+    first_week = today - timedelta(days=today.weekday(), weeks=3)
+
+    responses_by_week = dict(
+        JobApplication.objects.filter(
+            user=user,
+            status__in=RESPONSE_STATUSES,
+            applied_at__gte=timezone.make_aware(datetime.combine(first_week, time.min))
+        )
+        .annotate(week=TruncWeek("applied_at", output_field=DateField()))
+        .values("week")
+        .annotate(n=Count("id"))
+        .order_by()
+        .values_list("week", "n")
+    )
 
-    week_ranges = []
     week_map = OrderedDict()
 
-    for i in range(3, -1, -1):
-        start = today - timedelta(days=today.weekday(), weeks=i)
+    for i in range(4):
+        start = first_week + timedelta(weeks=i)
         end = start + timedelta(days=6)
         label = f"{start.strftime('%d %b')} - {end.strftime('%d %b')}"
-        week_ranges.append((start, end, label))
-        week_map[label] = 0
-
-    responses = JobApplication.objects.filter(
-        user=user,
-        status__in=["IN_REVIEW", "INTERVIEW", "CLOSED"]
-    )
-
-    for app in responses:
-        applied_date = app.applied_at.date()
-        for start, end, label in week_ranges:
-            if start <= applied_date <= end:
-                week_map[label] += 1
+        week_map[label] = responses_by_week.get(start, 0)
 
     chart_labels = list(week_map.keys())
     chart_data = list(week_map.values())
@@ -834,18 +795,18 @@ def dashboard(request):
     completion = profile.completion_percentage() if profile else 0
 
     # ---------------- PLAN LIMITS ----------------
+    # job applications → monthly counter (jobs.services.quota)
+    applications_used, job_limit, applications_remaining = quota_status(user)
+
     if user.plan == "FREE":
-        job_limit = 20
         resume_limit = 0
         session_limit = 0
 
     elif user.plan == "PRO":
-        job_limit = 100
         resume_limit = 1
         session_limit = 1
 
     else:  # PRO_PLUS
-        job_limit = None   # unlimited
         resume_limit = None
         session_limit = 4
 
@@ -855,10 +816,12 @@ def dashboard(request):
 
         "saved_jobs_count": SavedJob.objects.filter(user=user).count(),
 
-        "applications_count": applications.count(),
+        "applications_count": application_counts["total"],
+        "applications_used": applications_used,
+        "applications_remaining": applications_remaining,
         "job_limit": job_limit,
 
-        "interviews_count": interviews.count(),
+        "interviews_count": application_counts["interviews"],
 
         "resume_used": resume_used,
         "resume_limit": resume_limit,
@@ -868,7 +831,7 @@ def dashboard(request):
 
         "completion": completion,
 
-        "enrolled_trainings_count": enrollments.count(),
+        "enrolled_trainings_count": len(enrollments),
         "enrollments": enrollments,
 
         "notifications": notifications,
@@ -948,36 +911,20 @@ def generate_advanced_resume_review(request):
 
 
 
-from core.models import TrainingEnquiry
 from accounts.models import Notification
 from django.utils import timezone
 from datetime import timedelta
 # Shows enquiries waiting > 24 hours
-from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 from datetime import timedelta
-from core.models import TrainingEnquiry, EnquiryMessage
 from accounts.decorators import staff_required
 
 
 @admin_required
 def admin_delayed_enquiries(request):
 
-    one_day_ago = timezone.now() - timedelta(hours=24)
-
-    last_message = EnquiryMessage.objects.filter(
-        enquiry=OuterRef("pk")
-    ).order_by("-created_at")
-
-    enquiries = TrainingEnquiry.objects.annotate(
-        last_sender=Subquery(last_message.values("sender")[:1]),
-        last_message_time=Subquery(last_message.values("created_at")[:1])
-    ).filter(
-        last_sender__isnull=False,
-        last_message_time__lte=one_day_ago
-    ).exclude(
-        last_sender=request.user.id
-    ).select_related("user", "training")
+    # same rule as the dashboard counter (accounts.services.dashboard)
+    enquiries = delayed_enquiries().select_related("user", "training")
 
     return render(
         request,
@@ -996,7 +943,9 @@ def admin_unread_alerts(request):
     alerts = Notification.objects.filter(
         user__isnull=True,   # admin/global alerts only
         is_read=False
-    ).order_by("-created_at")
+    )
+
+    alerts = paginate_keyset(request, alerts, per_page=25)
 
     return render(
         request,
@@ -1016,9 +965,8 @@ from accounts.decorators import staff_required
 @admin_required
 @require_POST
 def mark_alert_read(request, alert_id):
-    alert = get_object_or_404(Notification, id=alert_id)
-    alert.is_read = True
-    alert.save()
+    get_object_or_404(Notification, id=alert_id)
+    mark_read(Notification.objects.filter(id=alert_id))
     return redirect("admin_unread_alerts")
 
 
@@ -1045,7 +993,25 @@ def admin_alerts(request):
         "accounts/admin_alerts.html",
         {
             "title": "Alerts",
-            "alerts": alerts.order_by("-created_at")
+            "alerts": paginate_keyset(request, alerts, per_page=25)
         }
     )
 
+
+
+# ---------------- LIVE NOTIFICATIONS (long-poll) ----------------
+from accounts.services.notifications import poll
+
+@login_required
+def notification_poll(request):
+    """
+    New notifications + unread counts for the dashboards. Answers on
+    the first publish or after POLL_SECONDS; the page polls again with
+    `since` = the returned id (accounts/notification_poll.html).
+    """
+    since = request.GET.get("since", "")
+    updates, last_id = poll(request.user, int(since) if since.isdigit() else None)
+
+    response = JsonResponse({"messages": updates, "since": last_id})
+    response["Cache-Control"] = "no-cache"
+    return response
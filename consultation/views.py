@@ -24,19 +24,16 @@ def request_session(request):
 
         # PRIORITY ALERT FOR PRO PLUS
         if request.user.plan == "PRO_PLUS":
-            from accounts.models import Notification
+            from accounts.services.notifications import notify
             from django.contrib.auth import get_user_model
 
             User = get_user_model()
 
-            admins = User.objects.filter(is_staff=True)
-
-            for admin in admins:
-                Notification.objects.create(
-                    user=admin,
-                    title="🚨 Priority Consultation Request",
-                    message=f"{request.user.profile.full_name or request.user.email} (Pro Plus) requested a session: {topic}"
-                )
+            notify(
+                User.objects.filter(is_staff=True).values_list("id", flat=True),
+                "🚨 Priority Consultation Request",
+                f"{request.user.profile.full_name or request.user.email} (Pro Plus) requested a session: {topic}"
+            )
 
 
         messages.success(request, "Session request submitted.")
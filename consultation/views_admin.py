@@ -6,6 +6,7 @@ from django.contrib.auth import get_user_model
 
 from accounts.decorators import admin_required
 from accounts.models import Notification
+from accounts.services.notifications import notify, send
 from .models import ConsultantSession
 
 User = get_user_model()
@@ -47,19 +48,19 @@ def schedule_session(request, session_id):
         session.status = "SCHEDULED"
         session.save()
 
-        # -------- notify candidate --------
-        Notification.objects.create(
-            user=session.user,
-            title="Consultation Scheduled",
-            message=f"Your consultation is scheduled on {localtime(session.scheduled_at).strftime('%d %b %I:%M %p')}"
-        )
-
-        # -------- notify trainer --------
-        Notification.objects.create(
-            user=trainer,
-            title="New Session Assigned",
-            message=f"You have a consultation with {session.user.email} on {localtime(session.scheduled_at).strftime('%d %b %I:%M %p')}"
-        )
+        # -------- notify candidate + trainer (one insert) --------
+        send([
+            Notification(
+                user=session.user,
+                title="Consultation Scheduled",
+                message=f"Your consultation is scheduled on {localtime(session.scheduled_at).strftime('%d %b %I:%M %p')}"
+            ),
+            Notification(
+                user=trainer,
+                title="New Session Assigned",
+                message=f"You have a consultation with {session.user.email} on {localtime(session.scheduled_at).strftime('%d %b %I:%M %p')}"
+            ),
+        ])
 
         messages.success(request, "Session scheduled successfully.")
         return redirect("admin_session_scheduled")
@@ -107,10 +108,10 @@ def mark_completed(request, session_id):
     session.save()
 
     # Notify candidate
-    Notification.objects.create(
-        user=session.user,
-        title="Session Verified",
-        message="Your consultation session has been verified by admin."
+    notify(
+        [session.user],
+        "Session Verified",
+        "Your consultation session has been verified by admin."
     )
 
     messages.success(request, "Session verified and closed successfully.")
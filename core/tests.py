@@ -1,3 +1,101 @@
-from django.test import TestCase
+import json
+from datetime import date, datetime
+from urllib.parse import parse_qs
 
-# Create your tests here.
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from core.utils.export import stream_export
+from core.utils.pagination import decode_cursor, encode_cursor, paginate_keyset
+
+
+# -------------------------------------------------
+# KEYSET PAGINATION
+# -------------------------------------------------
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(7):
+            User.objects.create_user(email=f"user{i}@example.com", password="pass12345")
+
+        # three rows share a timestamp: the id has to break the tie
+        joined = timezone.now()
+        ids = list(User.objects.order_by("id").values_list("id", flat=True))
+        User.objects.filter(id__in=ids[2:5]).update(date_joined=joined)
+
+    def page(self, **params):
+        request = RequestFactory().get("/users/", {"q": "x", **params})
+        return paginate_keyset(request, User.objects.all(), per_page=3, field="date_joined")
+
+    def cursor(self, query, key):
+        return parse_qs(query)[key][0]
+
+    def test_cursor_round_trip(self):
+        moment = timezone.now()
+
+        for value in (moment, date(2026, 1, 31), 42, "Chennai"):
+            self.assertEqual(decode_cursor(encode_cursor("field", value, 7), "field"), (value, 7))
+
+    def test_bad_cursors_start_over(self):
+        cursor = encode_cursor("created_at", datetime(2026, 1, 1), 7)
+
+        self.assertIsNone(decode_cursor(cursor, "match_score"))
+        self.assertIsNone(decode_cursor(cursor[:-3], "created_at"))
+        self.assertIsNone(decode_cursor("not a cursor!", "created_at"))
+        self.assertEqual(len(self.page(after="garbage")), 3)
+
+    def test_walks_forward_and_back_without_gaps(self):
+        expected = list(User.objects.order_by("-date_joined", "-id").values_list("id", flat=True))
+
+        pages, page = [], self.page()
+        while True:
+            pages.append([user.id for user in page])
+            if not page.has_next:
+                break
+            self.assertIn("q=x", page.next_query)
+            page = self.page(after=self.cursor(page.next_query, "after"))
+
+        self.assertEqual(sum(pages, []), expected)
+        self.assertFalse(self.page().has_previous)
+
+        back = self.page(before=self.cursor(page.previous_query, "before"))
+        self.assertEqual([user.id for user in back], pages[-2])
+        self.assertTrue(back.has_next)
+
+    def test_count_is_capped(self):
+        request = RequestFactory().get("/users/")
+        page = paginate_keyset(request, User.objects.all(), per_page=3, field="date_joined", count_limit=5)
+
+        self.assertEqual((page.count, page.count_capped), (5, True))
+
+
+# -------------------------------------------------
+# STREAMING EXPORT
+# -------------------------------------------------
+class StreamExportTests(TestCase):
+
+    HEADER = ["Title", "Applied At"]
+
+    def export(self, rows, fmt):
+        response = stream_export(iter(rows), self.HEADER, "applications", fmt)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_json_is_valid_for_any_row_count(self):
+        row = ("Python Developer", date(2026, 1, 31))
+
+        for n in (0, 1, 3):
+            response, body = self.export([row] * n, "json")
+            self.assertEqual(response["Content-Type"], "application/json")
+            self.assertEqual(
+                json.loads(body), [{"title": "Python Developer", "applied_at": "2026-01-31"}] * n
+            )
+
+    def test_csv_and_unknown_formats(self):
+        for fmt in ("csv", "xlsx", None):
+            response, body = self.export([("Python, Django Developer", date(2026, 1, 31))], fmt)
+
+            self.assertEqual(response["Content-Type"], "text/csv")
+            self.assertEqual(response["Content-Disposition"], 'attachment; filename="applications.csv"')
+            self.assertEqual(body, 'Title,Applied At\r\n"Python, Django Developer",2026-01-31\r\n')
@@ -0,0 +1,64 @@
+"""
+Streaming CSV / JSON export.
+
+Rows come from a generator (usually queryset.values_list().iterator()),
+are encoded one at a time and sent with StreamingHttpResponse, so an
+export of any size runs in constant memory.
+
+Usage:
+    return stream_export(rows, ["Title", "Company"], "applications", request.GET.get("format"))
+"""
+import csv
+import json
+from datetime import date, datetime
+
+from django.http import StreamingHttpResponse
+
+
+EXPORT_CHUNK_SIZE = 500      # rows per DB fetch (queryset.iterator)
+
+FORMATS = ("csv", "json")
+
+
+class _Echo:
+    """ File-like object whose write() returns the line instead of storing it. """
+
+    def write(self, value):
+        return value
+
+
+def _plain(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _csv_lines(rows, header):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_plain(v) for v in row])
+
+
+def _json_lines(rows, header):
+    keys = [h.lower().replace(" ", "_") for h in header]
+    yield "["
+    first = True
+    for row in rows:
+        item = json.dumps(dict(zip(keys, (_plain(v) for v in row))))
+        yield item if first else "," + item
+        first = False
+    yield "]"
+
+
+def stream_export(rows, header, filename, fmt="csv"):
+    fmt = fmt if fmt in FORMATS else "csv"
+
+    if fmt == "json":
+        content, content_type = _json_lines(rows, header), "application/json"
+    else:
+        content, content_type = _csv_lines(rows, header), "text/csv"
+
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    return response
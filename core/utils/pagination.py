@@ -0,0 +1,166 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are fetched with WHERE (field, id) < (last_field, last_id) instead
+of OFFSET, so page 500 costs the same as page 1. No COUNT(*) unless the
+view asks for one (`count_limit` caps it, so it stays cheap).
+
+Usage:
+    page = paginate_keyset(request, qs, per_page=20, field="created_at")
+    {% include "core/keyset_pagination.html" with page=page %}
+"""
+import base64
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class KeysetPage:
+
+    def __init__(self, object_list, has_next, has_previous,
+                 next_query="", previous_query="", count=None, count_capped=False):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_query = next_query
+        self.previous_query = previous_query
+        self.count = count
+        self.count_capped = count_capped
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+
+# -------------------------------------------------
+# CURSOR ENCODING
+# -------------------------------------------------
+def encode_cursor(field, value, pk):
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    elif isinstance(value, date):
+        value = {"d": value.isoformat()}
+
+    raw = json.dumps([field, value, pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor, field):
+    """
+    Returns (value, pk), or None for a missing / tampered cursor or one
+    built for another sort field (e.g. search switched to "match" mode).
+    """
+    if not cursor:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_field, value, pk = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+
+    if cursor_field != field:
+        return None
+
+    if isinstance(value, dict):
+        if "dt" in value:
+            value = datetime.fromisoformat(value["dt"])
+        elif "d" in value:
+            value = date.fromisoformat(value["d"])
+        else:
+            return None
+
+    return value, pk
+
+
+# -------------------------------------------------
+# PAGINATE
+# -------------------------------------------------
+def _query_string(request, **params):
+    query = request.GET.copy()
+    for key in ("after", "before", "page"):
+        query.pop(key, None)
+    for key, value in params.items():
+        query[key] = value
+    return query.urlencode()
+
+
+def _seek(queryset, field, after, before):
+    if after:
+        value, pk = after
+        return queryset.filter(
+            Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+        ).order_by(f"-{field}", "-pk")
+
+    if before:
+        value, pk = before
+        return queryset.filter(
+            Q(**{f"{field}__gt": value}) | Q(**{field: value, "pk__gt": pk})
+        ).order_by(field, "pk")
+
+    return queryset.order_by(f"-{field}", "-pk")
+
+
+def paginate_keyset(request, queryset, per_page=20, field="created_at", count_limit=None):
+    """
+    Newest-first page of `queryset` ordered by (field DESC, id DESC).
+
+    `field` may be a model field or an annotation (e.g. "match_score").
+    `count_limit` → also return min(total, count_limit) as page.count.
+    """
+    after = decode_cursor(request.GET.get("after"), field)
+    before = None if after else decode_cursor(request.GET.get("before"), field)
+
+    try:
+        qs = _seek(queryset, field, after, before)
+    except (ValidationError, ValueError, TypeError):
+        # cursor value of the wrong type → first page
+        after = before = None
+        qs = _seek(queryset, field, None, None)
+
+    rows = list(qs[:per_page + 1])
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    if before:
+        rows.reverse()
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, bool(after)
+
+    next_query = previous_query = ""
+    if rows:
+        first, last = rows[0], rows[-1]
+        if has_next:
+            next_query = _query_string(
+                request, after=encode_cursor(field, getattr(last, field), last.pk)
+            )
+        if has_previous:
+            previous_query = _query_string(
+                request, before=encode_cursor(field, getattr(first, field), first.pk)
+            )
+
+    count = None
+    count_capped = False
+    if count_limit:
+        count = queryset.order_by()[:count_limit + 1].count()
+        count_capped = count > count_limit
+        count = min(count, count_limit)
+
+    return KeysetPage(
+        rows,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_query=next_query,
+        previous_query=previous_query,
+        count=count,
+        count_capped=count_capped,
+    )
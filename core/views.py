@@ -1,5 +1,4 @@
 from django.shortcuts import render
-from django.db.models import Q
 from .models import (
     HomeHero,
     HomeFeature,
@@ -11,7 +10,8 @@ from .models import (
 )
 
 from jobs.utils import visible_jobs_for_user
-from jobs.models import JobApplication
+from jobs.services.recommendations import recommended_jobs
+from jobs.services.applied import applied_job_ids
 
 
 from .utils.certificate_generator import generate_certificate
@@ -57,33 +57,22 @@ def public_home(request):
 
         profile = getattr(request.user, "profile", None)
 
-        recommended_jobs = []
+        recommended = []
         applied_ids = []
 
         if profile:
-            jobs_qs = visible_jobs_for_user(request.user)
-
-            # ---------- Skill Matching ----------
+            # ---------- Precomputed Recommendations ----------
             if profile.skills:
-                skills = [s.strip() for s in profile.skills.split(",") if s.strip()]
-
-                skill_query = Q()
-                for skill in skills:
-                    skill_query |= Q(skills__icontains=skill) | Q(title__icontains=skill)
+                recommended = recommended_jobs(request.user, limit=6)
+            else:
+                recommended = visible_jobs_for_user(request.user).cards().order_by("-created_at")[:6]
 
-                jobs_qs = jobs_qs.filter(skill_query)
-
-            recommended_jobs = jobs_qs.order_by("-created_at")[:6]
-
-            # ---------- Already Applied Jobs ----------
-            applied_ids = list(
-                JobApplication.objects.filter(user=request.user)
-                .values_list("job_id", flat=True)
-            )
+            # ---------- Already Applied Jobs (cached) ----------
+            applied_ids = applied_job_ids(request.user)
 
         context.update({
             "profile": profile,
-            "recommended_jobs": recommended_jobs,
+            "recommended_jobs": recommended,
             "applied_ids": applied_ids,
         })
 
@@ -91,20 +80,14 @@ def public_home(request):
 
 from accounts.decorators import staff_required
 from django.contrib.auth import get_user_model
-from jobs.models import Job, JobApplication
+from accounts.services.dashboard import admin_metrics
 
 User = get_user_model()
 
 @staff_required
 def admin_home(request):
-    context = {
-        "total_candidates": User.objects.filter(is_staff=False).count(),
-        "total_jobs": Job.objects.count(),
-        "pending_jobs": Job.objects.filter(status="PENDING").count(),
-        "active_jobs": Job.objects.filter(status="PUBLISHED").count(),
-        "total_applications": JobApplication.objects.count(),
-    }
-    return render(request, "core/admin_home.html", context)
+    # same cached snapshot as accounts.views.admin_dashboard
+    return render(request, "core/admin_home.html", admin_metrics())
 
 from django.shortcuts import redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
@@ -2,6 +2,7 @@ from django.shortcuts import render
 from accounts.decorators import staff_required
 from core.models import Enrollment, TrainingEnquiry
 from django.shortcuts import get_object_or_404
+from core.utils.pagination import paginate_keyset
 
 
 
@@ -11,7 +12,12 @@ from core.models import Enrollment, ModuleProgress
 @staff_required
 def admin_enrollments(request):
 
-    enrollments = Enrollment.objects.select_related("user", "training")
+    enrollments = paginate_keyset(
+        request,
+        Enrollment.objects.select_related("user", "training"),
+        per_page=25,
+        field="enrolled_at"
+    )
 
     # attach progress data
     for e in enrollments:
@@ -45,6 +51,8 @@ def admin_enquiries(request):
         last_message_time=Subquery(latest_message.values("created_at")[:1]),
     ).select_related("user", "training")
 
+    enquiries = paginate_keyset(request, enquiries, per_page=25)
+
     return render(request, "core/admin_enquiries.html", {
         "enquiries": enquiries
     })
@@ -250,6 +258,7 @@ def training_progress_admin(request, training_id):
 
 
 from accounts.models import Notification
+from accounts.services.notifications import mark_read
 from accounts.decorators import admin_required
 
 @admin_required
@@ -257,11 +266,13 @@ def admin_alerts(request):
 
     alerts = Notification.objects.filter(
         is_admin_alert=True
-    ).order_by("-created_at")
+    )
+
+    page = paginate_keyset(request, alerts, per_page=25)
 
-    # mark read
-    alerts.filter(is_read=False).update(is_read=True)
+    # mark read (only what was shown)
+    mark_read(alerts.filter(id__in=[a.id for a in page]))
 
     return render(request, "accounts/admin_alerts.html", {
-        "alerts": alerts
+        "alerts": page
     })
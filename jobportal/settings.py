@@ -97,10 +97,73 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # take the write lock at BEGIN (no "database is locked" on
+            # upgrade), wait for it instead of failing, and let readers
+            # run alongside the writer
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+            'init_command': 'PRAGMA journal_mode=WAL;',
+        },
     }
 }
 
 
+# Cache (applied job ids, job detail snapshots, recommendations,
+# dashboard counters). Set REDIS_URL so every worker shares one cache
+# (needs the redis package). The locmem fallback is per process — fine
+# for runserver and tests, but with several workers an invalidation only
+# reaches the worker that made it; the others serve the old entry until
+# it times out.
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Background tasks (post-commit side effects, e.g. jobs.tasks)
+# https://docs.djangoproject.com/en/6.0/topics/tasks/
+# ImmediateBackend runs them right after commit in the same process —
+# point BACKEND at a worker-based backend to move them off the request.
+
+TASKS = {
+    'default': {
+        'BACKEND': 'django.tasks.backends.immediate.ImmediateBackend',
+    }
+}
+
+
+# Live notifications (accounts.views.notification_poll)
+# The in-process broker only reaches polls on the same worker — with
+# several workers use accounts.services.broker.RedisBroker
+# ('OPTIONS': {'url': REDIS_URL}, needs the redis package).
+
+NOTIFICATION_BROKER = {
+    'BACKEND': 'accounts.services.broker.InProcessBroker',
+}
+
+# Read notifications older than this are compacted into NotificationArchive
+# (manage.py compact_notifications, run daily). Days per Notification.type;
+# 'default' covers the rest.
+
+NOTIFICATION_RETENTION_DAYS = {
+    'default': 90,
+    'JOB': 30,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
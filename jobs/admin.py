@@ -1,5 +1,11 @@
 from django.contrib import admin
-from .models import Job, JobApplication, SavedJob
+from .models import (
+    Job, JobApplication, SavedJob, Skill, SkillAlias, ApplicationQuota,
+    Location, LocationAlias, SavedSearch, JobModeration, JobImport,
+)
+from functools import partial
+from django.db import transaction
+from .tasks import run_job_import
 
 
 @admin.register(Job)
@@ -12,10 +18,13 @@ class JobAdmin(admin.ModelAdmin):
         "visibility",
         "tag_fresher",
         "status",
+        "duplicate_of",
         "created_by",
         "created_at",
     )
 
+    raw_id_fields = ("duplicate_of",)
+
     # ✅ All fields here EXIST in Job model
     list_filter = (
         "status",
@@ -76,6 +85,80 @@ class SavedJobAdmin(admin.ModelAdmin):
 
     readonly_fields = ("saved_at",)
 
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ("name", "key")
+    search_fields = ("name", "key", "aliases__alias")
+    inlines = [SkillAliasInline]
+
+
+class LocationAliasInline(admin.TabularInline):
+    model = LocationAlias
+    extra = 1
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ("name", "key")
+    search_fields = ("name", "key", "aliases__alias")
+    inlines = [LocationAliasInline]
+
+
+@admin.register(ApplicationQuota)
+class ApplicationQuotaAdmin(admin.ModelAdmin):
+    list_display = ("user", "period", "used")
+    list_filter = ("period",)
+    search_fields = ("user__email",)
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ("user", "name", "location_tag", "skills", "job_type", "is_active", "last_notified_at")
+    list_filter = ("is_active", "job_type")
+    search_fields = ("user__email", "name", "skills")
+    raw_id_fields = ("user", "location_tag")
+
+
+@admin.register(JobModeration)
+class JobModerationAdmin(admin.ModelAdmin):
+    list_display = ("job", "from_status", "to_status", "moderator", "created_at")
+    list_filter = ("to_status",)
+    search_fields = ("job__title", "moderator__email")
+    raw_id_fields = ("job", "moderator")
+
+
+@admin.register(JobImport)
+class JobImportAdmin(admin.ModelAdmin):
+    """ Upload a partner feed (CSV / JSON-lines / XLSX); refresh to watch progress. """
+    list_display = (
+        "file", "status", "processed", "created", "duplicates",
+        "error_count", "publish", "created_by", "created_at", "finished_at",
+    )
+    list_filter = ("status", "publish")
+    readonly_fields = (
+        "status", "processed", "created", "duplicates", "error_count",
+        "errors", "created_by", "created_at", "finished_at",
+    )
+
+    def get_readonly_fields(self, request, obj=None):
+        # the file and mode are fixed once the import exists
+        if obj:
+            return ("file", "publish") + self.readonly_fields
+        return self.readonly_fields
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.created_by = request.user
+        super().save_model(request, obj, form, change)
+        if not change:
+            transaction.on_commit(partial(run_job_import.enqueue, obj.id))
+
 # from django.contrib import admin
 # from .models import Job, JobApplication
 
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+from jobs.services import dedupe
+
+
+class Command(BaseCommand):
+    help = "Compute SimHash signatures for existing jobs and optionally flag near-duplicates"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--flag",
+            action="store_true",
+            help="Set duplicate_of on active jobs that near-duplicate an older active job"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options["batch_size"], 1)
+
+        total = 0
+        for batch in self.batches(Job.objects.all(), batch_size):
+            dedupe.index_jobs(batch)
+            total += len(batch)
+        self.stdout.write(f"Indexed {total} job signatures.")
+
+        if not options["flag"]:
+            return
+
+        flagged = 0
+        active = Job.objects.filter(
+            status__in=dedupe.ACTIVE_STATUSES, duplicate_of__isnull=True
+        )
+        for batch in self.batches(active, batch_size):
+            values = [dedupe.job_simhash(job) for job in batch]
+            rows = dedupe.candidates(values)
+
+            duplicates = []
+            for job, value in zip(batch, values):
+                original = dedupe.nearest(value, rows, before_id=job.id)
+                if original:
+                    job.duplicate_of_id = original
+                    duplicates.append(job)
+
+            Job.objects.bulk_update(duplicates, ["duplicate_of"], batch_size=500)
+            flagged += len(duplicates)
+
+        self.stdout.write(self.style.SUCCESS(f"Flagged {flagged} near-duplicate jobs."))
+
+    def batches(self, queryset, batch_size):
+        batch = []
+        jobs = queryset.only("id", "title", "company_name", "description").order_by("id")
+        for job in jobs.iterator(chunk_size=batch_size):
+            batch.append(job)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
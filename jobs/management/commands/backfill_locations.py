@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job, JobLocation, LocationAlias
+from jobs.services.locations import add_places, index_aliases, locations_for_text
+
+
+class Command(BaseCommand):
+    help = "Link existing jobs to the location gazetteer and rebuild its trigram index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--add-places",
+            action="store_true",
+            help="First add a gazetteer location for every town existing jobs name that no alias covers"
+        )
+
+    def handle(self, *args, **options):
+        if options["add_places"]:
+            created = add_places(
+                Job.objects.exclude(location="").order_by().values_list("location", flat=True).distinct()
+            )
+            self.stdout.write(f"Added {len(created)} places: {', '.join(location.name for location in created) or '-'}")
+
+        index_aliases(LocationAlias.objects.all())
+        self.stdout.write("Trigram index rebuilt.")
+
+        batch_size = options["batch_size"]
+        total = 0
+        batch = []
+
+        rows = Job.objects.exclude(location="").values_list("id", "location").iterator(chunk_size=batch_size)
+
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                total += self.flush(batch)
+                batch = []
+
+        if batch:
+            total += self.flush(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Linked {total} job locations."))
+
+    def flush(self, batch):
+        # one automaton pass per job; distinct strings resolved once
+        resolved = {}
+        links = []
+
+        for job_id, text in batch:
+            if text not in resolved:
+                resolved[text] = locations_for_text(text)
+            links.extend(
+                JobLocation(job_id=job_id, location_id=location_id)
+                for location_id in resolved[text]
+            )
+
+        JobLocation.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+        return len(links)
@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+
+from accounts.models import Profile
+from jobs.models import Job, JobSkill, ProfileSkill
+from jobs.services.skills import parse_skills, resolve_skill_ids
+
+
+class Command(BaseCommand):
+    help = "Parse existing Job.skills / Profile.skills strings into the skill taxonomy"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        jobs = self.backfill(
+            Job.objects.exclude(skills=""),
+            JobSkill,
+            "job_id",
+            batch_size
+        )
+        self.stdout.write(f"Jobs: {jobs} skill links")
+
+        profiles = self.backfill(
+            Profile.objects.exclude(skills=""),
+            ProfileSkill,
+            "profile_id",
+            batch_size
+        )
+        self.stdout.write(f"Profiles: {profiles} skill links")
+
+        self.stdout.write(self.style.SUCCESS("Skill backfill complete."))
+
+    def backfill(self, queryset, link_model, owner_field, batch_size):
+        total = 0
+        batch = []
+
+        rows = queryset.values_list("id", "skills").iterator(chunk_size=batch_size)
+
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                total += self.flush(batch, link_model, owner_field)
+                batch = []
+
+        if batch:
+            total += self.flush(batch, link_model, owner_field)
+
+        return total
+
+    def flush(self, batch, link_model, owner_field):
+        parsed_rows = [(owner_id, parse_skills(raw)) for owner_id, raw in batch]
+
+        # one resolve (and one bulk Skill insert) per batch
+        all_skills = {}
+        for _, parsed in parsed_rows:
+            for key, name in parsed.items():
+                all_skills.setdefault(key, name)
+
+        skill_ids = resolve_skill_ids(all_skills)
+
+        links = [
+            link_model(**{owner_field: owner_id, "skill_id": skill_ids[key]})
+            for owner_id, parsed in parsed_rows
+            for key in parsed
+            if key in skill_ids
+        ]
+
+        link_model.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+        return len(links)
@@ -0,0 +1,150 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from accounts.models import Notification, NotificationCounter, User
+from accounts.services.dashboard import metric_queries
+from accounts.services.retention import ARCHIVE_FIELDS, expired_notifications
+from jobs.models import Job, JobApplication
+from jobs.services.quota import month_start
+from jobs.services.expiry import due_jobs
+from jobs.services.job_import import existing_jobs
+from jobs.utils import PLAN_VISIBILITY, live_jobs
+
+
+# SQLite: "SCAN jobs_job" (no index) vs "SCAN jobs_job USING INDEX ..." / "SEARCH ..."
+SQLITE_FULL_SCAN = re.compile(r"\bSCAN (\w+)(?! USING (?:COVERING )?INDEX)(?:\s|$)")
+# Postgres: "Seq Scan on jobs_job"
+PG_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+def hot_queries():
+    """
+    (label, queryset) for the filters that run on every dashboard / apply.
+    The ids are placeholders — EXPLAIN doesn't need real rows.
+    """
+    admin_alerts = Notification.objects.filter(user__isnull=True)
+
+    return [
+        # ---------------- jobs.services.quota ----------------
+        ("quota: applications this month", JobApplication.objects.filter(
+            user_id=0, applied_at__gte=month_start()
+        ).order_by()),
+
+        # ---------------- accounts.views.admin_dashboard ----------------
+        ("admin: priority alerts", admin_alerts.filter(
+            is_admin_alert=True, is_read=False
+        ).order_by("-created_at")[:5]),
+        ("admin: new application alerts", admin_alerts.filter(
+            type=Notification.JOB, is_read=False
+        ).order_by("-created_at")[:5]),
+        ("admin: unread counters", NotificationCounter.objects.filter(user__isnull=True)),
+
+        # ---------------- accounts.views.dashboard ----------------
+        ("trainer: unread counter", NotificationCounter.objects.filter(user_id=0)),
+        ("dashboard: unread notifications", Notification.objects.filter(
+            user_id=0, is_read=False
+        ).order_by("-created_at")[:5]),
+        ("dashboard: my applications", JobApplication.objects.filter(
+            user_id=0, status__in=["IN_REVIEW", "INTERVIEW", "CLOSED"]
+        )),
+
+        # ---------------- job listings ----------------
+        ("jobs: latest published", live_jobs().order_by("-created_at")[:6]),
+        ("jobs: applicable for plan", Job.objects.filter(
+            status="PUBLISHED", visibility__in=PLAN_VISIBILITY[User.PRO]
+        ).order_by()),
+
+        # ---------------- jobs.services.expiry ----------------
+        ("expiry: published past deadline", due_jobs().order_by("deadline", "id")[:500]),
+
+        # ---------------- jobs.services.job_import ----------------
+        ("import: existing company / title", existing_jobs(
+            {"acme"}, {"python developer"}
+        ).values_list("company_name", "title", "location")),
+
+        # ---------------- accounts.services.retention ----------------
+        ("retention: expired read notifications", expired_notifications().order_by(
+            "created_at", "id"
+        ).values(*ARCHIVE_FIELDS)[:1000]),
+    ]
+
+
+def hot_aggregates():
+    """
+    (label, queryset, aggregates) of the admin metrics snapshot
+    (accounts.services.dashboard.compute_metrics) over the big tables:
+    one conditional-aggregate pass each, which has to read an index, not
+    the table. Candidates / trainings / enquiries are whole-table counts
+    by design, cached for METRICS_TIMEOUT.
+    """
+    return [
+        (f"admin metrics: {queryset.model._meta.db_table}", queryset, aggregates)
+        for queryset, aggregates in metric_queries()
+        if queryset.model in (Job, JobApplication)
+    ]
+
+
+def explain_aggregate(queryset, aggregates):
+    """ EXPLAIN the SQL .aggregate() runs (QuerySet.explain() can't). """
+    plans = []
+
+    def explain(execute, sql, params, many, context):
+        cursor = context["cursor"].cursor
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+        plans.extend(" ".join(str(col) for col in row) for row in cursor.fetchall())
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(explain):
+        queryset.aggregate(**aggregates)
+    return "\n".join(plans)
+
+
+def full_scans(plan):
+    pattern = PG_FULL_SCAN if connection.vendor == "postgresql" else SQLITE_FULL_SCAN
+    return sorted(set(pattern.findall(plan)))
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the hot job / application / notification queries and fail on full table scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("sqlite", "postgresql"):
+            self.stdout.write(f"Plan check not supported on '{connection.vendor}' — skipped.")
+            return
+
+        failures = []
+
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # tiny dev tables make seq scans "cheaper" — only fail when
+                # no index can serve the query at all
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            plans = [(label, queryset.explain()) for label, queryset in hot_queries()]
+            plans += [
+                (label, explain_aggregate(queryset, aggregates))
+                for label, queryset, aggregates in hot_aggregates()
+            ]
+
+            for label, plan in plans:
+                scanned = full_scans(plan)
+
+                if options["verbose_plans"]:
+                    self.stdout.write(f"\n{label}\n{plan}")
+
+                if scanned:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f"FULL SCAN  {label}: {', '.join(scanned)}"))
+                else:
+                    self.stdout.write(f"ok         {label}")
+
+        if failures:
+            raise CommandError(f"{len(failures)} hot queries do a full table scan.")
+
+        self.stdout.write(self.style.SUCCESS("All hot queries use an index."))
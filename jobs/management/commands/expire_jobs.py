@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from jobs.services.expiry import due_jobs, expire_due_jobs
+
+
+class Command(BaseCommand):
+    help = "Move published jobs past their deadline to EXPIRED (run daily)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the jobs that would expire"
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            self.stdout.write(f"{due_jobs().count()} jobs past their deadline.")
+            return
+
+        total = expire_due_jobs(batch_size=max(options["batch_size"], 1))
+        self.stdout.write(self.style.SUCCESS(f"Expired {total} jobs."))
@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.services import job_import
+
+
+class Command(BaseCommand):
+    help = "Import jobs from a partner feed (.csv, .jsonl or .xlsx), streaming and in chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=job_import.FORMATS,
+            help="Defaults to the file extension"
+        )
+        parser.add_argument(
+            "--created-by",
+            help="Email of the staff user the jobs are created by (default: first superuser)"
+        )
+        parser.add_argument(
+            "--publish",
+            action="store_true",
+            help="Publish directly instead of queueing for review"
+        )
+        parser.add_argument("--chunk-size", type=int, default=job_import.CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+
+        if options["created_by"]:
+            user = User.objects.filter(email=options["created_by"], is_staff=True).first()
+        else:
+            user = User.objects.filter(is_superuser=True).order_by("id").first()
+        if user is None:
+            raise CommandError("No staff user to create the jobs as (use --created-by).")
+
+        try:
+            fmt = options["format"] or job_import.detect_format(options["path"])
+            with open(options["path"], "rb") as fileobj:
+                report = job_import.import_jobs(
+                    job_import.iter_rows(fileobj, fmt),
+                    created_by=user,
+                    publish=options["publish"],
+                    chunk_size=max(options["chunk_size"], 1),
+                    progress=self.progress,
+                )
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except job_import.READ_ERRORS as exc:
+            raise CommandError(f"Could not read the file: {exc}")
+
+        for error in report.errors:
+            self.stderr.write(f"row {error['row']}: {error['error']}")
+        if report.error_count > len(report.errors):
+            self.stderr.write(f"... and {report.error_count - len(report.errors)} more errors")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report.created} jobs ({report.duplicates} duplicates, "
+            f"{report.error_count} errors, {report.processed} rows)."
+        ))
+
+    def progress(self, report):
+        self.stdout.write(
+            f"  {report.processed} rows: {report.created} created, "
+            f"{report.duplicates} duplicates, {report.error_count} errors"
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from jobs.services import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the job full-text search index (SQLite FTS5)"
+
+    def handle(self, *args, **options):
+        if not search.sqlite_fts_available():
+            self.stdout.write(
+                f"No FTS table on '{connection.vendor}' — nothing to rebuild "
+                "(Postgres indexes are maintained automatically)."
+            )
+            return
+
+        total = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} jobs."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from jobs.services.quota import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recount monthly application quota counters from JobApplication rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=1,
+            help="How many months to recount, including the current one (default 1)"
+        )
+
+    def handle(self, *args, **options):
+        fixed = reconcile(months=max(options["months"], 1))
+        self.stdout.write(self.style.SUCCESS(f"Fixed {fixed} quota counters."))
@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from jobs.services.recommendations import refresh_for_user
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Rebuild precomputed job recommendations for candidates"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="Only rebuild this user id")
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_staff=False).select_related("profile")
+
+        if options["user"]:
+            users = users.filter(id=options["user"])
+
+        total = 0
+        for user in users.iterator(chunk_size=500):
+            refresh_for_user(user)
+            total += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt recommendations for {total} users."))
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:12
+
+from django.db import migrations
+
+
+FTS_CREATE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_job_fts USING fts5(
+    title, skills, location, company_name, description,
+    tokenize = "unicode61 tokenchars '+#'"
+)
+"""
+
+FTS_BACKFILL = """
+INSERT INTO jobs_job_fts (rowid, title, skills, location, company_name, description)
+SELECT id, title, skills, location, company_name, description FROM jobs_job
+"""
+
+PG_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS jobs_job_skills_tsv_idx ON jobs_job USING GIN "
+    "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(skills, '')))",
+    "CREATE INDEX IF NOT EXISTS jobs_job_location_tsv_idx ON jobs_job USING GIN "
+    "(to_tsvector('simple', coalesce(location, '')))",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(FTS_CREATE)
+        schema_editor.execute(FTS_BACKFILL)
+
+    elif vendor == "postgresql":
+        for sql in PG_INDEXES:
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS jobs_job_fts")
+
+    elif vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS jobs_job_skills_tsv_idx")
+        schema_editor.execute("DROP INDEX IF EXISTS jobs_job_location_tsv_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_alter_job_visibility'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
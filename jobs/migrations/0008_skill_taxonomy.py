@@ -0,0 +1,96 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# canonical name → aliases
+SEED_SKILLS = {
+    "Python": ["py", "python3"],
+    "JavaScript": ["js", "java script", "ecmascript"],
+    "TypeScript": ["ts"],
+    "React": ["reactjs", "react.js"],
+    "Node.js": ["node", "nodejs"],
+    "Django": ["django framework"],
+    "SQL": ["mysql", "postgresql", "postgres"],
+    "Machine Learning": ["ml"],
+    "Artificial Intelligence": ["ai"],
+    "Power BI": ["powerbi"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "C++": ["cpp"],
+    "C#": ["csharp"],
+}
+
+
+def seed_skills(apps, schema_editor):
+    Skill = apps.get_model("jobs", "Skill")
+    SkillAlias = apps.get_model("jobs", "SkillAlias")
+
+    for name, aliases in SEED_SKILLS.items():
+        skill, _ = Skill.objects.get_or_create(key=name.lower(), defaults={"name": name})
+        for alias in aliases:
+            SkillAlias.objects.get_or_create(alias=alias, defaults={"skill": skill})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0032_notification_type'),
+        ('jobs', '0007_job_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='jobs.job')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_links', to='jobs.skill')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='jobs', through='jobs.JobSkill', to='jobs.skill'),
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='jobs.skill')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfileSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='accounts.profile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='profile_links', to='jobs.skill')),
+            ],
+            options={
+                'unique_together': {('profile', 'skill')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='jobskill',
+            index=models.Index(fields=['skill', 'job'], name='jobs_jobski_skill_i_1a433c_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobskill',
+            unique_together={('job', 'skill')},
+        ),
+        migrations.RunPython(seed_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def backfill_current_month(apps, schema_editor):
+    JobApplication = apps.get_model("jobs", "JobApplication")
+    ApplicationQuota = apps.get_model("jobs", "ApplicationQuota")
+
+    start = timezone.localtime().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    rows = (
+        JobApplication.objects.filter(applied_at__gte=start)
+        .values("user_id")
+        .annotate(used=Count("id"))
+        .order_by()
+    )
+    ApplicationQuota.objects.bulk_create([
+        ApplicationQuota(user_id=row["user_id"], period=start.date(), used=row["used"])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_job_status_created_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationQuota',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField()),
+                ('used', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_quotas', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-period'],
+                'unique_together': {('user', 'period')},
+            },
+        ),
+        migrations.RunPython(backfill_current_month, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# canonical name → aliases (old names, spellings, short forms)
+SEED_LOCATIONS = {
+    "Bengaluru": ["bangalore", "bengalore", "blr"],
+    "Chennai": ["madras"],
+    "Mumbai": ["bombay"],
+    "Delhi": ["new delhi"],
+    "Gurugram": ["gurgaon"],
+    "Noida": [],
+    "Kolkata": ["calcutta"],
+    "Hyderabad": ["hyd"],
+    "Pune": ["poona"],
+    "Kochi": ["cochin"],
+    "Thiruvananthapuram": ["trivandrum"],
+    "Mysuru": ["mysore"],
+    "Puducherry": ["pondicherry", "pondy"],
+    "Coimbatore": ["kovai"],
+    "Tiruchirappalli": ["trichy", "tiruchi"],
+    "Madurai": [],
+    "Ahmedabad": [],
+    "Visakhapatnam": ["vizag"],
+    "Vadodara": ["baroda"],
+    "Remote": ["work from home", "wfh"],
+}
+
+
+def trigrams(text):
+    # same as jobs.services.locations.trigrams
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def seed_locations(apps, schema_editor):
+    Location = apps.get_model("jobs", "Location")
+    LocationAlias = apps.get_model("jobs", "LocationAlias")
+    LocationGram = apps.get_model("jobs", "LocationGram")
+
+    for name, aliases in SEED_LOCATIONS.items():
+        location, _ = Location.objects.get_or_create(key=name.lower(), defaults={"name": name})
+
+        for alias in [name.lower()] + aliases:
+            alias, created = LocationAlias.objects.get_or_create(
+                alias=alias, defaults={"location": location}
+            )
+            if created:
+                LocationGram.objects.bulk_create(
+                    [LocationGram(gram=gram, alias=alias) for gram in trigrams(alias.alias)]
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_job_expired_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobLocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='location_links', to='jobs.job')),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_links', to='jobs.location')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='location_tags',
+            field=models.ManyToManyField(blank=True, related_name='jobs', through='jobs.JobLocation', to='jobs.location'),
+        ),
+        migrations.CreateModel(
+            name='LocationAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='jobs.location')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LocationGram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gram', models.CharField(max_length=3)),
+                ('alias', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='grams', to='jobs.locationalias')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='joblocation',
+            index=models.Index(fields=['location', 'job'], name='jobs_jobloc_locatio_392c01_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='joblocation',
+            unique_together={('job', 'location')},
+        ),
+        migrations.AddIndex(
+            model_name='locationgram',
+            index=models.Index(fields=['gram', 'alias'], name='jobs_locati_gram_bcab55_idx'),
+        ),
+        migrations.RunPython(seed_locations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0013_location_gazetteer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('location', models.CharField(blank=True, max_length=100)),
+                ('skills', models.CharField(blank=True, max_length=255)),
+                ('skill_count', models.PositiveIntegerField(default=0)),
+                ('job_type', models.CharField(blank=True, choices=[('FT', 'Full-time'), ('IN', 'Internship'), ('CT', 'Contract')], max_length=2)),
+                ('experience', models.PositiveIntegerField(blank=True, null=True)),
+                ('query', models.CharField(blank=True, max_length=500)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_notified_at', models.DateTimeField(blank=True, null=True)),
+                ('location_tag', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to='jobs.location')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='jobs.savedsearch')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_search_links', to='jobs.skill')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='savedsearch',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='saved_searches', through='jobs.SavedSearchSkill', to='jobs.skill'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearchskill',
+            index=models.Index(fields=['skill', 'saved_search'], name='jobs_saveds_skill_i_30c6de_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='savedsearchskill',
+            unique_together={('saved_search', 'skill')},
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['location_tag'], name='savedsearch_location_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-18 14:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0017_job_import'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='jobs.job'),
+        ),
+        migrations.CreateModel(
+            name='JobSignature',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='jobs.job')),
+                ('simhash', models.BigIntegerField()),
+                ('band0', models.PositiveIntegerField()),
+                ('band1', models.PositiveIntegerField()),
+                ('band2', models.PositiveIntegerField()),
+                ('band3', models.PositiveIntegerField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['band0'], name='jobs_jobsig_band0_3deb6e_idx'), models.Index(fields=['band1'], name='jobs_jobsig_band1_ecbd26_idx'), models.Index(fields=['band2'], name='jobs_jobsig_band2_f81fd8_idx'), models.Index(fields=['band3'], name='jobs_jobsig_band3_0b6ddb_idx')],
+            },
+        ),
+    ]
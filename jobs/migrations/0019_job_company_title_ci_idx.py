@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-18 16:20
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0018_job_near_duplicates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(django.db.models.functions.text.Lower('company_name'), django.db.models.functions.text.Lower('title'), name='job_company_title_ci_idx'),
+        ),
+    ]
@@ -1,7 +1,33 @@
 from django.db import models
+from django.db.models.functions import Lower, Substr
 from django.conf import settings
 
 
+# what list pages render (search, saved jobs, applications, home) —
+# everything except the multi-KB description
+JOB_CARD_FIELDS = (
+    "id", "title", "company_name", "location",
+    "experience_min", "experience_max", "job_type", "visibility",
+    "tag_fresher", "deadline", "status", "created_by", "created_at",
+)
+
+EXCERPT_LENGTH = 160
+
+
+class JobQuerySet(models.QuerySet):
+
+    def cards(self):
+        """ Slim rows for list templates: card fields + `excerpt`. """
+        return self.only(*JOB_CARD_FIELDS).annotate(
+            excerpt=Substr("description", 1, EXCERPT_LENGTH)
+        )
+
+
+def job_card_fields(relation):
+    """ JOB_CARD_FIELDS through a FK, for .only() on SavedJob / JobApplication. """
+    return [f"{relation}__{field}" for field in JOB_CARD_FIELDS]
+
+
 class Job(models.Model):
 
     JOB_TYPE_CHOICES = [
@@ -14,6 +40,7 @@ class Job(models.Model):
         ('PENDING', 'Pending Approval'),
         ('PUBLISHED', 'Published'),
         ('REJECTED', 'Rejected'),
+        ('EXPIRED', 'Expired'),     # past deadline (manage.py expire_jobs)
     ]
 
     VISIBILITY_CHOICES = [
@@ -43,6 +70,22 @@ class Job(models.Model):
 
     description = models.TextField()
     skills = models.CharField(max_length=255)
+
+    # normalized copy of `skills` (JobSkill rows)
+    skill_tags = models.ManyToManyField(
+        "Skill",
+        through="JobSkill",
+        related_name="jobs",
+        blank=True
+    )
+
+    # gazetteer locations found in `location` (JobLocation rows)
+    location_tags = models.ManyToManyField(
+        "Location",
+        through="JobLocation",
+        related_name="jobs",
+        blank=True
+    )
     deadline = models.DateField()
 
     # ✅ Fresher tag (admin-safe)
@@ -60,10 +103,47 @@ class Job(models.Model):
         related_name="jobs_created"
     )
 
+    # near-duplicate of an older job (jobs.services.dedupe); hidden from listings
+    duplicate_of = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="duplicates"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
+    # bumped on every save — cache version of the job detail page
+    # (bulk .update() calls must set it themselves)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # admin counts + newest-first listings per status
+            models.Index(fields=["status", "-created_at"], name="job_status_created_idx"),
+            # published jobs a plan can apply to
+            models.Index(fields=["status", "visibility"], name="job_status_visibility_idx"),
+            # public listing / search (only published rows are indexed)
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status="PUBLISHED"),
+                name="job_published_created_idx",
+            ),
+            # deadline sweeper + live-job filter
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(status="PUBLISHED"),
+                name="job_published_deadline_idx",
+            ),
+            # import de-duplication (jobs.services.job_import.existing_jobs)
+            models.Index(
+                Lower("company_name"), Lower("title"),
+                name="job_company_title_ci_idx",
+            ),
+        ]
+
+    objects = JobQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.title} - {self.company_name}"
@@ -127,7 +207,418 @@ class JobApplication(models.Model):
     class Meta:
         unique_together = ("user", "job")
         ordering = ["-applied_at"]
+        indexes = [
+            # monthly quota + "my applications"
+            models.Index(fields=["user", "-applied_at"], name="jobapp_user_applied_idx"),
+            # admin dashboard counters
+            models.Index(fields=["status"], name="jobapp_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} applied for {self.job}"
 
+
+# =========================
+# Monthly application quota
+# =========================
+class ApplicationQuota(models.Model):
+    """
+    Applications used per user per month (jobs.services.quota).
+    Incremented in the same transaction as the JobApplication insert;
+    `manage.py reconcile_application_quota` rebuilds it from the rows.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="application_quotas"
+    )
+    period = models.DateField()     # first day of the month (local time)
+    used = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("user", "period")
+        ordering = ["-period"]
+
+    def __str__(self):
+        return f"{self.user} {self.period:%Y-%m}: {self.used}"
+
+
+
+# =========================
+# Skill taxonomy
+# =========================
+class Skill(models.Model):
+    # normalized form ("python", "machine learning") — see jobs.services.skills
+    key = models.CharField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ["name"]
+
+    def save(self, *args, **kwargs):
+        self.key = " ".join((self.key or self.name).lower().split())
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    # "py", "python3" → python
+    alias = models.CharField(max_length=100, unique=True)
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name="aliases"
+    )
+
+    def save(self, *args, **kwargs):
+        self.alias = " ".join(self.alias.lower().split())
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.alias} → {self.skill}"
+
+
+class JobSkill(models.Model):
+    """
+    Inverted index skill → jobs.
+    Rebuilt from Job.skills by jobs.signals (and backfill_skills).
+    """
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="skill_links"
+    )
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name="job_links"
+    )
+
+    class Meta:
+        unique_together = ("job", "skill")
+        indexes = [
+            models.Index(fields=["skill", "job"]),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} → {self.skill}"
+
+
+class ProfileSkill(models.Model):
+    profile = models.ForeignKey(
+        "accounts.Profile",
+        on_delete=models.CASCADE,
+        related_name="skill_links"
+    )
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name="profile_links"
+    )
+
+    class Meta:
+        unique_together = ("profile", "skill")
+
+    def __str__(self):
+        return f"{self.profile_id} → {self.skill}"
+
+
+# =========================
+# Location gazetteer
+# =========================
+class Location(models.Model):
+    # normalized form ("bengaluru") — see jobs.services.locations
+    key = models.CharField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ["name"]
+
+    def save(self, *args, **kwargs):
+        self.key = " ".join((self.key or self.name).lower().split())
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+
+class LocationAlias(models.Model):
+    # "bangalore", "blr" → Bengaluru (the canonical key is an alias too)
+    alias = models.CharField(max_length=100, unique=True)
+    location = models.ForeignKey(
+        Location,
+        on_delete=models.CASCADE,
+        related_name="aliases"
+    )
+
+    def save(self, *args, **kwargs):
+        self.alias = " ".join(self.alias.lower().split())
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.alias} → {self.location}"
+
+
+class LocationGram(models.Model):
+    """
+    Trigram index over LocationAlias.alias, for typo-tolerant lookup
+    ("chenai" → chennai). Maintained by jobs.services.locations.
+    """
+    gram = models.CharField(max_length=3)
+    alias = models.ForeignKey(
+        LocationAlias,
+        on_delete=models.CASCADE,
+        related_name="grams"
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["gram", "alias"]),
+        ]
+
+
+class JobLocation(models.Model):
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="location_links"
+    )
+    location = models.ForeignKey(
+        Location,
+        on_delete=models.CASCADE,
+        related_name="job_links"
+    )
+
+    class Meta:
+        unique_together = ("job", "location")
+        indexes = [
+            models.Index(fields=["location", "job"]),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} → {self.location}"
+
+
+# =========================
+# Near-duplicate index
+# =========================
+class JobSignature(models.Model):
+    """
+    64-bit SimHash of a job's title / company / description, split into
+    four 16-bit bands. Jobs within Hamming distance 3 share at least one
+    band exactly, so a lookup is four indexed equality probes.
+    """
+    job = models.OneToOneField(
+        Job,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="signature"
+    )
+    simhash = models.BigIntegerField()      # signed view of the 64 bits
+    band0 = models.PositiveIntegerField()
+    band1 = models.PositiveIntegerField()
+    band2 = models.PositiveIntegerField()
+    band3 = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["band0"]),
+            models.Index(fields=["band1"]),
+            models.Index(fields=["band2"]),
+            models.Index(fields=["band3"]),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id}: {self.simhash & (2 ** 64 - 1):016x}"
+
+
+# =========================
+# Precomputed recommendations
+# =========================
+class JobRecommendation(models.Model):
+    """
+    Top-N scored jobs per candidate (jobs.services.recommendations).
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="job_recommendations"
+    )
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="recommendations"
+    )
+    score = models.FloatField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("user", "job")
+        ordering = ["-score"]
+        indexes = [
+            models.Index(fields=["user", "-score"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user} → {self.job} ({self.score:.1f})"
+
+
+# =========================
+# Saved search alerts
+# =========================
+class SavedSearch(models.Model):
+    """
+    A candidate's stored search. New jobs are matched against it once,
+    when they are published (jobs.services.alerts), instead of the
+    candidate re-running the search.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="saved_searches"
+    )
+    name = models.CharField(max_length=100)
+
+    # indexed predicates (the percolator side)
+    location = models.CharField(max_length=100, blank=True)
+    location_tag = models.ForeignKey(
+        Location,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="saved_searches"
+    )
+    skills = models.CharField(max_length=255, blank=True)
+    skill_tags = models.ManyToManyField(
+        Skill,
+        through="SavedSearchSkill",
+        related_name="saved_searches",
+        blank=True
+    )
+    skill_count = models.PositiveIntegerField(default=0)
+
+    # checked on the narrowed candidates
+    job_type = models.CharField(max_length=2, choices=Job.JOB_TYPE_CHOICES, blank=True)
+    experience = models.PositiveIntegerField(null=True, blank=True)
+    query = models.CharField(max_length=500, blank=True)    # search GET params
+
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_notified_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["location_tag"],
+                condition=models.Q(is_active=True),
+                name="savedsearch_location_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.name}"
+
+
+class SavedSearchSkill(models.Model):
+    """ Inverted index skill → saved searches. """
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        on_delete=models.CASCADE,
+        related_name="skill_links"
+    )
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name="saved_search_links"
+    )
+
+    class Meta:
+        unique_together = ("saved_search", "skill")
+        indexes = [
+            models.Index(fields=["skill", "saved_search"]),
+        ]
+
+    def __str__(self):
+        return f"{self.saved_search_id} → {self.skill}"
+
+
+# =========================
+# Moderation audit
+# =========================
+class JobModeration(models.Model):
+    """ One row per approve / reject (written in bulk by jobs.services.moderation). """
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="moderations"
+    )
+    moderator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="job_moderations"
+    )
+    from_status = models.CharField(max_length=10, choices=Job.STATUS_CHOICES)
+    to_status = models.CharField(max_length=10, choices=Job.STATUS_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["job", "-created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id}: {self.from_status} → {self.to_status}"
+
+
+# =========================
+# Bulk import (partner feeds)
+# =========================
+class JobImport(models.Model):
+    """
+    One uploaded feed file. Counters are updated after every chunk by
+    jobs.tasks.run_job_import, so the admin page shows progress.
+    """
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    file = models.FileField(upload_to="job_imports/")
+    publish = models.BooleanField(
+        default=False,
+        help_text="Publish imported jobs directly instead of queueing them for review"
+    )
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    processed = models.PositiveIntegerField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    duplicates = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)    # [{"row", "error"}], capped
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="job_imports"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.file.name} ({self.status})"
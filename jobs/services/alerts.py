@@ -0,0 +1,182 @@
+"""
+Saved search alerts.
+
+Candidates save a search (location / skills / job type / experience +
+the facet params) instead of re-running it. When a job is published,
+notify_for_job() runs ONCE for that job, percolator-style: the job's
+skill ids and location ids are looked up in the reverse indexes
+(SavedSearchSkill, SavedSearch.location_tag) to find the few searches
+that could match, the remaining predicates are checked on those, and
+one Notification per candidate is sent in a single bulk insert.
+
+Only jobs the listings show (jobs.utils.listed_jobs: published, before
+the deadline, not a near-duplicate) trigger alerts. A saved location is
+kept as typed, and linked to the gazetteer only when it is an alias —
+no partial or fuzzy guess is stored.
+"""
+from django.db import transaction
+from django.db.models import Q
+from django.http import QueryDict
+from django.utils import timezone
+
+from accounts.models import Notification
+from accounts.services.notifications import send
+from jobs.models import Job, JobLocation, JobSkill, SavedSearch, SavedSearchSkill
+from jobs.services.facets import apply_facet_filters
+from jobs.services.locations import alias_location
+from jobs.services.skills import parse_skills, resolve_skill_ids
+from jobs.utils import listed_jobs
+
+
+MAX_SAVED_SEARCHES = 10     # per candidate
+
+# GET params kept in SavedSearch.query (re-run link + facet predicates)
+SEARCH_PARAMS = (
+    "location", "skills", "job_type", "exp",
+    "visibility", "fresher", "company", "exp_band",
+)
+
+
+# -------------------------------------------------
+# SAVE
+# -------------------------------------------------
+def create_saved_search(user, params, name=""):
+    """
+    SavedSearch from the search page GET params.
+    Returns (saved_search, error_message).
+    """
+    if user.saved_searches.count() >= MAX_SAVED_SEARCHES:
+        return None, f"You can keep up to {MAX_SAVED_SEARCHES} saved searches."
+
+    query = QueryDict(mutable=True)
+    for key in SEARCH_PARAMS:
+        value = (params.get(key) or "").strip()
+        if value:
+            query[key] = value
+
+    location = query.get("location", "")
+    location_id = alias_location(location) if location else None
+    if location and location_id is None:
+        return None, "We don't know that location yet — try the city name."
+
+    skill_ids = set(resolve_skill_ids(parse_skills(query.get("skills", "")), create=False).values())
+    if query.get("skills") and not skill_ids:
+        return None, "None of those skills are listed on any job yet."
+
+    # alerts are driven by the location / skill indexes
+    if not location_id and not skill_ids:
+        return None, "Add a location or skills to save this search."
+
+    exp = query.get("exp")
+    experience = int(exp) if exp and exp.isdigit() else None
+
+    job_type = query.get("job_type", "")
+    if job_type not in ("FT", "IN", "CT"):
+        job_type = ""
+
+    with transaction.atomic():
+        saved = SavedSearch.objects.create(
+            user=user,
+            name=(name or "").strip()[:100] or _default_name(query),
+            location=location[:100],
+            location_tag_id=location_id,
+            skills=query.get("skills", "")[:255],
+            skill_count=len(skill_ids),
+            job_type=job_type,
+            experience=experience,
+            query=query.urlencode()[:500],
+        )
+        SavedSearchSkill.objects.bulk_create(
+            [SavedSearchSkill(saved_search=saved, skill_id=s) for s in skill_ids]
+        )
+
+    return saved, None
+
+
+def _default_name(query):
+    parts = [query.get("skills"), query.get("location")]
+    return " in ".join(p for p in parts if p)[:100] or "My search"
+
+
+# -------------------------------------------------
+# MATCH (once per published job)
+# -------------------------------------------------
+def matching_searches(job):
+    """
+    Active saved searches the job satisfies. Only searches reachable
+    through the job's skills or locations are ever loaded.
+    """
+    skill_ids = list(JobSkill.objects.filter(job=job).values_list("skill_id", flat=True))
+    location_ids = list(JobLocation.objects.filter(job=job).values_list("location_id", flat=True))
+
+    by_skill = SavedSearchSkill.objects.filter(skill_id__in=skill_ids).values("saved_search_id")
+
+    candidates = (
+        SavedSearch.objects
+        .filter(is_active=True)
+        .filter(Q(id__in=by_skill) | Q(location_tag_id__in=location_ids))
+        # every indexed predicate the search has must hold
+        .filter(Q(skill_count=0) | Q(id__in=by_skill))
+        .filter(Q(location_tag__isnull=True) | Q(location_tag_id__in=location_ids))
+        .filter(Q(job_type="") | Q(job_type=job.job_type))
+        .filter(
+            Q(experience__isnull=True)
+            | Q(experience__gte=job.experience_min, experience__lte=job.experience_max)
+        )
+        .exclude(user_id=job.created_by_id)
+        .only("id", "user_id", "name", "query")
+    )
+
+    # searches saved from the same page share a query string
+    facet_ok = {}
+    matches = []
+    for saved in candidates.iterator(chunk_size=500):
+        if saved.query not in facet_ok:
+            facet_ok[saved.query] = _facets_match(job, saved.query)
+        if facet_ok[saved.query]:
+            matches.append(saved)
+    return matches
+
+
+def _facets_match(job, query):
+    # visibility / fresher / company / exp_band, same rules as the search page
+    params = QueryDict(query)
+    if not any(params.get(k) for k in ("visibility", "fresher", "company", "exp_band")):
+        return True
+    return apply_facet_filters(Job.objects.filter(id=job.id), params).exists()
+
+
+def notify_for_job(job):
+    """ One notification per candidate with a matching search. Returns the count. """
+    # same rule as the listings: expired / duplicate jobs alert nobody
+    if not listed_jobs().filter(pk=job.pk).exists():
+        return 0
+
+    matches = matching_searches(job)
+    if not matches:
+        return 0
+
+    by_user = {}
+    for saved in matches:
+        by_user.setdefault(saved.user_id, []).append(saved.name)
+
+    send(
+        [
+            Notification(
+                user_id=user_id,
+                type=Notification.JOB,
+                title="New job for your saved search",
+                message=(
+                    f"{job.title} at {job.company_name} ({job.location}) "
+                    f"matches: {', '.join(names)}"
+                ),
+            )
+            for user_id, names in by_user.items()
+        ]
+    )
+
+    SavedSearch.objects.filter(id__in=[s.id for s in matches]).update(
+        last_notified_at=timezone.now()
+    )
+
+    return len(by_user)
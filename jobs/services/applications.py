@@ -0,0 +1,209 @@
+"""
+Apply pipeline.
+
+One short write transaction per application:
+    lock quota counter → insert JobApplication → increment counter
+Everything else (admin alert, saved-job cleanup) is a jobs.tasks task
+enqueued after commit. bulk_apply / bulk_save do the same for a list of
+job ids with one insert each.
+"""
+from functools import partial
+
+from django.db import transaction
+
+from jobs.models import Job, JobApplication, SavedJob
+from jobs.services.applied import add_applied, applied_job_ids
+from jobs.services.quota import can_apply_quota, record_application
+from jobs.tasks import after_application, after_bulk_application
+from jobs.utils import allowed_visibility, can_user_apply, live_jobs
+
+
+# apply_to_job() outcomes
+APPLIED = "APPLIED"
+ALREADY_APPLIED = "ALREADY_APPLIED"
+PROFILE_INCOMPLETE = "PROFILE_INCOMPLETE"
+QUOTA_EXCEEDED = "QUOTA_EXCEEDED"
+PLAN_REQUIRED = "PLAN_REQUIRED"
+NOT_FOUND = "NOT_FOUND"
+
+# bulk_save() outcomes
+SAVED = "SAVED"
+ALREADY_SAVED = "ALREADY_SAVED"
+
+BULK_MAX = 50    # job ids per batch request
+
+
+def profile_complete(user):
+    profile = getattr(user, "profile", None)
+    return profile is not None and profile.completion_percentage() >= 100
+
+
+def apply_to_job(user, job, check_profile=True):
+    """
+    Returns (outcome, info) where info is the JobApplication for
+    APPLIED (and for ALREADY_APPLIED unless the cached applied set
+    answered first) and the monthly limit for QUOTA_EXCEEDED.
+
+    `job` may be a Job or an id; only live (published, not expired)
+    jobs can be applied to.
+    """
+    job_id = job.pk if isinstance(job, Job) else job
+
+    # cached applied-id set: repeat clicks never reach the DB
+    if job_id in applied_job_ids(user):
+        return ALREADY_APPLIED, None
+
+    job = live_jobs().filter(id=job_id).first()
+    if job is None:
+        return NOT_FOUND, None
+
+    # read-only checks — outside the transaction
+    if check_profile and not profile_complete(user):
+        return PROFILE_INCOMPLETE, None
+
+    if not can_user_apply(user, job):
+        return PLAN_REQUIRED, job.visibility
+
+    with transaction.atomic():
+        # locks this month's counter row until commit (no overshoot)
+        allowed, used, limit = can_apply_quota(user, lock=True)
+        if not allowed:
+            return QUOTA_EXCEEDED, limit
+
+        application, created = JobApplication.objects.get_or_create(
+            user=user,
+            job=job
+        )
+        if not created:
+            return ALREADY_APPLIED, application
+
+        record_application(user)
+
+        transaction.on_commit(partial(after_application.enqueue, application.id))
+
+    return APPLIED, application
+
+
+# -------------------------------------------------
+# BULK
+# -------------------------------------------------
+def clean_job_ids(job_ids):
+    """ De-duplicated ints, request order kept, capped at BULK_MAX. """
+    ids = []
+    for raw in job_ids or []:
+        try:
+            job_id = int(raw)
+        except (TypeError, ValueError):
+            continue
+        if job_id not in ids:
+            ids.append(job_id)
+    return ids[:BULK_MAX]
+
+
+def bulk_apply(user, job_ids):
+    """
+    Apply to many jobs at once: one quota lock, one bulk insert, one
+    counter update, one aggregated admin alert (post-commit).
+
+    Returns {job_id: outcome}. When the quota runs out part-way, the
+    first jobs in request order get the remaining slots.
+    """
+    job_ids = clean_job_ids(job_ids)
+    if not job_ids:
+        return {}
+
+    if not profile_complete(user):
+        return {job_id: PROFILE_INCOMPLETE for job_id in job_ids}
+
+    visibility = dict(
+        live_jobs().filter(id__in=job_ids)
+        .values_list("id", "visibility")
+    )
+    allowed = allowed_visibility(user)
+
+    results = {}
+    wanted = []
+    for job_id in job_ids:
+        if job_id not in visibility:
+            results[job_id] = NOT_FOUND
+        elif visibility[job_id] not in allowed:
+            results[job_id] = PLAN_REQUIRED
+        else:
+            wanted.append(job_id)
+
+    if not wanted:
+        return results
+
+    with transaction.atomic():
+        _, used, limit = can_apply_quota(user, lock=True)
+
+        already = set(
+            JobApplication.objects.filter(user=user, job_id__in=wanted)
+            .values_list("job_id", flat=True)
+        )
+        new = [job_id for job_id in wanted if job_id not in already]
+
+        slots = len(new) if limit is None else max(limit - used, 0)
+        to_create, over_quota = new[:slots], new[slots:]
+
+        JobApplication.objects.bulk_create(
+            [JobApplication(user=user, job_id=job_id) for job_id in to_create],
+            ignore_conflicts=True
+        )
+
+        # ignore_conflicts drops rows silently: count what is there now
+        # (none of these existed above, and the quota lock is still held)
+        inserted = set(
+            JobApplication.objects.filter(user=user, job_id__in=to_create)
+            .values_list("job_id", flat=True)
+        ) if to_create else set()
+        created = [job_id for job_id in to_create if job_id in inserted]
+
+        record_application(user, count=len(created))
+
+        if created:
+            transaction.on_commit(
+                partial(after_bulk_application.enqueue, user.id, created)
+            )
+            # bulk_create skips the JobApplication signals
+            transaction.on_commit(partial(add_applied, user.id, created))
+
+    for job_id in wanted:
+        if job_id in over_quota:
+            results[job_id] = QUOTA_EXCEEDED
+        elif job_id in inserted:
+            results[job_id] = APPLIED
+        else:
+            results[job_id] = ALREADY_APPLIED
+
+    return {job_id: results[job_id] for job_id in job_ids}
+
+
+def bulk_save(user, job_ids):
+    """ Save many published jobs in one insert. Returns {job_id: outcome}. """
+    job_ids = clean_job_ids(job_ids)
+    if not job_ids:
+        return {}
+
+    published = set(
+        live_jobs().filter(id__in=job_ids)
+        .values_list("id", flat=True)
+    )
+    already = set(
+        SavedJob.objects.filter(user=user, job_id__in=published)
+        .values_list("job_id", flat=True)
+    )
+
+    SavedJob.objects.bulk_create(
+        [SavedJob(user=user, job_id=job_id) for job_id in published - already],
+        ignore_conflicts=True
+    )
+
+    return {
+        job_id: (
+            NOT_FOUND if job_id not in published
+            else ALREADY_SAVED if job_id in already
+            else SAVED
+        )
+        for job_id in job_ids
+    }
@@ -0,0 +1,104 @@
+"""
+Per-user set of applied job ids, cached.
+
+One cache entry per candidate, shared by search, home, job detail and
+apply, so "has this candidate applied?" costs no JobApplication query.
+The set is stored compactly (sorted 64-bit ints as bytes) in the
+default cache. That has to be shared (REDIS_URL, see settings.CACHES)
+when several workers serve requests: with the per-process locmem
+fallback, an apply on one worker leaves the other workers' copies stale
+until APPLIED_TIMEOUT.
+
+Kept current by the JobApplication signals (apply, status change,
+delete) and by bulk_apply, which skips signals; a miss rebuilds it from
+the jobapp_user_applied_idx index.
+"""
+from array import array
+from bisect import bisect_left
+
+from django.core.cache import cache
+
+from jobs.models import JobApplication
+
+
+APPLIED_TIMEOUT = 60 * 60 * 24
+
+APPLIED_KEY = "applied_jobs:{}"
+
+
+class AppliedJobIds:
+    """ Immutable sorted int set; `job_id in ids` is a binary search. """
+
+    __slots__ = ("ids",)
+
+    def __init__(self, ids=()):
+        self.ids = array("q", sorted(set(ids)))
+
+    @classmethod
+    def from_bytes(cls, raw):
+        obj = cls()
+        obj.ids.frombytes(raw)
+        return obj
+
+    def to_bytes(self):
+        return self.ids.tobytes()
+
+    def __contains__(self, job_id):
+        i = bisect_left(self.ids, job_id)
+        return i < len(self.ids) and self.ids[i] == job_id
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+EMPTY = AppliedJobIds()
+
+
+# -------------------------------------------------
+# READ
+# -------------------------------------------------
+def _cached(user_id):
+    raw = cache.get(APPLIED_KEY.format(user_id))
+    return None if raw is None else AppliedJobIds.from_bytes(raw)
+
+
+def _store(user_id, ids):
+    cache.set(APPLIED_KEY.format(user_id), ids.to_bytes(), APPLIED_TIMEOUT)
+
+
+def applied_job_ids(user):
+    if not user.is_authenticated:
+        return EMPTY
+
+    ids = _cached(user.id)
+    if ids is None:
+        ids = AppliedJobIds(
+            JobApplication.objects.filter(user=user).values_list("job_id", flat=True)
+        )
+        _store(user.id, ids)
+    return ids
+
+
+# -------------------------------------------------
+# WRITE (after commit)
+# -------------------------------------------------
+def add_applied(user_id, job_ids):
+    ids = _cached(user_id)
+    if ids is None:
+        return  # rebuilt on next read
+    _store(user_id, AppliedJobIds([*ids, *job_ids]))
+
+
+def remove_applied(user_id, job_ids):
+    ids = _cached(user_id)
+    if ids is None:
+        return
+    gone = set(job_ids)
+    _store(user_id, AppliedJobIds(i for i in ids if i not in gone))
+
+
+def invalidate_applied(user_id):
+    cache.delete(APPLIED_KEY.format(user_id))
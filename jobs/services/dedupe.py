@@ -0,0 +1,217 @@
+"""
+Near-duplicate job detection.
+
+Every job gets a 64-bit SimHash over its title, company and description
+(JobSignature). Two postings of the same job — re-typed, re-formatted,
+a word changed — end up a few bits apart. The 64 bits are split into
+four 16-bit bands (LSH): any two signatures within MAX_DISTANCE (3) bits
+agree exactly on at least one band, so candidates come from four
+indexed equality lookups, whatever the table size, and only those few
+are compared bit by bit.
+
+create_job (through the Job signal) flags a new near-duplicate with
+Job.duplicate_of; bulk imports skip them; backfill_job_signatures
+indexes and flags existing rows. When an original expires or is
+rejected, release_duplicates re-points its copies to the next older
+active match, or clears duplicate_of so the oldest copy is listed.
+"""
+import hashlib
+import re
+from collections import Counter
+
+from django.db.models import Q
+
+from jobs.models import Job, JobSignature
+
+
+MAX_DISTANCE = 3        # bits; 4 bands of 16 → pigeonhole guarantees a band hit
+BANDS = 4
+BAND_BITS = 16
+
+# title / company decide *which* job it is, so they outweigh the description
+TITLE_WEIGHT = 3
+COMPANY_WEIGHT = 3
+
+ACTIVE_STATUSES = ("PENDING", "PUBLISHED")
+
+MASK = (1 << 64) - 1
+
+
+# -------------------------------------------------
+# SIGNATURES
+# -------------------------------------------------
+def _tokens(text):
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+
+def _features(title, company, description):
+    features = Counter()
+
+    for token in _tokens(title):
+        features["t:" + token] += TITLE_WEIGHT
+    for token in _tokens(company):
+        features["c:" + token] += COMPANY_WEIGHT
+
+    words = _tokens(description)
+    for a, b in zip(words, words[1:]):      # word bigrams keep some order
+        features[a + " " + b] += 1
+    if len(words) == 1:
+        features[words[0]] += 1
+
+    return features
+
+
+def _hash64(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(title, company, description):
+    totals = [0] * 64
+    for feature, weight in _features(title, company, description).items():
+        h = _hash64(feature)
+        for bit in range(64):
+            totals[bit] += weight if h >> bit & 1 else -weight
+
+    return sum(1 << bit for bit in range(64) if totals[bit] > 0)
+
+
+def bands(value):
+    return [(value >> (i * BAND_BITS)) & ((1 << BAND_BITS) - 1) for i in range(BANDS)]
+
+
+def distance(a, b):
+    return bin((a ^ b) & MASK).count("1")
+
+
+def _signed(value):
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def job_simhash(job):
+    return simhash(job.title, job.company_name, job.description)
+
+
+def signature_row(job, value=None):
+    value = job_simhash(job) if value is None else value
+    b = bands(value)
+    return JobSignature(
+        job_id=job.id, simhash=_signed(value),
+        band0=b[0], band1=b[1], band2=b[2], band3=b[3],
+    )
+
+
+# -------------------------------------------------
+# LOOKUP
+# -------------------------------------------------
+def candidates(values, statuses=ACTIVE_STATUSES):
+    """
+    [(job_id, simhash)] sharing a band with any of `values`, among
+    jobs in `statuses`. Two indexed queries.
+    """
+    if not values:
+        return []
+
+    per_band = [set() for _ in range(BANDS)]
+    for value in values:
+        for i, band in enumerate(bands(value)):
+            per_band[i].add(band)
+
+    match = Q()
+    for i, band_values in enumerate(per_band):
+        match |= Q(**{f"band{i}__in": band_values})
+
+    # bands first (MULTI-INDEX OR on the band indexes), then the status
+    # of the few hits by primary key — a join would let the planner
+    # start from the jobs table instead
+    rows = list(JobSignature.objects.filter(match).values_list("job_id", "simhash"))
+    if not rows:
+        return []
+
+    active = set(
+        Job.objects.filter(id__in=[job_id for job_id, _ in rows], status__in=statuses)
+        .values_list("id", flat=True)
+    )
+    return [(job_id, value & MASK) for job_id, value in rows if job_id in active]
+
+
+def nearest(value, rows, before_id=None):
+    """ Closest job id within MAX_DISTANCE (older than before_id if given), or None. """
+    best, best_distance = None, MAX_DISTANCE + 1
+    for job_id, other in rows:
+        if before_id is not None and job_id >= before_id:
+            continue
+        d = distance(value, other)
+        if d < best_distance or (d == best_distance and best is not None and job_id < best):
+            best, best_distance = job_id, d
+    return best
+
+
+def find_duplicate(title, company, description, exclude_id=None):
+    value = simhash(title, company, description)
+    rows = [row for row in candidates([value]) if row[0] != exclude_id]
+    return nearest(value, rows)
+
+
+# -------------------------------------------------
+# WRITE
+# -------------------------------------------------
+def index_job(job, created=False):
+    """
+    Upsert the job's signature; a newly created job that is a near
+    duplicate of an older active one gets duplicate_of set.
+    Returns the original's id (or None).
+    """
+    value = job_simhash(job)
+    JobSignature.objects.bulk_create(
+        [signature_row(job, value)],
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["simhash", "band0", "band1", "band2", "band3"],
+    )
+
+    if not created:
+        return None
+
+    original = nearest(value, candidates([value]), before_id=job.id)
+    if original:
+        Job.objects.filter(id=job.id).update(duplicate_of_id=original)
+        job.duplicate_of_id = original
+    return original
+
+
+def release_duplicates(original_ids):
+    """
+    Active jobs flagged as duplicates of `original_ids` (which just left
+    ACTIVE_STATUSES): re-point each to its nearest older active match,
+    or clear duplicate_of. Returns the ids that are no longer duplicates.
+    """
+    rows = list(
+        Job.objects.filter(duplicate_of_id__in=original_ids, status__in=ACTIVE_STATUSES)
+        .values_list("id", "signature__simhash")
+    )
+    if not rows:
+        return []
+
+    values = {job_id: value & MASK for job_id, value in rows if value is not None}
+    pool = candidates(list(values.values()))
+
+    moved = {}
+    for job_id, _ in rows:
+        original = nearest(values[job_id], pool, before_id=job_id) if job_id in values else None
+        moved.setdefault(original, []).append(job_id)
+
+    for original, job_ids in moved.items():
+        Job.objects.filter(id__in=job_ids).update(duplicate_of_id=original)
+
+    return moved.get(None, [])
+
+
+def index_jobs(jobs):
+    """ Signatures for many jobs (imports / backfill) in one insert. """
+    JobSignature.objects.bulk_create(
+        [signature_row(job) for job in jobs],
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["simhash", "band0", "band1", "band2", "band3"],
+    )
@@ -0,0 +1,48 @@
+"""
+Job deadline expiry.
+
+PUBLISHED jobs whose deadline has passed move to EXPIRED in id batches
+(manage.py expire_jobs, run daily from cron). Bulk updates skip the
+post_save signals, so dependent rows and the job detail cache are
+cleaned up here explicitly, and near-duplicates of the expired jobs
+are released (jobs.tasks.release_duplicates).
+"""
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import Job, JobRecommendation
+from jobs.services.job_cache import invalidate_jobs
+from jobs.tasks import release_duplicates
+
+
+def due_jobs(today=None):
+    """ Published jobs past their deadline (served by job_published_deadline_idx). """
+    today = today or timezone.localdate()
+    return Job.objects.filter(status="PUBLISHED", deadline__lt=today)
+
+
+def expire_due_jobs(batch_size=500, today=None):
+    """ Returns the number of jobs moved to EXPIRED. """
+    total = 0
+
+    while True:
+        ids = list(
+            due_jobs(today).order_by("deadline", "id").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        with transaction.atomic():
+            updated = Job.objects.filter(id__in=ids, status="PUBLISHED").update(
+                status="EXPIRED", updated_at=timezone.now()
+            )
+            JobRecommendation.objects.filter(job_id__in=ids).delete()
+            transaction.on_commit(partial(release_duplicates.enqueue, ids))
+
+        invalidate_jobs(ids)
+
+        total += updated
+
+    return total
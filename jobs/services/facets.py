@@ -0,0 +1,161 @@
+"""
+Facets for job search.
+
+facet_counts() runs ONE grouped query over the filtered result set,
+grouped on the faceted columns, and rolls the rows up per facet in
+Python. There are at most one row per live job, and usually far fewer.
+Facet links toggle their own GET param and keep every other filter.
+
+The location facet uses its own `place` param, matched exactly
+(location__iexact) like company: the search box `location` goes through
+the gazetteer (jobs.services.locations), which would widen "Bangalore
+East" to every Bengaluru job and disagree with the facet's count.
+"""
+from django.db.models import Count, Q
+from django.http import QueryDict
+
+from jobs.models import Job
+
+
+# (key, label, min years, max years) — a job counts in every band its
+# experience_min..experience_max range overlaps
+EXPERIENCE_BANDS = [
+    ("0", "Fresher (0 yrs)", 0, 0),
+    ("1-3", "1–3 yrs", 1, 3),
+    ("4-6", "4–6 yrs", 4, 6),
+    ("7+", "7+ yrs", 7, None),
+]
+
+FACET_LIMIT = 10     # top locations / companies shown
+
+
+# -------------------------------------------------
+# FILTERS (location / job_type / exp are applied in the view)
+# -------------------------------------------------
+def apply_facet_filters(queryset, params):
+    visibility = params.get("visibility")
+    if visibility:
+        queryset = queryset.filter(visibility=visibility)
+
+    if params.get("fresher") == "1":
+        queryset = queryset.filter(tag_fresher=True)
+
+    place = (params.get("place") or "").strip()
+    if place:
+        queryset = queryset.filter(location__iexact=place)
+
+    company = (params.get("company") or "").strip()
+    if company:
+        queryset = queryset.filter(company_name__iexact=company)
+
+    band = next((b for b in EXPERIENCE_BANDS if b[0] == params.get("exp_band")), None)
+    if band:
+        _, _, low, high = band
+        overlap = Q(experience_max__gte=low)
+        if high is not None:
+            overlap &= Q(experience_min__lte=high)
+        queryset = queryset.filter(overlap)
+
+    return queryset
+
+
+# -------------------------------------------------
+# COUNTS
+# -------------------------------------------------
+def facet_counts(queryset, params=None):
+    """
+    {facet: [{"value", "label", "count", "selected", "query"}, ...]}
+    """
+    params = params if params is not None else QueryDict()
+
+    rows = (
+        queryset.order_by()
+        .values(
+            "location", "company_name", "job_type", "visibility",
+            "tag_fresher", "experience_min", "experience_max",
+        )
+        .annotate(n=Count("id"))
+    )
+
+    locations, companies = {}, {}
+    job_types, visibility = {}, {}
+    fresher = 0
+    bands = dict.fromkeys((b[0] for b in EXPERIENCE_BANDS), 0)
+
+    for row in rows:
+        n = row["n"]
+
+        _bump(locations, row["location"], n)
+        _bump(companies, row["company_name"], n)
+
+        job_types[row["job_type"]] = job_types.get(row["job_type"], 0) + n
+        visibility[row["visibility"]] = visibility.get(row["visibility"], 0) + n
+
+        if row["tag_fresher"]:
+            fresher += n
+
+        for key, _, low, high in EXPERIENCE_BANDS:
+            if row["experience_max"] >= low and (high is None or row["experience_min"] <= high):
+                bands[key] += n
+
+    job_type_labels = dict(Job.JOB_TYPE_CHOICES)
+    visibility_labels = dict(Job.VISIBILITY_CHOICES)
+
+    return {
+        "location": _options(params, "place", _top(locations)),
+        "company": _options(params, "company", _top(companies)),
+        "job_type": _options(params, "job_type", [
+            (value, job_type_labels.get(value, value), count)
+            for value, count in sorted(job_types.items(), key=lambda i: -i[1])
+        ]),
+        "visibility": _options(params, "visibility", [
+            (value, visibility_labels.get(value, value), count)
+            for value, count in sorted(visibility.items(), key=lambda i: -i[1])
+        ]),
+        "fresher": _options(params, "fresher", [("1", "Fresher friendly", fresher)] if fresher else []),
+        "exp_band": _options(params, "exp_band", [
+            (key, label, bands[key]) for key, label, _, _ in EXPERIENCE_BANDS if bands[key]
+        ]),
+    }
+
+
+def _bump(counts, raw, n):
+    # case-insensitive grouping, first spelling seen is shown
+    name = (raw or "").strip()
+    if not name:
+        return
+    key = name.lower()
+    label, total = counts.get(key, (name, 0))
+    counts[key] = (label, total + n)
+
+
+def _top(counts):
+    ranked = sorted(counts.values(), key=lambda item: (-item[1], item[0]))[:FACET_LIMIT]
+    return [(label, label, count) for label, count in ranked]
+
+
+def _options(params, param, values):
+    current = (params.get(param) or "").strip().lower()
+
+    options = []
+    for value, label, count in values:
+        selected = current == str(value).lower()
+        options.append({
+            "value": value,
+            "label": label,
+            "count": count,
+            "selected": selected,
+            # clicking a selected facet clears it
+            "query": _toggle(params, param, None if selected else value),
+        })
+    return options
+
+
+def _toggle(params, param, value):
+    query = params.copy()
+    for key in ("after", "before", "page"):
+        query.pop(key, None)
+    query.pop(param, None)
+    if value is not None:
+        query[param] = value
+    return query.urlencode()
@@ -0,0 +1,73 @@
+"""
+Job detail cache.
+
+The job page body is the same for every candidate, so the row is cached
+as a dict under  job_detail:<id>:<updated_at>  with a small pointer key
+job_version:<id> → updated_at. A page view is then two cache reads and
+no query. Saves (edit / approve / reject) bump Job.updated_at and drop
+the pointer after commit; bulk updates call invalidate_jobs() directly.
+The rendered body ({% cache %} in jobs/job_detail.html) is keyed by the
+same version, for DETAIL_TIMEOUT too.
+
+Dropping the pointer only works across workers if the cache is shared
+(REDIS_URL, see settings.CACHES). With the per-process locmem fallback
+the other workers keep serving the old snapshot and fragment until
+DETAIL_TIMEOUT.
+
+The per-user part (applied / can apply / upgrade) is not cached here —
+see jobs.services.applied and jobs.utils.allowed_visibility.
+"""
+from django.core.cache import cache
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+DETAIL_TIMEOUT = 60 * 60
+
+VERSION_KEY = "job_version:{}"
+DETAIL_KEY = "job_detail:{}:{}"
+
+DETAIL_FIELDS = (
+    "id", "title", "company_name", "location",
+    "experience_min", "experience_max", "visibility", "job_type",
+    "description", "skills", "deadline", "tag_fresher", "status",
+    "updated_at",
+)
+
+
+def _version(updated_at):
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+def get_job_snapshot(job_id):
+    """ Cached dict of the job's display fields, or None if it doesn't exist. """
+    version = cache.get(VERSION_KEY.format(job_id))
+    if version is not None:
+        job = cache.get(DETAIL_KEY.format(job_id, version))
+        if job is not None:
+            return job
+
+    job = Job.objects.filter(id=job_id).values(*DETAIL_FIELDS).first()
+    if job is None:
+        return None
+
+    job["version"] = _version(job["updated_at"])
+    cache.set_many(
+        {
+            VERSION_KEY.format(job_id): job["version"],
+            DETAIL_KEY.format(job_id, job["version"]): job,
+        },
+        DETAIL_TIMEOUT
+    )
+    return job
+
+
+def is_live(job):
+    """ Same rule as jobs.utils.live_jobs(), on a snapshot. """
+    return job["status"] == "PUBLISHED" and job["deadline"] >= timezone.localdate()
+
+
+def invalidate_jobs(job_ids):
+    # the old detail keys are unreachable once the pointer is gone
+    cache.delete_many([VERSION_KEY.format(job_id) for job_id in job_ids])
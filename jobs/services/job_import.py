@@ -0,0 +1,324 @@
+"""
+Bulk job import (partner feeds).
+
+Rows are streamed from CSV / JSON-lines (or XLSX, if openpyxl is
+installed) one at a time, validated with the same rules as the
+create_job form (clean_job_data), de-duplicated on
+(company, title, location) and by SimHash (jobs.services.dedupe) against
+the file and the table, and inserted
+with bulk_create in chunks. bulk_create fires no post_save, so each
+chunk does the search index / skill / location work itself, and
+published jobs get one after_jobs_published task per chunk.
+
+Progress goes to a callback after every chunk (the JobImport row for
+admin uploads, stdout for manage.py import_jobs).
+"""
+import csv
+import datetime
+import io
+import json
+from functools import partial
+
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from jobs.models import Job, JobLocation, JobSkill
+from jobs.services import dedupe, search
+from jobs.services.locations import locations_for_text
+from jobs.services.skills import parse_skills, resolve_skill_ids
+from jobs.tasks import after_jobs_published
+
+
+CHUNK_SIZE = 500
+MAX_ERRORS = 1000    # per-row errors kept in the report
+
+FORMATS = ("csv", "jsonl", "xlsx")
+
+REQUIRED_FIELDS = ("title", "company", "location", "description", "skills", "deadline")
+
+TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+
+
+class ImportFormatError(Exception):
+    pass
+
+
+# a file that can't be read at all (vs. bad rows, which are reported)
+READ_ERRORS = (ImportFormatError, UnicodeDecodeError, csv.Error)
+
+
+# -------------------------------------------------
+# VALIDATION (shared with jobs.views.create_job)
+# -------------------------------------------------
+def clean_job_data(data):
+    """
+    Form / feed row (create_job field names) → (Job kwargs, None)
+    or (None, error message).
+    """
+    def value(key):
+        raw = data.get(key)
+        if isinstance(raw, float) and raw.is_integer():
+            raw = int(raw)      # spreadsheet numbers
+        return "" if raw is None else str(raw).strip()
+
+    missing = [key for key in REQUIRED_FIELDS if not value(key)]
+    if missing:
+        return None, f"Missing {', '.join(missing)}."
+
+    exp_min, exp_max = value("exp_min"), value("exp_max")
+    if not exp_min or not exp_max:
+        return None, "Experience range is required."
+
+    try:
+        exp_min = int(exp_min)
+        exp_max = int(exp_max)
+    except ValueError:
+        return None, "Experience must be numeric."
+
+    if exp_min < 0 or exp_max < exp_min:
+        return None, "Experience range is invalid."
+
+    job_type = value("job_type") or "FT"
+    if job_type not in dict(Job.JOB_TYPE_CHOICES):
+        return None, f"Unknown job type {job_type!r}."
+
+    visibility = value("visibility").upper() or "FREE"
+    if visibility not in dict(Job.VISIBILITY_CHOICES):
+        return None, f"Unknown visibility {visibility!r}."
+
+    try:
+        deadline = datetime.date.fromisoformat(value("deadline")[:10])
+    except ValueError:
+        return None, "Deadline must be a date (YYYY-MM-DD)."
+
+    return {
+        "title": value("title")[:200],
+        "company_name": value("company")[:200],
+        "location": value("location")[:100],
+        "experience_min": exp_min,
+        "experience_max": exp_max,
+        "job_type": job_type,
+        "description": value("description"),
+        "skills": value("skills")[:255],
+        "deadline": deadline,
+        "tag_fresher": value("fresher").lower() in TRUE_VALUES,
+        "visibility": visibility,
+    }, None
+
+
+def dedupe_key(fields):
+    return (
+        fields["company_name"].lower(),
+        fields["title"].lower(),
+        fields["location"].lower(),
+    )
+
+
+# -------------------------------------------------
+# STREAMING READERS → dicts
+# -------------------------------------------------
+def detect_format(filename):
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    if name.endswith(".xlsx"):
+        return "xlsx"
+    raise ImportFormatError("Use a .csv, .jsonl or .xlsx file.")
+
+
+def iter_rows(fileobj, fmt):
+    """ Rows from a binary file object, one at a time. """
+    if fmt == "csv":
+        text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+        for row in csv.DictReader(text):
+            yield row
+
+    elif fmt == "jsonl":
+        text = io.TextIOWrapper(fileobj, encoding="utf-8-sig")
+        for line in text:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield row if isinstance(row, dict) else {"__error__": "Not a JSON object."}
+
+    elif fmt == "xlsx":
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportFormatError("XLSX import needs openpyxl (pip install openpyxl).")
+
+        sheet = load_workbook(fileobj, read_only=True, data_only=True).active
+        rows = sheet.iter_rows(values_only=True)
+        header = [str(h or "").strip() for h in next(rows, ())]
+        for values in rows:
+            yield dict(zip(header, values))
+
+    else:
+        raise ImportFormatError(f"Unknown format {fmt!r}.")
+
+
+# -------------------------------------------------
+# IMPORT
+# -------------------------------------------------
+class ImportReport:
+    def __init__(self):
+        self.processed = 0
+        self.created = 0
+        self.duplicates = 0
+        self.error_count = 0
+        self.errors = []        # [{"row": n, "error": "..."}], capped
+
+    def add_error(self, row, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row, "error": message})
+
+
+def import_jobs(rows, created_by, publish=False, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    rows: iterable of dicts (create_job field names). Returns ImportReport.
+    `progress(report)` is called after every chunk.
+    """
+    report = ImportReport()
+    status = "PUBLISHED" if publish else "PENDING"
+    seen = set()
+    chunk = []
+
+    for row_number, row in enumerate(rows, start=1):
+        report.processed += 1
+
+        if row.get("__error__"):
+            report.add_error(row_number, row["__error__"])
+            continue
+
+        fields, error = clean_job_data(row)
+        if error:
+            report.add_error(row_number, error)
+            continue
+
+        key = dedupe_key(fields)
+        if key in seen:
+            report.duplicates += 1
+            continue
+        seen.add(key)
+
+        chunk.append((key, Job(created_by=created_by, status=status, **fields)))
+
+        if len(chunk) >= chunk_size:
+            _flush(chunk, report)
+            chunk = []
+            if progress:
+                progress(report)
+
+    if chunk:
+        _flush(chunk, report)
+    if progress:
+        progress(report)
+
+    return report
+
+
+def existing_jobs(companies, titles):
+    """ Jobs whose lower-cased company / title are in the sets (job_company_title_ci_idx). """
+    return Job.objects.annotate(
+        company_key=Lower("company_name"),
+        title_key=Lower("title"),
+    ).filter(
+        company_key__in=companies,
+        title_key__in=titles,
+    ).order_by()
+
+
+def _flush(chunk, report):
+    # drop rows already in the table (same company / title / location)
+    existing = {
+        (company.lower(), title.lower(), location.lower())
+        for company, title, location in existing_jobs(
+            {key[0] for key, _ in chunk},
+            {key[1] for key, _ in chunk},
+        ).values_list("company_name", "title", "location")
+    }
+    jobs = _drop_near_duplicates([job for key, job in chunk if key not in existing])
+    report.duplicates += len(chunk) - len(jobs)
+
+    if not jobs:
+        return
+
+    with transaction.atomic():
+        Job.objects.bulk_create(jobs)
+        ids = [job.id for job in jobs]
+
+        # what the Job post_save signals would have done, once per chunk
+        search.index_jobs(ids)
+        dedupe.index_jobs(jobs)
+        _link_skills(jobs)
+        _link_locations(jobs)
+
+        published = [job.id for job in jobs if job.status == "PUBLISHED"]
+        if published:
+            transaction.on_commit(partial(after_jobs_published.enqueue, published))
+
+    report.created += len(jobs)
+
+
+def _drop_near_duplicates(jobs):
+    """ Skip SimHash near-duplicates of active jobs and of earlier rows in the chunk. """
+    values = [dedupe.job_simhash(job) for job in jobs]
+    known = dedupe.candidates(values)
+
+    kept = []
+    seen = {}       # (band no., band value) → kept simhashes, same LSH idea in memory
+    for job, value in zip(jobs, values):
+        keys = list(enumerate(dedupe.bands(value)))
+        nearby = {other for key in keys for other in seen.get(key, ())}
+        if dedupe.nearest(value, known) or any(
+            dedupe.distance(value, other) <= dedupe.MAX_DISTANCE for other in nearby
+        ):
+            continue
+        kept.append(job)
+        for key in keys:
+            seen.setdefault(key, []).append(value)
+    return kept
+
+
+def _link_skills(jobs):
+    parsed_rows = [(job.id, parse_skills(job.skills)) for job in jobs]
+
+    all_skills = {}
+    for _, parsed in parsed_rows:
+        for key, name in parsed.items():
+            all_skills.setdefault(key, name)
+
+    skill_ids = resolve_skill_ids(all_skills)
+
+    JobSkill.objects.bulk_create(
+        [
+            JobSkill(job_id=job_id, skill_id=skill_ids[key])
+            for job_id, parsed in parsed_rows
+            for key in parsed
+            if key in skill_ids
+        ],
+        batch_size=1000,
+        ignore_conflicts=True
+    )
+
+
+def _link_locations(jobs):
+    resolved = {}
+    links = []
+
+    for job in jobs:
+        if job.location not in resolved:
+            resolved[job.location] = locations_for_text(job.location)
+        links.extend(
+            JobLocation(job_id=job.id, location_id=location_id)
+            for location_id in resolved[job.location]
+        )
+
+    JobLocation.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
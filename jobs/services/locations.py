@@ -0,0 +1,344 @@
+"""
+Location gazetteer.
+
+Location rows with aliases ("bangalore" → Bengaluru), plus:
+  - an Aho–Corasick automaton over every alias, built once per process
+    and rebuilt when the gazetteer changes (cache version key), to find
+    locations in free text in one pass (chatbot, Job.location)
+  - a trigram table (LocationGram) for typo-tolerant lookup
+
+Jobs are linked to the locations found in Job.location (JobLocation),
+so search filters on a location id instead of location__icontains.
+Only curated aliases link: an unknown place ("Hosur") stays unlinked
+and is found through the full-text location search instead, until it
+is added — in the admin, or for every town existing jobs name with
+`manage.py backfill_locations --add-places` (add_places).
+
+A search term resolves in this order: exact alias, an alias at the
+start of the text (Aho–Corasick), full-text search, and only when all
+of those miss, a close spelling of an alias (few edits, same first
+letter) — so "Mangalore" never becomes Bengaluru and "Navi Mumbai"
+never becomes Mumbai.
+"""
+import re
+import uuid
+from collections import deque
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from jobs.models import Location, LocationAlias, LocationGram, JobLocation
+from jobs.services.search import apply_search
+
+
+VERSION_KEY = "locations_version"
+
+FUZZY_CANDIDATES = 20       # aliases sharing the most trigrams
+FUZZY_MAX_EDITS = 2         # 1 for names shorter than FUZZY_LONG_NAME
+FUZZY_LONG_NAME = 8
+
+SEGMENT_SPLIT = r"[,/|;(]"
+PLACE_SPLIT = r"[/|;]"      # alternatives: "Chennai / Hosur"
+
+_matcher = None             # (version, LocationMatcher)
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+def normalize_location(text):
+    """ "  New-Delhi, India" → "new delhi india" """
+    return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).strip()
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bump_version():
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+# -------------------------------------------------
+# AHO–CORASICK
+# -------------------------------------------------
+class LocationMatcher:
+    """
+    Multi-pattern matcher over normalized aliases. find() is one pass
+    over the text, independent of the number of locations.
+    """
+
+    def __init__(self, patterns):
+        # patterns: {normalized alias: location_id}
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+
+        for pattern, location_id in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = nxt
+            self.out[node].append((len(pattern), location_id))
+
+        # failure links, breadth first
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+
+                state = self.fail[node]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+
+                target = self.goto[state].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def matches(self, text):
+        """
+        (start, location_id) in normalized-text order — whole words,
+        longest match wins, no overlaps.
+        """
+        text = normalize_location(text)
+        hits = []
+        node = 0
+
+        for i, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+
+            for length, location_id in self.out[node]:
+                start = i - length + 1
+                if (start == 0 or text[start - 1] == " ") and (i + 1 == len(text) or text[i + 1] == " "):
+                    hits.append((start, -length, location_id))
+
+        found = []
+        end = -1
+        for start, negative_length, location_id in sorted(hits):
+            if start > end:
+                end = start - negative_length - 1
+                found.append((start, location_id))
+        return found
+
+    def find(self, text):
+        """ Location ids in text order. """
+        return list(dict.fromkeys(location_id for _, location_id in self.matches(text)))
+
+
+def get_matcher():
+    global _matcher
+
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(VERSION_KEY, version, None)
+
+    if _matcher is None or _matcher[0] != version:
+        patterns = dict(
+            LocationAlias.objects.values_list("alias", "location_id")
+        )
+        patterns = {normalize_location(alias): location_id for alias, location_id in patterns.items()}
+        _matcher = (version, LocationMatcher(patterns))
+
+    return _matcher[1]
+
+
+def find_locations(text):
+    return get_matcher().find(text)
+
+
+def leading_location(text):
+    """
+    Location id of an alias the text starts with ("Bangalore East",
+    "Pune (Hinjewadi)"); None when the alias comes later — "Navi Mumbai"
+    is not Mumbai.
+    """
+    found = get_matcher().matches(text)
+    if found and found[0][0] == 0:
+        return found[0][1]
+    return None
+
+
+# -------------------------------------------------
+# LOOKUP
+# -------------------------------------------------
+def edit_distance(a, b, limit):
+    """ Levenshtein distance, or limit + 1 as soon as it exceeds limit. """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def fuzzy_lookup(text):
+    """
+    Location id of an alias a typo away ("banglore" → Bengaluru), or None.
+    Trigrams pick the candidates; an alias counts only within
+    FUZZY_MAX_EDITS edits (1 for short names) and with the same first
+    letter, so a different town that rhymes (Mangalore) doesn't match.
+    """
+    key = normalize_location(text)
+    if not key:
+        return None
+
+    limit = FUZZY_MAX_EDITS if len(key) >= FUZZY_LONG_NAME else 1
+
+    candidates = (
+        LocationGram.objects.filter(gram__in=trigrams(key))
+        .values("alias_id")
+        .annotate(shared=Count("id"))
+        .order_by("-shared")[:FUZZY_CANDIDATES]
+    )
+    shared = {row["alias_id"]: row["shared"] for row in candidates}
+
+    best, best_key = None, None
+    for alias in LocationAlias.objects.filter(id__in=shared):
+        name = normalize_location(alias.alias)
+        if not name or name[0] != key[0]:
+            continue
+        distance = edit_distance(key, name, limit)
+        if distance <= limit and (best_key is None or (distance, -shared[alias.id]) < best_key):
+            best, best_key = alias.location_id, (distance, -shared[alias.id])
+
+    return best
+
+
+def alias_location(text):
+    """ Location id of the alias the whole text is ("Bangalore", "blr"), or None. """
+    key = " ".join((text or "").lower().split())
+    if not key:
+        return None
+    return LocationAlias.objects.filter(alias=key).values_list("location_id", flat=True).first()
+
+
+def resolve_location(text):
+    """
+    Free text → location id: exact alias, then an alias the text starts
+    with. None otherwise — no guessing (see filter_by_location).
+    """
+    return alias_location(text) or leading_location(text)
+
+
+def filter_by_location(queryset, text):
+    """
+    Jobs at the resolved location (JobLocation index). Unknown places go
+    to the full-text location search; only when that finds nothing either
+    is a close spelling of a known place tried.
+    """
+    text = (text or "").strip()
+    if not text:
+        return queryset
+
+    location_id = resolve_location(text)
+    if location_id is not None:
+        return queryset.filter(location_links__location_id=location_id)
+
+    matched = apply_search(queryset, location=text)
+    if matched.exists():
+        return matched
+
+    location_id = fuzzy_lookup(text)
+    if location_id is None:
+        return matched
+    return queryset.filter(location_links__location_id=location_id)
+
+
+# -------------------------------------------------
+# MAINTENANCE
+# -------------------------------------------------
+def index_aliases(aliases):
+    """ (Re)build the trigram rows of the given LocationAlias objects. """
+    aliases = list(aliases)
+    LocationGram.objects.filter(alias__in=aliases).delete()
+    LocationGram.objects.bulk_create(
+        [LocationGram(gram=gram, alias=alias) for alias in aliases for gram in trigrams(alias.alias)],
+        batch_size=1000
+    )
+
+
+def locations_for_text(text):
+    """
+    Location ids for a Job.location string, one per segment that starts
+    with a known alias: "Chennai / Remote" → both, "Bangalore (Whitefield)"
+    → Bengaluru. Unknown places ("Hosur, Tamil Nadu", "Navi Mumbai") link
+    nothing until the place is added (add_places, or the admin).
+    """
+    found = []
+    for segment in re.split(SEGMENT_SPLIT, text or ""):
+        location_id = leading_location(segment)
+        if location_id is not None and location_id not in found:
+            found.append(location_id)
+    return found
+
+
+def unknown_places(text):
+    """
+    Place names in a Job.location no alias covers: the part of each
+    alternative before a comma or bracket ("Hosur, Tamil Nadu" → Hosur).
+    Close spellings of a known place ("Banglore") are left out.
+    """
+    places = []
+    for part in re.split(PLACE_SPLIT, text or ""):
+        name = " ".join(re.split(r"[,(]", part)[0].split())
+        if not normalize_location(name) or name in places:
+            continue
+        if leading_location(name) is None and fuzzy_lookup(name) is None:
+            places.append(name)
+    return places
+
+
+def add_places(texts):
+    """
+    A Location for each unknown place in `texts` (Job.location values),
+    so jobs there link through JobLocation too (the Location signal adds
+    its alias and trigrams). Returns the new Location rows.
+    """
+    names = {}
+    for text in texts:
+        for name in unknown_places(text):
+            names.setdefault(normalize_location(name), name)
+
+    created = []
+    for key, name in names.items():
+        location, new = Location.objects.get_or_create(key=key, defaults={"name": name})
+        if new:
+            created.append(location)
+    return created
+
+
+def sync_job_locations(job):
+    wanted = set(locations_for_text(job.location))
+
+    links = JobLocation.objects.filter(job_id=job.id)
+    current = set(links.values_list("location_id", flat=True))
+
+    if current - wanted:
+        links.filter(location_id__in=current - wanted).delete()
+
+    if wanted - current:
+        JobLocation.objects.bulk_create(
+            [JobLocation(job_id=job.id, location_id=location_id) for location_id in wanted - current],
+            ignore_conflicts=True
+        )
@@ -0,0 +1,74 @@
+"""
+Job moderation.
+
+approve / reject any number of PENDING jobs with one
+UPDATE ... WHERE id IN (...), one bulk insert of JobModeration audit
+rows, and one post-commit task for the whole batch (job cache, saved
+search alerts, recommendations) — .update() fires no post_save, so the
+Job signals don't run here.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import Job, JobModeration
+from jobs.services.job_cache import invalidate_jobs
+from jobs.tasks import after_moderation
+
+
+APPROVE = "approve"
+REJECT = "reject"
+
+ACTION_STATUS = {
+    APPROVE: "PUBLISHED",
+    REJECT: "REJECTED",
+}
+
+MODERATION_MAX = 500     # job ids per request
+
+
+def clean_ids(job_ids):
+    """ De-duplicated ints, order kept, capped at MODERATION_MAX. """
+    ids = []
+    for raw in job_ids or []:
+        try:
+            job_id = int(raw)
+        except (TypeError, ValueError):
+            continue
+        if job_id not in ids:
+            ids.append(job_id)
+    return ids[:MODERATION_MAX]
+
+
+def moderate_jobs(job_ids, action, moderator):
+    """
+    Move PENDING jobs to PUBLISHED / REJECTED. Jobs that are not pending
+    (already moderated, deleted) are skipped. Returns the moved ids.
+    """
+    to_status = ACTION_STATUS[action]
+    job_ids = clean_ids(job_ids)
+    if not job_ids:
+        return []
+
+    with transaction.atomic():
+        pending = Job.objects.select_for_update().filter(id__in=job_ids, status="PENDING")
+        pending_ids = set(pending.values_list("id", flat=True))
+        moved = [job_id for job_id in job_ids if job_id in pending_ids]
+        if not moved:
+            return []
+
+        Job.objects.filter(id__in=moved).update(status=to_status, updated_at=timezone.now())
+
+        JobModeration.objects.bulk_create(
+            [
+                JobModeration(job_id=job_id, moderator=moderator, from_status="PENDING", to_status=to_status)
+                for job_id in moved
+            ],
+            batch_size=500
+        )
+
+        transaction.on_commit(partial(invalidate_jobs, moved))
+        transaction.on_commit(partial(after_moderation.enqueue, moved, to_status))
+
+    return moved
@@ -1,5 +1,19 @@
+"""
+Monthly application quota.
+
+One ApplicationQuota row per (user, month) holds the number of
+applications used. apply_job increments it inside the same transaction
+as the JobApplication insert, so checks are a single keyed read instead
+of a COUNT over the user's applications.
+"""
+from datetime import timedelta
+
+from django.db.models import Count, DateField, F
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
-from jobs.models import JobApplication
+
+from accounts.models import User
+from jobs.models import ApplicationQuota, JobApplication
 
 LIMITS = {
     "FREE": 10,
@@ -8,33 +22,148 @@ LIMITS = {
 }
 
 
-def applications_used_this_month(user):
-    now = timezone.localtime()
-    start_month = now.date().replace(day=1)
+def month_start():
+    # local midnight on the 1st — a plain range on applied_at, so the
+    # (user, applied_at) index is used (applied_at__date wraps the column)
+    return timezone.localtime().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-    return JobApplication.objects.filter(
-        user=user,
-        applied_at__date__gte=start_month
-    ).count()
 
+def current_period():
+    return month_start().date()
 
-def get_active_plan(user):
-    if user.plan_status != "ACTIVE":
+
+def active_plan_for(plan, plan_status):
+    if plan_status != "ACTIVE":
         return "FREE"
-    return user.plan
+    return plan
 
 
-def can_apply_quota(user):
-    tier = get_active_plan(user)
+def get_active_plan(user):
+    return active_plan_for(user.plan, user.plan_status)
+
+
+def limit_for(user):
+    """ Applications per month for the user's active plan (None = unlimited). """
+    return LIMITS.get(get_active_plan(user), LIMITS["FREE"])
+
+
+# -------------------------------------------------
+# READ
+# -------------------------------------------------
+def applications_used_this_month(user):
+    return (
+        ApplicationQuota.objects
+        .filter(user=user, period=current_period())
+        .values_list("used", flat=True)
+        .first()
+    ) or 0
+
+
+def quota_status(user):
+    """ (used, limit, remaining) for the dashboard; remaining is None if unlimited. """
+    used = applications_used_this_month(user)
+    limit = limit_for(user)
+    remaining = None if limit is None else max(limit - used, 0)
+    return used, limit, remaining
+
 
-    limit = LIMITS.get(tier, LIMITS["FREE"])
+def can_apply_quota(user, lock=False):
+    """
+    Returns (allowed, used, limit).
+
+    lock=True (inside transaction.atomic) locks this month's counter row
+    until commit, so two parallel applies can't both take the last slot.
+    """
+    limit = limit_for(user)
 
     if limit is None:
         return True, None, None
 
-    used = applications_used_this_month(user)
+    if lock:
+        counter, _ = ApplicationQuota.objects.select_for_update().get_or_create(
+            user=user,
+            period=current_period()
+        )
+        used = counter.used
+    else:
+        used = applications_used_this_month(user)
 
     if used >= limit:
         return False, used, limit
 
     return True, used, limit
+
+
+# -------------------------------------------------
+# WRITE (same transaction as the JobApplication insert)
+# -------------------------------------------------
+def record_application(user, count=1):
+    if count <= 0:
+        return
+
+    period = current_period()
+
+    counter, created = ApplicationQuota.objects.get_or_create(
+        user=user,
+        period=period,
+        defaults={"used": count}
+    )
+    if not created:
+        ApplicationQuota.objects.filter(pk=counter.pk).update(used=F("used") + count)
+
+    # keep the legacy User field in step (admin list shows it)
+    User.objects.filter(pk=user.pk).update(
+        job_applications_used=ApplicationQuota.objects.filter(pk=counter.pk).values("used")
+    )
+
+
+# -------------------------------------------------
+# RECONCILE
+# -------------------------------------------------
+def reconcile(months=1):
+    """
+    Recount the last `months` periods from JobApplication and fix any
+    counter that drifted. Returns the number of rows changed.
+    """
+    start = month_start()
+    for _ in range(months - 1):
+        start = (start - timedelta(days=1)).replace(day=1)
+
+    actual = {
+        (row["user_id"], row["period"]): row["used"]
+        for row in JobApplication.objects
+        .filter(applied_at__gte=start)
+        .annotate(period=TruncMonth("applied_at", output_field=DateField()))
+        .values("user_id", "period")
+        .annotate(used=Count("id"))
+        .order_by()
+    }
+
+    stored = {
+        (row["user_id"], row["period"]): row["used"]
+        for row in ApplicationQuota.objects
+        .filter(period__gte=start.date())
+        .values("user_id", "period", "used")
+    }
+
+    changed = [
+        ApplicationQuota(user_id=user_id, period=period, used=actual.get((user_id, period), 0))
+        for user_id, period in set(actual) | set(stored)
+        if actual.get((user_id, period), 0) != stored.get((user_id, period))
+    ]
+
+    ApplicationQuota.objects.bulk_create(
+        changed,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["user", "period"],
+        update_fields=["used"],
+    )
+
+    # legacy User.job_applications_used = this month's count
+    period = current_period()
+    for counter in changed:
+        if counter.period == period:
+            User.objects.filter(pk=counter.user_id).update(job_applications_used=counter.used)
+
+    return len(changed)
@@ -0,0 +1,235 @@
+"""
+Job recommendations.
+
+Each candidate keeps a precomputed top-N list (JobRecommendation rows):
+  - refresh_for_user → full rebuild, when the profile / plan changes
+  - refresh_for_job  → one job pushed into every matching list, when it
+                       is published (and removed again when it isn't)
+
+Serving is a single keyed read on (user, -score). Near-duplicates
+(Job.duplicate_of) are never listed, same as in the job listings.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Min, OuterRef, Subquery
+
+from jobs.models import JobSkill, JobRecommendation, ProfileSkill
+from jobs.services.quota import active_plan_for, get_active_plan
+from jobs.services.skills import match_jobs_for_profile
+from jobs.utils import PLAN_VISIBILITY, listed_jobs
+
+
+RECOMMENDATION_SIZE = 50     # rows kept per user
+CANDIDATE_POOL = 300         # jobs scored on a full rebuild
+
+BUILT_KEY = "job_recs_built:{}"
+
+
+# -------------------------------------------------
+# SCORING
+# -------------------------------------------------
+def score_job(job, skill_count, overlap, experience, location, plan):
+    """
+    skill match     0..50  (share of the job's skills the candidate has)
+    experience      0..20  (inside the window, minus 5 per year outside)
+    location        0 / 15
+    fresher tag     0 / 10 (only for 0-experience candidates)
+    plan visibility +5 if they can apply, -25 if it needs an upgrade
+    """
+    score = 50.0 * overlap / skill_count if skill_count else 0.0
+
+    experience = experience or 0
+    if job.experience_min <= experience <= job.experience_max:
+        score += 20
+    else:
+        gap = min(abs(experience - job.experience_min), abs(experience - job.experience_max))
+        score += max(0, 20 - 5 * gap)
+
+    job_location = (job.location or "").strip().lower()
+    location = (location or "").strip().lower()
+    if job_location and location and (location in job_location or job_location in location):
+        score += 15
+
+    if job.tag_fresher and experience == 0:
+        score += 10
+
+    if job.visibility in PLAN_VISIBILITY.get(plan, PLAN_VISIBILITY["FREE"]):
+        score += 5
+    else:
+        score -= 25
+
+    return round(score, 2)
+
+
+# -------------------------------------------------
+# FULL REBUILD (ONE USER)
+# -------------------------------------------------
+def refresh_for_user(user):
+    profile = getattr(user, "profile", None)
+
+    if user.is_staff or not profile or not profile.skills:
+        JobRecommendation.objects.filter(user=user).delete()
+        cache.set(BUILT_KEY.format(user.id), True, None)
+        return
+
+    plan = get_active_plan(user)
+
+    skill_count = (
+        JobSkill.objects.filter(job=OuterRef("pk"))
+        .values("job")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+
+    candidates = (
+        match_jobs_for_profile(listed_jobs(), profile)
+        .annotate(skill_count=Subquery(skill_count))
+        .defer("description")
+        .order_by("-skill_overlap", "-created_at")[:CANDIDATE_POOL]
+    )
+
+    scored = sorted(
+        (
+            (score_job(job, job.skill_count, job.skill_overlap,
+                       profile.experience, profile.location, plan), job.id)
+            for job in candidates
+        ),
+        reverse=True
+    )[:RECOMMENDATION_SIZE]
+
+    with transaction.atomic():
+        JobRecommendation.objects.filter(user=user).delete()
+        JobRecommendation.objects.bulk_create([
+            JobRecommendation(user=user, job_id=job_id, score=score)
+            for score, job_id in scored
+        ])
+
+    cache.set(BUILT_KEY.format(user.id), True, None)
+
+
+# -------------------------------------------------
+# INCREMENTAL (ONE JOB → MANY USERS)
+# -------------------------------------------------
+def refresh_for_job(job, chunk_size=1000):
+    if not listed_jobs().filter(pk=job.pk).exists():
+        JobRecommendation.objects.filter(job=job).delete()
+        return
+
+    job_skill_ids = list(
+        JobSkill.objects.filter(job=job).values_list("skill_id", flat=True)
+    )
+    if not job_skill_ids:
+        return
+
+    # candidates sharing at least one skill, with their overlap, in one GROUP BY
+    rows = (
+        ProfileSkill.objects
+        .filter(skill_id__in=job_skill_ids, profile__user__is_staff=False)
+        .values(
+            "profile__user_id",
+            "profile__experience",
+            "profile__location",
+            "profile__user__plan",
+            "profile__user__plan_status",
+        )
+        .annotate(overlap=Count("id"))
+        .order_by()
+    )
+
+    chunk = []
+    for row in rows.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            _push_job(job, len(job_skill_ids), chunk)
+            chunk = []
+
+    if chunk:
+        _push_job(job, len(job_skill_ids), chunk)
+
+
+def _push_job(job, skill_count, rows):
+    scores = {
+        row["profile__user_id"]: score_job(
+            job,
+            skill_count,
+            row["overlap"],
+            row["profile__experience"],
+            row["profile__location"],
+            active_plan_for(row["profile__user__plan"], row["profile__user__plan_status"]),
+        )
+        for row in rows
+    }
+
+    user_ids = list(scores)
+
+    # list size, lowest score and the row holding it (ties → oldest id)
+    lowest_row = (
+        JobRecommendation.objects
+        .filter(user_id=OuterRef("user_id"))
+        .order_by("score", "id")
+        .values("id")[:1]
+    )
+    stats = {
+        s["user_id"]: (s["total"], s["lowest"], s["lowest_id"])
+        for s in JobRecommendation.objects
+        .filter(user_id__in=user_ids)
+        .values("user_id")
+        .annotate(total=Count("id"), lowest=Min("score"), lowest_id=Subquery(lowest_row))
+        .order_by()
+    }
+
+    already_listed = set(
+        JobRecommendation.objects
+        .filter(job=job, user_id__in=user_ids)
+        .values_list("user_id", flat=True)
+    )
+
+    upserts = []
+    evict = []
+    for user_id, score in scores.items():
+        total, lowest, lowest_id = stats.get(user_id, (0, None, None))
+
+        if user_id in already_listed or total < RECOMMENDATION_SIZE:
+            upserts.append(JobRecommendation(user_id=user_id, job=job, score=score))
+
+        elif score > lowest:
+            upserts.append(JobRecommendation(user_id=user_id, job=job, score=score))
+            evict.append(lowest_id)
+
+    with transaction.atomic():
+        if evict:
+            JobRecommendation.objects.filter(id__in=evict).delete()
+
+        JobRecommendation.objects.bulk_create(
+            upserts,
+            update_conflicts=True,
+            unique_fields=["user", "job"],
+            update_fields=["score", "updated_at"],
+        )
+
+
+# -------------------------------------------------
+# SERVING
+# -------------------------------------------------
+def recommended_jobs_queryset(user):
+    """
+    Published jobs in the user's list, annotated with `match_score`.
+    Lazily builds the list the first time a user is seen.
+    """
+    if not cache.get(BUILT_KEY.format(user.id)):
+        if not JobRecommendation.objects.filter(user=user).exists():
+            refresh_for_user(user)
+        else:
+            cache.set(BUILT_KEY.format(user.id), True, None)
+
+    return listed_jobs().filter(
+        recommendations__user=user,
+    ).annotate(
+        match_score=F("recommendations__score")
+    )
+
+
+def recommended_jobs(user, limit=6):
+    return list(
+        recommended_jobs_queryset(user).cards().order_by("-match_score", "-created_at")[:limit]
+    )
@@ -0,0 +1,245 @@
+"""
+Full-text search for jobs.
+
+SQLite   → FTS5 virtual table (rowid = job id), kept in sync by jobs.signals
+Postgres → GIN tsvector expression indexes (created in migration 0007)
+Others   → plain icontains filters (slow, but keeps dev setups working)
+
+All paths annotate `search_rank` (higher = better match).
+"""
+import re
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from jobs.models import Job
+
+
+FTS_TABLE = "jobs_job_fts"
+FTS_COLUMNS = ("title", "skills", "location", "company_name", "description")
+
+# bm25 column weights, same order as FTS_COLUMNS
+FTS_WEIGHTS = (4.0, 3.0, 1.0, 1.0, 0.5)
+
+# must match the expressions of the GIN indexes in migration 0007
+PG_SKILLS_VECTOR = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(skills, ''))"
+PG_LOCATION_VECTOR = "to_tsvector('simple', coalesce(location, ''))"
+
+_fts_available = None
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+def split_skills(raw):
+    """ "Python, Django ,SQL" → ["Python", "Django", "SQL"] """
+    if not raw:
+        return []
+    return [s.strip() for s in raw.split(",") if s.strip()]
+
+
+def sqlite_fts_available():
+    global _fts_available
+
+    if connection.vendor != "sqlite":
+        return False
+
+    if _fts_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE]
+            )
+            _fts_available = cursor.fetchone() is not None
+
+    return _fts_available
+
+
+def _fts_term(term):
+    # quoted phrase + prefix → "data analy"* (close to the old icontains feel)
+    return '"' + term.replace('"', '""') + '"*'
+
+
+def build_fts_query(skills=None, location=None):
+    parts = []
+
+    if skills:
+        parts.append("{title skills} : (" + " OR ".join(_fts_term(s) for s in skills) + ")")
+
+    if location:
+        parts.append("location : " + _fts_term(location))
+
+    return " AND ".join(parts)
+
+
+def _pg_term(term):
+    words = re.findall(r"\w+", term.lower())
+    if not words:
+        return None
+    return " <-> ".join(words) + ":*"
+
+
+def build_pg_query(terms):
+    terms = [t for t in (_pg_term(term) for term in terms) if t]
+    return " | ".join(f"({t})" for t in terms)
+
+
+# -------------------------------------------------
+# SEARCH
+# -------------------------------------------------
+def apply_search(queryset, skills=None, location=None):
+    """
+    Filter a Job queryset by skills (matched against title + skills)
+    and/or location, annotating `search_rank`.
+    """
+    skills = [s for s in (skills or []) if s]
+    location = (location or "").strip()
+
+    if not skills and not location:
+        return queryset
+
+    if sqlite_fts_available():
+        return _apply_sqlite(queryset, skills, location)
+
+    if connection.vendor == "postgresql":
+        return _apply_postgres(queryset, skills, location)
+
+    return _apply_fallback(queryset, skills, location)
+
+
+def relevance_field(queryset):
+    """ Primary sort key used by order_by_relevance (for keyset paging). """
+    annotations = queryset.query.annotations
+    for name in ("match_score", "skill_overlap", "search_rank"):
+        if name in annotations:
+            return name
+    return "created_at"
+
+
+def order_by_relevance(queryset):
+    """
+    Recommendation score, then skill overlap, then text rank, then newest.
+    """
+    annotations = queryset.query.annotations
+    ordering = [
+        f"-{name}" for name in ("match_score", "skill_overlap", "search_rank")
+        if name in annotations
+    ]
+    return queryset.order_by(*ordering, "-created_at")
+
+
+def _apply_sqlite(queryset, skills, location):
+    match = build_fts_query(skills, location)
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    job_id = f'"{Job._meta.db_table}"."id"'
+
+    return queryset.filter(
+        id__in=RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            [match]
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = {job_id}",
+            [match],
+            output_field=FloatField()
+        )
+    )
+
+
+def _apply_postgres(queryset, skills, location):
+    where = []
+    params = []
+    rank = Value(0.0, output_field=FloatField())
+
+    skills_query = build_pg_query(skills)
+    if skills_query:
+        where.append(f"{PG_SKILLS_VECTOR} @@ to_tsquery('simple', %s)")
+        params.append(skills_query)
+        rank = RawSQL(
+            f"ts_rank({PG_SKILLS_VECTOR}, to_tsquery('simple', %s))",
+            [skills_query],
+            output_field=FloatField()
+        )
+
+    location_query = build_pg_query([location]) if location else ""
+    if location_query:
+        where.append(f"{PG_LOCATION_VECTOR} @@ to_tsquery('simple', %s)")
+        params.append(location_query)
+
+    if not where:
+        return queryset.none()
+
+    return queryset.extra(where=where, params=params).annotate(search_rank=rank)
+
+
+def _apply_fallback(queryset, skills, location):
+    if skills:
+        query = Q()
+        for skill in skills:
+            query |= Q(skills__icontains=skill) | Q(title__icontains=skill)
+        queryset = queryset.filter(query)
+
+    if location:
+        queryset = queryset.filter(location__icontains=location)
+
+    return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+# -------------------------------------------------
+# INDEX MAINTENANCE (SQLite only — Postgres indexes are automatic)
+# -------------------------------------------------
+def _chunks(ids, size=500):
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def index_jobs(job_ids):
+    if not job_ids or not sqlite_fts_available():
+        return
+
+    columns = ", ".join(FTS_COLUMNS)
+
+    with connection.cursor() as cursor:
+        for chunk in _chunks(job_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})",
+                chunk
+            )
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+                f"SELECT id, {columns} FROM {Job._meta.db_table} WHERE id IN ({placeholders})",
+                chunk
+            )
+
+
+def unindex_jobs(job_ids):
+    if not job_ids or not sqlite_fts_available():
+        return
+
+    with connection.cursor() as cursor:
+        for chunk in _chunks(job_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})",
+                chunk
+            )
+
+
+def rebuild_index():
+    if not sqlite_fts_available():
+        return 0
+
+    columns = ", ".join(FTS_COLUMNS)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+            f"SELECT id, {columns} FROM {Job._meta.db_table}"
+        )
+        return cursor.rowcount
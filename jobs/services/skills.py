@@ -0,0 +1,140 @@
+"""
+Skill taxonomy.
+
+Job.skills / Profile.skills stay free-text comma strings (forms and
+templates use them), but every save is normalized into Skill rows
+(JobSkill / ProfileSkill). Matching then joins on skill ids instead of
+running one icontains per skill.
+
+Search (filter_by_skills) uses the JobSkill index when every term is a
+known skill and it finds jobs; a partial or unknown term ("react" for
+React.js) goes to the full-text search instead, as filter_by_location
+does for places.
+"""
+import re
+
+from django.db.models import Count
+
+from jobs.models import Skill, SkillAlias, JobSkill, ProfileSkill
+from jobs.services.search import apply_search, split_skills
+
+
+def normalize_skill(name):
+    """ "  Machine   Learning " → "machine learning" """
+    return re.sub(r"\s+", " ", (name or "").strip().lower())
+
+
+def parse_skills(raw):
+    """
+    Comma string → {key: display_name}, de-duplicated, order kept.
+    """
+    parsed = {}
+    for name in split_skills(raw):
+        key = normalize_skill(name)[:100]
+        if key and key not in parsed:
+            parsed[key] = name[:100]
+    return parsed
+
+
+# -------------------------------------------------
+# RESOLVE KEYS → SKILL IDS
+# -------------------------------------------------
+def resolve_skill_ids(parsed, create=True):
+    """
+    {key: display_name} → {key: skill_id}
+
+    Aliases win over exact keys ("js" → javascript). Unknown skills are
+    created in one bulk insert when `create` is True.
+    """
+    if not parsed:
+        return {}
+
+    keys = list(parsed)
+
+    resolved = dict(
+        SkillAlias.objects.filter(alias__in=keys).values_list("alias", "skill_id")
+    )
+
+    missing = [k for k in keys if k not in resolved]
+    if missing:
+        resolved.update(
+            Skill.objects.filter(key__in=missing).values_list("key", "id")
+        )
+
+    missing = [k for k in keys if k not in resolved]
+    if missing and create:
+        Skill.objects.bulk_create(
+            [Skill(key=k, name=parsed[k]) for k in missing],
+            ignore_conflicts=True
+        )
+        resolved.update(
+            Skill.objects.filter(key__in=missing).values_list("key", "id")
+        )
+
+    return resolved
+
+
+# -------------------------------------------------
+# SYNC THROUGH TABLES
+# -------------------------------------------------
+def _sync_links(link_model, owner_field, owner_id, raw):
+    wanted = set(resolve_skill_ids(parse_skills(raw)).values())
+
+    links = link_model.objects.filter(**{owner_field: owner_id})
+    current = set(links.values_list("skill_id", flat=True))
+
+    if current - wanted:
+        links.filter(skill_id__in=current - wanted).delete()
+
+    if wanted - current:
+        link_model.objects.bulk_create(
+            [link_model(**{owner_field: owner_id, "skill_id": s}) for s in wanted - current],
+            ignore_conflicts=True
+        )
+
+
+def sync_job_skills(job):
+    _sync_links(JobSkill, "job_id", job.id, job.skills)
+
+
+def sync_profile_skills(profile):
+    _sync_links(ProfileSkill, "profile_id", profile.id, profile.skills)
+
+
+# -------------------------------------------------
+# MATCHING
+# -------------------------------------------------
+def match_jobs_for_skills(queryset, skill_ids):
+    """
+    Jobs sharing at least one skill, annotated with `skill_overlap`
+    (number of shared skills). `skill_ids` may be a list or a subquery.
+    """
+    return queryset.filter(
+        skill_links__skill_id__in=skill_ids
+    ).annotate(
+        skill_overlap=Count("skill_links")
+    )
+
+
+def match_jobs_for_profile(queryset, profile):
+    return match_jobs_for_skills(
+        queryset,
+        ProfileSkill.objects.filter(profile=profile).values("skill_id")
+    )
+
+
+def filter_by_skills(queryset, raw):
+    """ Jobs with any of the skills in a comma string (search box). """
+    parsed = parse_skills(raw)
+    if not parsed:
+        return queryset
+
+    skill_ids = resolve_skill_ids(parsed, create=False)
+    if len(skill_ids) == len(parsed):
+        matched = queryset.filter(
+            id__in=JobSkill.objects.filter(skill_id__in=skill_ids.values()).values("job_id")
+        )
+        if matched.exists():
+            return matched
+
+    return apply_search(queryset, skills=list(parsed.values()))
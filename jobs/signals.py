@@ -0,0 +1,175 @@
+from functools import partial
+
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from accounts.models import Profile
+from .models import Job, JobApplication, Location, LocationAlias
+from .services import search, skills, locations, job_cache, applied, dedupe
+from . import tasks
+
+User = get_user_model()
+
+
+# -------------------------------------------------------
+# Keep the search index + skill links in sync with Job rows
+# -------------------------------------------------------
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+
+    # status-only saves (approve / reject) don't touch indexed text
+    if update_fields and not set(update_fields) & set(search.FTS_COLUMNS):
+        return
+
+    search.index_jobs([instance.id])
+    skills.sync_job_skills(instance)
+    locations.sync_job_locations(instance)
+    # SimHash signature; new near-duplicates get duplicate_of
+    dedupe.index_job(instance, created=kwargs.get("created", False))
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    search.unindex_jobs([instance.id])
+
+
+# -------------------------------------------------------
+# Job detail cache: edit / approve / reject / delete
+# -------------------------------------------------------
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_cache(sender, instance, **kwargs):
+    # after commit, so a concurrent reader can't re-cache the old row
+    job_id = instance.id
+    transaction.on_commit(lambda: job_cache.invalidate_jobs([job_id]))
+
+
+# -------------------------------------------------------
+# Per-user applied-job-id cache: apply / status change / delete
+# -------------------------------------------------------
+@receiver(post_save, sender=JobApplication)
+def cache_application(sender, instance, **kwargs):
+    user_id, job_id = instance.user_id, instance.job_id
+    transaction.on_commit(lambda: applied.add_applied(user_id, [job_id]))
+
+
+@receiver(post_delete, sender=JobApplication)
+def uncache_application(sender, instance, **kwargs):
+    user_id, job_id = instance.user_id, instance.job_id
+    transaction.on_commit(lambda: applied.remove_applied(user_id, [job_id]))
+
+
+# -------------------------------------------------------
+# Location gazetteer edits (admin) → trigram rows + matcher rebuild
+# -------------------------------------------------------
+@receiver(post_save, sender=Location)
+def add_location_alias(sender, instance, created, **kwargs):
+    # the canonical key is always an alias too
+    if created:
+        LocationAlias.objects.get_or_create(alias=instance.key, defaults={"location": instance})
+    locations.bump_version()
+
+
+@receiver(post_save, sender=LocationAlias)
+def index_location_alias(sender, instance, **kwargs):
+    locations.index_aliases([instance])
+    locations.bump_version()
+
+
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=LocationAlias)
+def location_deleted(sender, instance, **kwargs):
+    locations.bump_version()
+
+
+# -------------------------------------------------------
+# Recommendation inputs: remember the loaded values, so a save that
+# didn't change any of them doesn't queue a rebuild
+# -------------------------------------------------------
+RECOMMENDATION_JOB_FIELDS = {
+    "status", "skills", "location", "experience_min", "experience_max",
+    "visibility", "tag_fresher", "deadline",
+}
+RECOMMENDATION_PROFILE_FIELDS = {"skills", "experience", "location"}
+RECOMMENDATION_USER_FIELDS = {"plan", "plan_status"}
+
+
+def _snapshot(instance, fields):
+    # __dict__ only: reading a deferred field here would cost a query per row
+    instance._recommendation_inputs = {
+        f: instance.__dict__[f] for f in fields if f in instance.__dict__
+    }
+
+
+def _inputs_changed(instance, fields, update_fields):
+    if update_fields and not set(update_fields) & fields:
+        return False
+    before = getattr(instance, "_recommendation_inputs", {})
+    return any(
+        f not in before or before[f] != instance.__dict__[f]
+        for f in fields if f in instance.__dict__
+    )
+
+
+@receiver(post_init, sender=Job)
+def remember_job_inputs(sender, instance, **kwargs):
+    _snapshot(instance, RECOMMENDATION_JOB_FIELDS)
+
+
+@receiver(post_init, sender=Profile)
+def remember_profile_inputs(sender, instance, **kwargs):
+    _snapshot(instance, RECOMMENDATION_PROFILE_FIELDS)
+
+
+@receiver(post_init, sender=User)
+def remember_user_inputs(sender, instance, **kwargs):
+    _snapshot(instance, RECOMMENDATION_USER_FIELDS)
+
+
+# -------------------------------------------------------
+# Push published jobs into candidates' recommendation lists
+# -------------------------------------------------------
+@receiver(post_save, sender=Job)
+def refresh_job_recommendations(sender, instance, created, **kwargs):
+    changed = created or _inputs_changed(
+        instance, RECOMMENDATION_JOB_FIELDS, kwargs.get("update_fields")
+    )
+    _snapshot(instance, RECOMMENDATION_JOB_FIELDS)
+    if changed:
+        transaction.on_commit(partial(tasks.refresh_job_recommendations.enqueue, instance.id))
+
+
+# -------------------------------------------------------
+# Normalize profile skills into ProfileSkill rows
+# -------------------------------------------------------
+@receiver(post_save, sender=Profile)
+def sync_profile_skills(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "skills" not in update_fields:
+        return
+    skills.sync_profile_skills(instance)
+
+
+# -------------------------------------------------------
+# Rebuild a candidate's recommendations when inputs change
+# -------------------------------------------------------
+@receiver(post_save, sender=Profile)
+def refresh_profile_recommendations(sender, instance, created, **kwargs):
+    changed = not created and _inputs_changed(
+        instance, RECOMMENDATION_PROFILE_FIELDS, kwargs.get("update_fields")
+    )
+    _snapshot(instance, RECOMMENDATION_PROFILE_FIELDS)
+    if changed:
+        transaction.on_commit(partial(tasks.refresh_user_recommendations.enqueue, instance.user_id))
+
+
+@receiver(post_save, sender=User)
+def refresh_plan_recommendations(sender, instance, created, **kwargs):
+    changed = not created and not instance.is_staff and _inputs_changed(
+        instance, RECOMMENDATION_USER_FIELDS, kwargs.get("update_fields")
+    )
+    _snapshot(instance, RECOMMENDATION_USER_FIELDS)
+    if changed:
+        transaction.on_commit(partial(tasks.refresh_user_recommendations.enqueue, instance.id))
@@ -0,0 +1,196 @@
+"""
+Background tasks for jobs (django.tasks).
+
+Enqueued with transaction.on_commit, so they only run once the write
+they describe is committed, and the request transaction stays short.
+Arguments are ids (task args must be JSON-serialisable).
+"""
+from django.tasks import task
+
+from accounts.models import Notification, User
+from accounts.services.notifications import notify_admins
+from jobs.models import Job, JobApplication, JobRecommendation, SavedJob
+
+
+@task
+def after_application(application_id):
+    """ Side effects of a new application: admin alert + saved-job cleanup. """
+    application = (
+        JobApplication.objects
+        .select_related("user", "job")
+        .filter(id=application_id)
+        .first()
+    )
+    if application is None:
+        return
+
+    # ADMIN ALERT (new application box)
+    notify_admins(
+        "New Job Application",
+        f"{application.user.full_name} applied for {application.job.title}",
+        type=Notification.JOB
+    )
+
+    # REMOVE FROM SAVED JOBS (IF EXISTS)
+    SavedJob.objects.filter(
+        user_id=application.user_id,
+        job_id=application.job_id
+    ).delete()
+
+
+@task
+def after_bulk_application(user_id, job_ids):
+    """ One aggregated admin alert + one saved-job delete for a batch apply. """
+    user = User.objects.filter(id=user_id).first()
+    if user is None or not job_ids:
+        return
+
+    titles = list(
+        Job.objects.filter(id__in=job_ids).values_list("title", flat=True)[:3]
+    )
+    more = len(job_ids) - len(titles)
+
+    notify_admins(
+        "New Job Applications",
+        (
+            f"{user.full_name} applied for {len(job_ids)} jobs: "
+            + ", ".join(titles)
+            + (f" and {more} more" if more > 0 else "")
+        ),
+        type=Notification.JOB
+    )
+
+    SavedJob.objects.filter(user_id=user_id, job_id__in=job_ids).delete()
+
+
+@task
+def notify_saved_searches(job_id):
+    """ Percolate a newly published job through the saved searches, once. """
+    from jobs.services.alerts import notify_for_job
+
+    job = Job.objects.filter(id=job_id, status="PUBLISHED").first()
+    if job is None:
+        return
+    notify_for_job(job)
+
+
+@task
+def after_moderation(job_ids, status):
+    """
+    Downstream updates for a moderated batch: published jobs go through
+    the saved-search alerts and into recommendation lists; rejected ones
+    leave the lists and release their near-duplicates.
+    """
+    if status != "PUBLISHED":
+        JobRecommendation.objects.filter(job_id__in=job_ids).delete()
+        _release(job_ids)
+        return
+
+    _published(job_ids)
+
+
+@task
+def after_jobs_published(job_ids):
+    """ Same, for jobs inserted already published (bulk import). """
+    _published(job_ids)
+
+
+@task
+def release_duplicates(job_ids):
+    """ These jobs left the active set (expired / rejected): free their copies. """
+    _release(job_ids)
+
+
+def _release(job_ids):
+    from jobs.services import dedupe
+    from jobs.services.job_cache import invalidate_jobs
+
+    released = dedupe.release_duplicates(job_ids)
+    if released:
+        invalidate_jobs(released)
+        _published(released)
+
+
+def _published(job_ids):
+    from jobs.services import alerts, recommendations
+
+    for job in Job.objects.filter(id__in=job_ids, status="PUBLISHED"):
+        alerts.notify_for_job(job)
+        recommendations.refresh_for_job(job)
+
+
+@task
+def refresh_job_recommendations(job_id):
+    """ Push one job into (or pull it out of) the candidates' lists. """
+    from jobs.services import recommendations
+
+    job = Job.objects.filter(id=job_id).first()
+    if job is None:
+        JobRecommendation.objects.filter(job_id=job_id).delete()
+        return
+    recommendations.refresh_for_job(job)
+
+    if job.status not in ("PENDING", "PUBLISHED"):
+        _release([job.id])
+
+
+@task
+def refresh_user_recommendations(user_id):
+    """ Full rebuild of one candidate's list (profile / plan changed). """
+    from jobs.services import recommendations
+
+    user = User.objects.select_related("profile").filter(id=user_id).first()
+    if user is None:
+        return
+    recommendations.refresh_for_user(user)
+
+
+@task
+def run_job_import(import_id):
+    """ Stream an uploaded feed into Job rows, saving progress per chunk. """
+    from django.utils import timezone
+
+    from jobs.models import JobImport
+    from jobs.services import job_import
+
+    upload = JobImport.objects.filter(id=import_id, status=JobImport.PENDING).first()
+    if upload is None:
+        return
+
+    upload.status = JobImport.RUNNING
+    upload.save(update_fields=["status"])
+
+    def progress(report):
+        JobImport.objects.filter(id=upload.id).update(
+            processed=report.processed,
+            created=report.created,
+            duplicates=report.duplicates,
+            error_count=report.error_count,
+            errors=report.errors,
+        )
+
+    try:
+        fmt = job_import.detect_format(upload.file.name)
+        with upload.file.open("rb") as fileobj:
+            job_import.import_jobs(
+                job_import.iter_rows(fileobj, fmt),
+                created_by=upload.created_by,
+                publish=upload.publish,
+                progress=progress,
+            )
+    except job_import.READ_ERRORS as exc:
+        JobImport.objects.filter(id=upload.id).update(
+            status=JobImport.FAILED,
+            errors=[{"row": None, "error": str(exc)}],
+            finished_at=timezone.now(),
+        )
+        return
+    except Exception:
+        JobImport.objects.filter(id=upload.id).update(
+            status=JobImport.FAILED, finished_at=timezone.now()
+        )
+        raise
+
+    JobImport.objects.filter(id=upload.id).update(
+        status=JobImport.DONE, finished_at=timezone.now()
+    )
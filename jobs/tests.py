@@ -1,3 +1,836 @@
-from django.test import TestCase
+import io
+import json
+from datetime import timedelta
+from itertools import count
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import QueryDict
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import Notification, User
+from core.utils.pagination import paginate_keyset
+from jobs.models import (
+    ApplicationQuota, Job, JobApplication, JobModeration, JobRecommendation, Location, SavedJob,
+)
+from jobs.services import (
+    alerts, applications, dedupe, expiry, job_cache, job_import, locations, moderation, quota,
+    recommendations, search,
+)
+from jobs.services.applied import applied_job_ids
+from jobs.services.facets import apply_facet_filters, facet_counts
+from jobs.services.skills import filter_by_skills
+from jobs.utils import listed_jobs, with_apply_permission
+
+
+_serial = count()
+
+
+def make_user(email, plan=User.FREE, is_staff=False):
+    user = User.objects.create_user(email=email, password="pass12345", is_staff=is_staff)
+    if plan != User.FREE:
+        User.objects.filter(pk=user.pk).update(plan=plan, plan_status="ACTIVE")
+        user.refresh_from_db()
+    return user
+
+
+def complete_profile(user, skills="python, django"):
+    profile = user.profile
+    profile.full_name = "Test Candidate"
+    profile.mobile_number = "9999999999"
+    profile.experience = 1
+    profile.location = "Chennai"
+    profile.skills = skills
+    profile.resume.name = "resumes/cv.pdf"
+    profile.save()
+    return user
+
+
+def make_job(created_by, **fields):
+    # distinct words per job, so the SimHash index doesn't flag them as copies
+    n = next(_serial)
+    values = {
+        "title": f"Backend Engineer {n}",
+        "company_name": f"Company {n}",
+        "location": "Chennai",
+        "experience_min": 0,
+        "experience_max": 3,
+        "job_type": "FT",
+        "description": " ".join(f"task{n}x{i}" for i in range(12)),
+        "skills": "python, django",
+        "deadline": timezone.localdate() + timedelta(days=30),
+        "status": "PUBLISHED",
+    }
+    values.update(fields)
+    return Job.objects.create(created_by=created_by, **values)
+
+
+# -------------------------------------------------
+# SEARCH
+# -------------------------------------------------
+class SearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+
+    def find(self, *skills):
+        return list(search.apply_search(Job.objects.all(), skills=list(skills)))
+
+    def test_index_follows_save_and_delete(self):
+        job = make_job(self.staff, skills="Kotlin")
+        self.assertEqual(self.find("kotlin"), [job])
+
+        job.skills = "Swift"
+        job.save()
+        self.assertEqual((self.find("kotlin"), self.find("swift")), ([], [job]))
+
+        job_id = job.id
+        job.delete()
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {search.FTS_TABLE} WHERE rowid = %s", [job_id])
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_bm25_ranks_title_and_skills_first(self):
+        skills_only = make_job(self.staff, skills="Kotlin")
+        title_and_skills = make_job(self.staff, title="Kotlin Developer", skills="Kotlin")
+        make_job(self.staff, skills="Swift")
+
+        jobs = search.apply_search(Job.objects.all(), skills=["kotlin"])
+
+        self.assertEqual(search.relevance_field(jobs), "search_rank")
+        self.assertEqual(list(search.order_by_relevance(jobs)), [title_and_skills, skills_only])
+
+    def test_keyset_pages_over_the_rank(self):
+        for i in range(5):
+            title = "Kotlin Developer" if i % 2 else f"Mobile Engineer {i}"
+            make_job(self.staff, title=title, skills="Kotlin")
+        jobs = search.apply_search(Job.objects.all(), skills=["kotlin"])
+        expected = [job.id for job in search.order_by_relevance(jobs).order_by("-search_rank", "-id")]
+
+        seen, query = [], ""
+        while True:
+            request = RequestFactory().get("/?" + query)
+            page = paginate_keyset(request, jobs, per_page=2, field="search_rank")
+            seen += [job.id for job in page]
+            if not page.has_next:
+                break
+            query = page.next_query
+
+        self.assertEqual(seen, expected)
+
+    def test_unknown_skills_fall_back_to_full_text(self):
+        react = make_job(self.staff, skills="React.js, Redux")
+        make_job(self.staff, skills="Angular")
+
+        # "redux" is a known skill: JobSkill index, no rank
+        by_skill = filter_by_skills(Job.objects.all(), "Redux")
+        self.assertEqual(list(by_skill), [react])
+        self.assertEqual(search.relevance_field(by_skill), "created_at")
+
+        # "react" is only part of "react.js"
+        self.assertEqual(list(filter_by_skills(Job.objects.all(), "react")), [react])
+        self.assertEqual(list(filter_by_skills(Job.objects.all(), "redux, vue")), [react])
+
+        self.client.force_login(make_user("candidate@example.com"))
+        response = self.client.get(reverse("search_jobs"), {"skills": "react"})
+        self.assertEqual([job.id for job in response.context["jobs"]], [react.id])
+
+
+# -------------------------------------------------
+# RECOMMENDATIONS
+# -------------------------------------------------
+class RecommendationSignalTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+        cls.job = make_job(cls.staff)
+
+    def setUp(self):
+        cache.clear()
+        self.user = make_user("candidate@example.com")
+
+    def test_profile_change_rebuilds_after_commit(self):
+        self.user.profile.skills = "python"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile.save()
+
+        self.assertTrue(JobRecommendation.objects.filter(user=self.user, job=self.job).exists())
+
+    def test_unchanged_save_queues_nothing(self):
+        self.user.profile.skills = "python"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile.save()
+        JobRecommendation.objects.filter(user=self.user).delete()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.user.profile.save()
+            User.objects.get(pk=self.user.pk).save()
+
+        self.assertEqual(callbacks, [])
+        self.assertFalse(JobRecommendation.objects.filter(user=self.user).exists())
+
+    def test_rejected_job_leaves_lists(self):
+        self.user.profile.skills = "python"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile.save()
+
+        self.job.status = "REJECTED"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save(update_fields=["status"])
+
+        self.assertFalse(JobRecommendation.objects.filter(job=self.job).exists())
+
+
+# -------------------------------------------------
+# QUOTA / APPLY
+# -------------------------------------------------
+class ApplyQuotaTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+        cls.jobs = [make_job(cls.staff) for _ in range(7)]
+
+    def setUp(self):
+        cache.clear()
+        # PRO: 5 applications a month
+        self.user = complete_profile(make_user("candidate@example.com", plan=User.PRO))
+
+    def counter(self):
+        return ApplicationQuota.objects.get(user=self.user, period=quota.current_period()).used
+
+    def test_apply_stops_at_the_monthly_limit(self):
+        outcomes = [applications.apply_to_job(self.user, job)[0] for job in self.jobs[:6]]
+
+        self.assertEqual(outcomes, [applications.APPLIED] * 5 + [applications.QUOTA_EXCEEDED])
+        self.assertEqual(self.counter(), 5)
+        self.assertEqual(JobApplication.objects.filter(user=self.user).count(), 5)
+
+    def test_reconcile_fixes_a_drifted_counter(self):
+        applications.apply_to_job(self.user, self.jobs[0])
+        applications.apply_to_job(self.user, self.jobs[1])
+        ApplicationQuota.objects.filter(user=self.user).update(used=7)
+
+        self.assertEqual(quota.reconcile(), 1)
+        self.assertEqual(self.counter(), 2)
+
+    def test_reapply_does_not_use_a_slot(self):
+        applications.apply_to_job(self.user, self.jobs[0])
+        cache.clear()       # force the DB path, not the cached applied set
+
+        outcome, _ = applications.apply_to_job(self.user, self.jobs[0])
+
+        self.assertEqual(outcome, applications.ALREADY_APPLIED)
+        self.assertEqual(self.counter(), 1)
+
+    def test_side_effects_run_after_commit(self):
+        SavedJob.objects.create(user=self.user, job=self.jobs[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            applications.apply_to_job(self.user, self.jobs[0])
+
+        self.assertFalse(SavedJob.objects.filter(user=self.user).exists())
+        self.assertTrue(
+            Notification.objects.filter(user__isnull=True, type=Notification.JOB).exists()
+        )
+
+    def test_bulk_apply_fills_the_remaining_slots_in_order(self):
+        for job in self.jobs[:2]:
+            applications.apply_to_job(self.user, job)
+        pro_only = make_job(self.staff, visibility="PROPLUS")
+
+        ids = [job.id for job in self.jobs] + [pro_only.id, 999999]
+        with self.captureOnCommitCallbacks(execute=True):
+            results = applications.bulk_apply(self.user, ids)
+
+        self.assertEqual(results[self.jobs[0].id], applications.ALREADY_APPLIED)
+        self.assertEqual(
+            [results[job.id] for job in self.jobs[2:]],
+            [applications.APPLIED] * 3 + [applications.QUOTA_EXCEEDED] * 2
+        )
+        self.assertEqual(results[pro_only.id], applications.PLAN_REQUIRED)
+        self.assertEqual(results[999999], applications.NOT_FOUND)
+
+        self.assertEqual(self.counter(), 5)
+        self.assertEqual(JobApplication.objects.filter(user=self.user).count(), 5)
+        # one aggregated admin alert for the batch
+        self.assertEqual(
+            Notification.objects.filter(user__isnull=True, title="New Job Applications").count(), 1
+        )
+
+
+# -------------------------------------------------
+# FACETS
+# -------------------------------------------------
+class FacetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        staff = make_user("staff@example.com", is_staff=True)
+        make_job(staff, job_type="FT", experience_min=0, experience_max=0, tag_fresher=True)
+        make_job(staff, job_type="FT", experience_min=2, experience_max=5)
+        make_job(staff, job_type="IN", experience_min=8, experience_max=10, visibility="PRO")
+
+    def test_counts_from_one_query(self):
+        with self.assertNumQueries(1):
+            facets = facet_counts(listed_jobs())
+
+        counts = {facet: {o["value"]: o["count"] for o in options} for facet, options in facets.items()}
+        self.assertEqual(counts["job_type"], {"FT": 2, "IN": 1})
+        self.assertEqual(counts["visibility"], {"FREE": 2, "PRO": 1})
+        self.assertEqual(counts["fresher"], {"1": 1})
+        # 2–5 yrs overlaps two bands
+        self.assertEqual(counts["exp_band"], {"0": 1, "1-3": 1, "4-6": 1, "7+": 1})
+
+    def test_location_facet_filters_to_its_own_count(self):
+        staff = User.objects.get(email="staff@example.com")
+        for location in ("Bangalore East", "bangalore east", "Bangalore"):
+            make_job(staff, location=location)
+
+        options = {o["label"]: o for o in facet_counts(listed_jobs())["location"]}
+        self.assertEqual(
+            {label: o["count"] for label, o in options.items()},
+            {"Chennai": 3, "Bangalore East": 2, "Bangalore": 1}
+        )
+
+        # the facet's link narrows to exactly the badge count, not every Bengaluru job
+        params = QueryDict(options["Bangalore East"]["query"])
+        self.assertEqual(apply_facet_filters(listed_jobs(), params).count(), 2)
+
+    def test_links_toggle_their_param_and_drop_the_cursor(self):
+        name = Job.objects.filter(job_type="FT").values_list("company_name", flat=True).first()
+        params = QueryDict(mutable=True)
+        params.update({"skills": "python", "company": name.lower(), "after": "abc", "before": "def", "page": "3"})
+
+        facets = facet_counts(listed_jobs(), params)
+
+        [company] = [o for o in facets["company"] if o["selected"]]
+        self.assertEqual(company["label"], name)
+        self.assertEqual(company["query"], "skills=python")     # clicking it again clears it
+
+        job_type = next(o for o in facets["job_type"] if o["value"] == "FT")
+        self.assertFalse(job_type["selected"])
+        self.assertEqual(
+            QueryDict(job_type["query"]).dict(),
+            {"skills": "python", "company": name.lower(), "job_type": "FT"}
+        )
+
+
+# -------------------------------------------------
+# LOCATIONS
+# -------------------------------------------------
+class LocationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        staff = make_user("staff@example.com", is_staff=True)
+        cls.bengaluru = Location.objects.get(key="bengaluru")
+        cls.mumbai = Location.objects.get(key="mumbai")
+        cls.bangalore_job = make_job(staff, location="Bangalore")
+        cls.mumbai_job = make_job(staff, location="Mumbai")
+        cls.navi_mumbai_job = make_job(staff, location="Navi Mumbai")
+        cls.mangalore_job = make_job(staff, location="Mangalore")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_aho_corasick_finds_every_alias_in_one_pass(self):
+        found = locations.find_locations("Chennai / Remote (work from home), Bombay")
+
+        self.assertEqual(
+            found,
+            [Location.objects.get(key="chennai").id, Location.objects.get(key="remote").id, self.mumbai.id]
+        )
+
+    def test_aliases_resolve(self):
+        self.assertEqual(locations.resolve_location("  BLR "), self.bengaluru.id)
+        self.assertEqual(locations.resolve_location("Bangalore East"), self.bengaluru.id)
+
+    def test_fuzzy_lookup_takes_typos(self):
+        self.assertEqual(locations.fuzzy_lookup("banglore"), self.bengaluru.id)
+        self.assertEqual(locations.fuzzy_lookup("mumbay"), self.mumbai.id)
+
+    def test_mangalore_is_not_bengaluru(self):
+        self.assertIsNone(locations.resolve_location("Mangalore"))
+        self.assertIsNone(locations.fuzzy_lookup("Mangalore"))
+        found = list(locations.filter_by_location(Job.objects.all(), "Mangalore"))
+        self.assertEqual(found, [self.mangalore_job])
+
+    def test_navi_mumbai_is_not_mumbai(self):
+        self.assertIsNone(locations.resolve_location("Navi Mumbai"))
+        self.assertEqual(locations.locations_for_text("Navi Mumbai"), [])
+
+        found = list(locations.filter_by_location(Job.objects.all(), "Navi Mumbai"))
+        self.assertEqual(found, [self.navi_mumbai_job])
+
+    def test_fuzzy_only_after_full_text_misses(self):
+        found = list(locations.filter_by_location(Job.objects.all(), "banglore"))
+        self.assertEqual(found, [self.bangalore_job])
+
+    def test_unknown_places_are_not_added_to_the_gazetteer(self):
+        before = Location.objects.count()
+
+        self.assertEqual(locations.locations_for_text("Hosur, Tamil Nadu"), [])
+        self.assertEqual(Location.objects.count(), before)
+
+    def test_add_places_skips_known_places_and_typos(self):
+        created = locations.add_places(["Hosur, Tamil Nadu", "Chennai / hosur", "Banglore", "Navi Mumbai"])
+
+        self.assertEqual([location.name for location in created], ["Hosur", "Navi Mumbai"])
+        self.assertEqual(locations.locations_for_text("Hosur, Tamil Nadu"), [created[0].id])
+
+    def test_backfill_links_jobs_in_added_places(self):
+        call_command("backfill_locations", "--add-places", stdout=io.StringIO())
+        navi_mumbai = Location.objects.get(key="navi mumbai")
+
+        self.assertTrue(Location.objects.filter(key="mangalore").exists())
+        self.assertEqual(
+            list(Job.objects.filter(location_links__location=navi_mumbai)), [self.navi_mumbai_job]
+        )
+        found = list(locations.filter_by_location(Job.objects.all(), "Navi Mumbai"))
+        self.assertEqual(found, [self.navi_mumbai_job])
+
+
+# -------------------------------------------------
+# SAVED SEARCH ALERTS
+# -------------------------------------------------
+class SavedSearchAlertTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+        cls.user = make_user("candidate@example.com")
+        cls.bengaluru = Location.objects.get(key="bengaluru")
+
+    def setUp(self):
+        cache.clear()
+
+    def alerts_for(self, user):
+        return Notification.objects.filter(user=user, title="New job for your saved search")
+
+    def test_location_is_linked_only_on_an_alias(self):
+        saved, error = alerts.create_saved_search(self.user, {"location": "bangalore", "skills": "python"})
+        self.assertIsNone(error)
+        self.assertEqual((saved.location, saved.location_tag_id), ("bangalore", self.bengaluru.id))
+
+        for place in ("Mangalore", "Navi Mumbai"):
+            saved, error = alerts.create_saved_search(self.user, {"location": place})
+            self.assertIsNone(saved)
+            self.assertTrue(error)
+
+    def test_published_job_alerts_matching_searches_once(self):
+        alerts.create_saved_search(self.user, {"location": "Bangalore", "skills": "python"})
+        alerts.create_saved_search(self.user, {"skills": "django", "job_type": "FT"})
+        alerts.create_saved_search(self.user, {"skills": "python", "job_type": "IN"})
+
+        job = make_job(self.staff, location="Bengaluru")
+
+        self.assertEqual(alerts.notify_for_job(job), 1)
+        [notification] = self.alerts_for(self.user)
+        self.assertIn("python in Bangalore", notification.message)
+        self.assertIn("django", notification.message)
+
+    def test_expired_and_duplicate_jobs_alert_nobody(self):
+        alerts.create_saved_search(self.user, {"location": "Bangalore", "skills": "python"})
+
+        expired = make_job(
+            self.staff, location="Bangalore", deadline=timezone.localdate() - timedelta(days=1)
+        )
+        original = make_job(self.staff, location="Bangalore")
+        copy = make_job(self.staff, location="Bangalore", duplicate_of=original)
+
+        self.assertEqual(alerts.notify_for_job(expired), 0)
+        self.assertEqual(alerts.notify_for_job(copy), 0)
+        self.assertFalse(self.alerts_for(self.user).exists())
+
+
+# -------------------------------------------------
+# JOB DETAIL / APPLIED-ID CACHES
+# -------------------------------------------------
+class JobDetailCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+        self.job = make_job(self.staff, title="Data Engineer")
+
+    def test_snapshot_is_served_from_cache(self):
+        job_cache.get_job_snapshot(self.job.id)
+
+        with self.assertNumQueries(0):
+            snapshot = job_cache.get_job_snapshot(self.job.id)
+        self.assertEqual(snapshot["title"], "Data Engineer")
+
+    def test_edit_invalidates_after_commit(self):
+        job_cache.get_job_snapshot(self.job.id)
+
+        self.job.title = "Senior Data Engineer"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+
+        self.assertEqual(job_cache.get_job_snapshot(self.job.id)["title"], "Senior Data Engineer")
+
+    def test_expiry_invalidates_bulk_updates(self):
+        job_cache.get_job_snapshot(self.job.id)
+        Job.objects.filter(pk=self.job.pk).update(deadline=timezone.localdate() - timedelta(days=1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            expiry.expire_due_jobs()
+
+        snapshot = job_cache.get_job_snapshot(self.job.id)
+        self.assertEqual(snapshot["status"], "EXPIRED")
+        self.assertFalse(job_cache.is_live(snapshot))
+
+
+class AppliedCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+        cls.jobs = [make_job(cls.staff) for _ in range(3)]
+
+    def setUp(self):
+        cache.clear()
+        self.user = complete_profile(make_user("candidate@example.com"))
+
+    def test_applied_ids_cached_and_kept_current(self):
+        self.assertNotIn(self.jobs[0].id, applied_job_ids(self.user))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            applications.apply_to_job(self.user, self.jobs[0])
+
+        with self.assertNumQueries(0):
+            self.assertIn(self.jobs[0].id, applied_job_ids(self.user))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            JobApplication.objects.filter(user=self.user).delete()
+
+        with self.assertNumQueries(0):
+            self.assertNotIn(self.jobs[0].id, applied_job_ids(self.user))
+
+    def test_bulk_apply_updates_the_cached_set(self):
+        applied_job_ids(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            applications.bulk_apply(self.user, [job.id for job in self.jobs[:2]])
+
+        self.assertEqual(sorted(applied_job_ids(self.user)), sorted(job.id for job in self.jobs[:2]))
+
+    def test_apply_permission_annotations(self):
+        pro_job = make_job(self.staff, visibility="PRO")
+        JobApplication.objects.create(user=self.user, job=self.jobs[0])
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = {
+                job.id: (job.is_applied, job.can_apply, job.required_plan)
+                for job in with_apply_permission(listed_jobs(), self.user)
+            }
+
+        self.assertEqual(rows[self.jobs[0].id], (True, False, None))
+        self.assertEqual(rows[self.jobs[1].id], (False, True, None))
+        self.assertEqual(rows[pro_job.id], (False, False, "PRO"))
+        self.assertNotIn("jobs_jobapplication", queries[-1]["sql"])
+
+
+# -------------------------------------------------
+# MODERATION
+# -------------------------------------------------
+class ModerationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email="admin@example.com", password="pass12345")
+        cls.staff = make_user("staff@example.com", is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+        self.pending = [make_job(self.staff, status="PENDING") for _ in range(2)]
+        self.published = make_job(self.staff)
+
+    def post(self, data, user=None):
+        self.client.force_login(user or self.admin)
+        return self.client.post(reverse("moderate_jobs"), data, content_type="application/json")
+
+    def test_only_pending_jobs_move(self):
+        ids = [job.id for job in self.pending]
+
+        moved = moderation.moderate_jobs(
+            [ids[1], self.published.id, 999999, "x", ids[0], ids[1]], moderation.APPROVE, self.admin
+        )
+
+        self.assertEqual(moved, [ids[1], ids[0]])
+        self.assertEqual(
+            set(Job.objects.filter(id__in=ids).values_list("status", flat=True)), {"PUBLISHED"}
+        )
+        self.assertEqual(
+            sorted(JobModeration.objects.values_list("job_id", "from_status", "to_status")),
+            [(ids[0], "PENDING", "PUBLISHED"), (ids[1], "PENDING", "PUBLISHED")]
+        )
+
+        # already moderated: nothing moves, no audit rows
+        self.assertEqual(moderation.moderate_jobs(ids, moderation.REJECT, self.admin), [])
+        self.assertEqual(JobModeration.objects.count(), 2)
+
+    def test_caches_and_alerts_wait_for_commit(self):
+        job = self.pending[0]
+        job_cache.get_job_snapshot(job.id)
+        user = make_user("candidate@example.com")
+        alerts.create_saved_search(user, {"skills": "python"})
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            moderation.moderate_jobs([job.id], moderation.APPROVE, self.admin)
+
+            self.assertEqual(job_cache.get_job_snapshot(job.id)["status"], "PENDING")
+            self.assertFalse(Notification.objects.filter(user=user).exists())
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(job_cache.get_job_snapshot(job.id)["status"], "PUBLISHED")
+        self.assertTrue(Notification.objects.filter(user=user, title="New job for your saved search").exists())
+
+    def test_reject_releases_near_duplicates(self):
+        description = " ".join(f"word{i}" for i in range(30))
+        fields = {"status": "PENDING", "title": "QA Engineer", "company_name": "Testco", "description": description}
+        original = make_job(self.staff, **fields)
+        copy = make_job(self.staff, **fields)
+        copy.refresh_from_db()
+        self.assertEqual(copy.duplicate_of_id, original.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            moderation.moderate_jobs([original.id], moderation.REJECT, self.admin)
+
+        copy.refresh_from_db()
+        self.assertIsNone(copy.duplicate_of_id)
+
+    def test_json_endpoint(self):
+        ids = [job.id for job in self.pending]
+
+        response = self.post({"job_ids": ids, "action": "approve"})
+
+        self.assertEqual(response.json(), {"action": "approve", "moderated": ids})
+
+    def test_bad_requests_are_rejected(self):
+        ids = [job.id for job in self.pending]
+        too_many = list(range(1, moderation.MODERATION_MAX + 2))
+
+        for data in (
+            {"job_ids": ids, "action": "delete"},
+            {"job_ids": [], "action": "approve"},
+            {"job_ids": too_many, "action": "approve"},
+            {"job_ids": "1,2", "action": "approve"},
+        ):
+            self.assertEqual(self.post(data).status_code, 400, data)
+        self.assertFalse(JobModeration.objects.exists())
+
+    def test_admins_only(self):
+        ids = [job.id for job in self.pending]
+
+        self.assertEqual(self.post({"job_ids": ids, "action": "approve"}, user=self.staff).status_code, 403)
+
+        self.client.force_login(self.staff)
+        response = self.client.post(reverse("moderate_jobs"), {"job_ids": ids, "action": "approve"})
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(JobModeration.objects.exists())
+
+
+# -------------------------------------------------
+# IMPORT
+# -------------------------------------------------
+class JobImportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+
+    def row(self, **fields):
+        values = {
+            "title": "Import Engineer", "company": "Feedco", "location": "Pune",
+            "exp_min": "0", "exp_max": "2", "description": "Imported from the partner feed",
+            "skills": "python", "deadline": "2030-01-31",
+        }
+        values.update(fields)
+        return values
+
+    def test_bad_rows_are_reported_and_skipped(self):
+        rows = [
+            self.row(),
+            self.row(title=""),
+            self.row(title="Import Analyst", exp_min="x"),
+            self.row(title="Import Lead", deadline="someday"),
+            {"__error__": "Not a JSON object."},
+        ]
+
+        report = job_import.import_jobs(iter(rows), created_by=self.staff)
+
+        self.assertEqual((report.processed, report.created, report.error_count), (5, 1, 4))
+        self.assertEqual([e["row"] for e in report.errors], [2, 3, 4, 5])
+        self.assertIn("title", report.errors[0]["error"])
+
+    def test_duplicates_in_file_and_table_are_skipped(self):
+        job_import.import_jobs(iter([self.row()]), created_by=self.staff)
+
+        report = job_import.import_jobs(
+            iter([self.row(title="IMPORT ENGINEER", company="feedco"), self.row(title="Import QA")]),
+            created_by=self.staff,
+        )
+
+        self.assertEqual((report.created, report.duplicates), (1, 1))
+
+    def test_unreadable_files_raise_a_read_error(self):
+        with self.assertRaises(job_import.ImportFormatError):
+            job_import.detect_format("jobs.pdf")
+
+        with self.assertRaises(job_import.READ_ERRORS):
+            list(job_import.iter_rows(io.BytesIO(b"title\n\xff\xfe\n"), "csv"))
+
+    def test_jsonl_lines_that_are_not_objects_become_row_errors(self):
+        data = b'{"title": "Import Engineer"}\n[1, 2]\nnot json\n'
+        rows = list(job_import.iter_rows(io.BytesIO(data), "jsonl"))
+
+        self.assertEqual(rows[0], {"title": "Import Engineer"})
+        self.assertEqual([r.get("__error__") for r in rows[1:]], ["Not a JSON object."] * 2)
+
+
+# -------------------------------------------------
+# NEAR-DUPLICATES
+# -------------------------------------------------
+class NearDuplicateTests(TestCase):
+
+    DESCRIPTION = (
+        "We are hiring a python developer to build and run django services for our payments platform. "
+        "You will design APIs, write tests, review code, tune postgres queries, run celery workers "
+        "and ship docker images to production every week with a small friendly team in Chennai."
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com", is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def post(self, **fields):
+        values = {"title": "Python Developer", "company_name": "Payco", "description": self.DESCRIPTION}
+        values.update(fields)
+        return make_job(self.staff, **values)
+
+    def test_bands_catch_every_signature_within_max_distance(self):
+        value = dedupe.simhash("Python Developer", "Payco", self.DESCRIPTION)
+
+        # one flipped bit in each of three bands: one band still matches
+        near = value ^ (1 << 3) ^ (1 << 20) ^ (1 << 40)
+        self.assertEqual(dedupe.distance(value, near), 3)
+        self.assertTrue(set(enumerate(dedupe.bands(value))) & set(enumerate(dedupe.bands(near))))
+
+    def test_reworded_posting_is_near_and_a_different_job_is_not(self):
+        value = dedupe.simhash("Python Developer", "Payco", self.DESCRIPTION)
+        reworded = dedupe.simhash("Python Developer", "Payco", self.DESCRIPTION + " and redis")
+        other = dedupe.simhash("Sales Manager", "Shopco", "Own the enterprise sales pipeline in the north region")
+
+        self.assertLessEqual(dedupe.distance(value, reworded), dedupe.MAX_DISTANCE)
+        self.assertGreater(dedupe.distance(value, other), dedupe.MAX_DISTANCE)
+
+    def test_copy_is_flagged_and_not_listed_or_recommended(self):
+        original = self.post()
+        copy = self.post(description=self.DESCRIPTION + " and redis")
+        copy.refresh_from_db()
+
+        self.assertEqual(copy.duplicate_of_id, original.id)
+        self.assertNotIn(copy, listed_jobs())
+
+        user = make_user("candidate@example.com")
+        user.profile.skills = "python, django"
+        user.profile.save()
+        recommendations.refresh_for_user(user)
+
+        recommended = set(JobRecommendation.objects.filter(user=user).values_list("job_id", flat=True))
+        self.assertIn(original.id, recommended)
+        self.assertNotIn(copy.id, recommended)
+        self.assertNotIn(copy, recommendations.recommended_jobs_queryset(user))
+
+    def test_copy_is_released_when_the_original_expires(self):
+        original = self.post()
+        copy = self.post(description=self.DESCRIPTION + " and redis")
+        Job.objects.filter(pk=original.pk).update(deadline=timezone.localdate() - timedelta(days=1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            expiry.expire_due_jobs()
+
+        copy.refresh_from_db()
+        self.assertIsNone(copy.duplicate_of_id)
+        self.assertIn(copy, listed_jobs())
+
+    def test_later_copies_move_to_the_oldest_remaining_job(self):
+        original = self.post()
+        first = self.post(description=self.DESCRIPTION + " Apply today.")
+        second = self.post(description=self.DESCRIPTION + " and kafka")
+
+        original.status = "REJECTED"
+        with self.captureOnCommitCallbacks(execute=True):
+            original.save(update_fields=["status"])
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertIsNone(first.duplicate_of_id)
+        self.assertEqual(second.duplicate_of_id, first.id)
+
+
+# -------------------------------------------------
+# EXPORTS
+# -------------------------------------------------
+class ExportViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        staff = make_user("staff@example.com", is_staff=True)
+        cls.user = make_user("candidate@example.com")
+        other = make_user("other@example.com")
+
+        cls.jobs = [make_job(staff, title=f"Data Engineer {i}", company_name="Dataco") for i in range(2)]
+        for job in cls.jobs:
+            JobApplication.objects.create(user=cls.user, job=job)
+            SavedJob.objects.create(user=cls.user, job=job)
+        JobApplication.objects.create(user=other, job=make_job(staff, title="Someone Else's Job"))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def get(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_applications_csv_is_the_users_own(self):
+        response, body = self.get("export_applications")
+
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="applications.csv"')
+        lines = body.splitlines()
+        self.assertEqual(lines[0], "Title,Company,Location,Status,Applied At")
+        self.assertEqual(
+            [line.split(",")[:4] for line in lines[1:]],
+            [
+                ["Data Engineer 1", "Dataco", "Chennai", "APPLIED"],
+                ["Data Engineer 0", "Dataco", "Chennai", "APPLIED"],
+            ]
+        )
+
+    def test_saved_jobs_json(self):
+        response, body = self.get("export_saved_jobs", format="json")
+
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="saved_jobs.json"')
+        self.assertEqual([row["title"] for row in json.loads(body)], ["Data Engineer 1", "Data Engineer 0"])
+
+    def test_unknown_format_is_csv(self):
+        response, body = self.get("export_saved_jobs", format="pdf")
+
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="saved_jobs.csv"')
+        self.assertTrue(body.startswith("Title,Company,Location,Job Type,Deadline,Saved At"))
@@ -6,13 +6,21 @@ urlpatterns = [
     path('review/', views.review_jobs, name='review_jobs'),
     path('approve/<int:job_id>/', views.approve_job, name='approve_job'),
     path('reject/<int:job_id>/', views.reject_job, name='reject_job'),
+    path('review/moderate/', views.moderate_jobs, name='moderate_jobs'),
     path('active/', views.active_jobs, name='active_jobs'),
     path("search/", views.search_jobs, name="search_jobs"),
     path("save/<int:job_id>/", views.save_job, name="save_job"),
     path("saved/", views.saved_jobs, name="saved_jobs"),
     path("apply/<int:job_id>/", views.apply_job, name="apply_job"),
+    path("bulk/apply/", views.bulk_apply_jobs, name="bulk_apply_jobs"),
+    path("bulk/save/", views.bulk_save_jobs, name="bulk_save_jobs"),
     path("applications/", views.applications, name="applications"),
+    path("applications/export/", views.export_applications, name="export_applications"),
+    path("saved/export/", views.export_saved_jobs, name="export_saved_jobs"),
     path("job/<int:job_id>/", views.job_detail, name="job_detail"),
+    path("searches/", views.saved_searches, name="saved_searches"),
+    path("searches/save/", views.save_search, name="save_search"),
+    path("searches/<int:search_id>/delete/", views.delete_saved_search, name="delete_saved_search"),
     
 
 ]
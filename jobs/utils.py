@@ -1,67 +1,104 @@
+from django.db.models import BooleanField, Case, CharField, Value, When
+from django.utils import timezone
+
 from .models import Job
+from .services.applied import applied_job_ids
+
+
+def live_jobs():
+    """
+    Published and not past the deadline. `expire_jobs` moves expired
+    rows to EXPIRED; the deadline check covers the gap between sweeps.
+    """
+    return Job.objects.filter(status="PUBLISHED", deadline__gte=timezone.localdate())
+
+
+def listed_jobs():
+    """ Live jobs minus flagged near-duplicates (jobs.services.dedupe). """
+    return live_jobs().filter(duplicate_of__isnull=True)
 
 
 def visible_jobs_for_user(user):
     """
     Everyone can SEE all published jobs
-    (used for listing & detail page)
+    (used for listing & detail page) — except flagged near-duplicates
     """
-    return Job.objects.filter(status="PUBLISHED")
+    return listed_jobs()
 
 
 from accounts.models import User
 
-def can_user_apply(user, job):
+# which Job.visibility tiers each plan may apply to
+PLAN_VISIBILITY = {
+    User.FREE: ["FREE"],
+    User.PRO: ["FREE", "PRO"],
+    User.PRO_PLUS: ["FREE", "PRO", "PROPLUS"],
+}
+
+
+def allowed_visibility(user):
+    """
+    Job.visibility values the user may apply to. Uses the ACTIVE plan —
+    an expired / cancelled PRO user is treated as FREE.
+    """
+    from jobs.services.quota import get_active_plan
 
     if not user.is_authenticated:
-        return False
+        return []
 
-    plan = getattr(user, "plan", User.FREE)
+    return PLAN_VISIBILITY.get(get_active_plan(user), PLAN_VISIBILITY[User.FREE])
 
-    # FREE jobs → everyone logged in
-    if job.visibility == "FREE":
-        return True
 
-    # PRO jobs → PRO & PROPLUS
-    if job.visibility == "PRO":
-        return plan in [User.PRO, User.PRO_PLUS]
+def can_user_apply(user, job):
+    return job.visibility in allowed_visibility(user)
 
-    # PROPLUS jobs → only PROPLUS
-    if job.visibility == "PROPLUS":
-        return plan == User.PRO_PLUS
 
-    return False
+def with_apply_permission(queryset, user):
+    """
+    Annotate a Job queryset with the per-user permission, in SQL:
 
-from django.utils import timezone
-from datetime import timedelta
-from jobs.models import JobApplication
+      is_applied     already applied
+      can_apply      plan allows it and not applied yet
+      required_plan  visibility to upgrade to (None if the plan covers it)
 
+    is_applied is fed from the cached applied-id set (id IN (...)), so
+    there's no JobApplication subquery in the listing SQL either.
+    """
+    allowed = allowed_visibility(user)
+    applied = list(applied_job_ids(user))
+
+    if applied:
+        is_applied = Case(
+            When(id__in=applied, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    else:
+        is_applied = Value(False)
+
+    return queryset.annotate(
+        is_applied=is_applied,
+    ).annotate(
+        can_apply=Case(
+            When(is_applied=True, then=Value(False)),
+            When(visibility__in=allowed, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+        required_plan=Case(
+            When(visibility__in=allowed, then=Value(None)),
+            default="visibility",
+            output_field=CharField(),
+        ),
+    )
 
 def can_apply(user):
     """
     Monthly job application quota based on subscription plan
     Returns: allowed, used, limit
-    """
-
-    # FREE PLAN → 20 applications/month
-    if user.plan == User.FREE:
-        limit = 20
 
-    # PRO PLAN → 100 applications/month
-    elif user.plan == User.PRO:
-        limit = 100
-
-    # PRO PLUS → unlimited
-    else:
-        return True, 0, None
-
-    one_month_ago = timezone.now() - timedelta(days=30)
-
-    used = JobApplication.objects.filter(
-        user=user,
-        applied_at__gte=one_month_ago
-    ).count()
-
-    allowed = used < limit
+    (kept for old imports — the quota lives in jobs.services.quota)
+    """
+    from jobs.services.quota import can_apply_quota
 
-    return allowed, used, limit
+    return can_apply_quota(user)
@@ -1,11 +1,29 @@
+import json
 from django.shortcuts import render, redirect
+from django.urls import reverse
+from django.http import Http404, HttpResponseForbidden, JsonResponse
+from django.views.decorators.http import require_POST
 from django.contrib import messages
 from accounts.decorators import staff_required, admin_required
 from django.contrib.auth.decorators import login_required
-from .models import Job, SavedJob, JobApplication
+from .models import Job, SavedJob, JobApplication, SavedSearch, job_card_fields
 from django.shortcuts import get_object_or_404
-from jobs.utils import visible_jobs_for_user, can_user_apply
-from jobs.services.quota import can_apply_quota
+from jobs.utils import visible_jobs_for_user, with_apply_permission, allowed_visibility
+from jobs.services import job_cache
+from jobs.services.applied import applied_job_ids
+from jobs.services.search import relevance_field
+from jobs.services.locations import filter_by_location
+from jobs.services.facets import apply_facet_filters, facet_counts
+from core.utils.pagination import paginate_keyset
+from core.utils.export import stream_export, EXPORT_CHUNK_SIZE
+from jobs.services.recommendations import recommended_jobs_queryset
+from jobs.services.skills import filter_by_skills
+from jobs.services import alerts, moderation
+from jobs.services.job_import import clean_job_data
+from jobs.services.quota import quota_status
+from jobs.tasks import notify_saved_searches
+from functools import partial
+from django.db import transaction
 
 
 
@@ -13,36 +31,28 @@ from jobs.services.quota import can_apply_quota
 def create_job(request):
     if request.method == "POST":
 
-        exp_min = request.POST.get("exp_min")
-        exp_max = request.POST.get("exp_max")
-
-        if not exp_min or not exp_max:
-            messages.error(request, "Experience range is required.")
-            return redirect("create_job")
-
-        try:
-            exp_min = int(exp_min)
-            exp_max = int(exp_max)
-        except ValueError:
-            messages.error(request, "Experience must be numeric.")
+        # same rules as the bulk import (jobs.services.job_import)
+        fields, error = clean_job_data(request.POST)
+        if error:
+            messages.error(request, error)
             return redirect("create_job")
 
-        Job.objects.create(
-            title=request.POST.get("title"),
-            company_name=request.POST.get("company"),
-            location=request.POST.get("location"),
-            experience_min=exp_min,
-            experience_max=exp_max,
-            job_type=request.POST.get("job_type"),
-            description=request.POST.get("description"),
-            skills=request.POST.get("skills"),
-            deadline=request.POST.get("deadline"),
-            tag_fresher=bool(request.POST.get("fresher")),
-            visibility=request.POST.get("visibility"),
+        job = Job.objects.create(
+            **fields,
             created_by=request.user,
             status="PENDING" if not request.user.is_superuser else "PUBLISHED"
         )
 
+        if job.status == "PUBLISHED":
+            transaction.on_commit(partial(notify_saved_searches.enqueue, job.id))
+
+        # flagged by the SimHash index (jobs.signals)
+        if job.duplicate_of_id:
+            messages.warning(
+                request,
+                f"This looks like a duplicate of job #{job.duplicate_of_id}; it is hidden from job listings."
+            )
+
         messages.success(
             request,
             "Job submitted for approval." if not request.user.is_superuser else "Job published."
@@ -55,16 +65,21 @@ def create_job(request):
 
 @admin_required
 def review_jobs(request):
-    jobs = Job.objects.filter(status="PENDING")
+    jobs = paginate_keyset(
+        request,
+        Job.objects.filter(status="PENDING").select_related("created_by", "duplicate_of"),
+        per_page=50
+    )
     return render(request, "jobs/review_jobs.html", {"jobs": jobs})
 
 
 @admin_required
 def approve_job(request, job_id):
-    job = Job.objects.get(id=job_id)
-    job.status = "PUBLISHED"
-    job.save()
-    messages.success(request, "Job approved and published.")
+    # same path as the batch queue: audit row + alerts / cache post-commit
+    if moderation.moderate_jobs([job_id], moderation.APPROVE, request.user):
+        messages.success(request, "Job approved and published.")
+    else:
+        messages.info(request, "Job is no longer pending.")
     return redirect("review_jobs")
 
 from accounts.decorators import staff_required
@@ -72,25 +87,26 @@ from .models import Job
 
 @staff_required
 def active_jobs(request):
-    jobs = Job.objects.filter(status="PUBLISHED").order_by("-created_at")
+    jobs = paginate_keyset(
+        request,
+        Job.objects.filter(status="PUBLISHED").cards().select_related("created_by"),
+        per_page=25
+    )
     return render(request, "jobs/active_jobs.html", {"jobs": jobs})
 
 
 
 @admin_required
 def reject_job(request, job_id):
-    job = Job.objects.get(id=job_id)
-    job.status = "REJECTED"
-    job.save()
-    messages.error(request, "Job rejected.")
+    if moderation.moderate_jobs([job_id], moderation.REJECT, request.user):
+        messages.error(request, "Job rejected.")
+    else:
+        messages.info(request, "Job is no longer pending.")
     return redirect("review_jobs")
 
 #candidate search job
-from django.core.paginator import Paginator
+from .utils import visible_jobs_for_user
 
-from .utils import visible_jobs_for_user, can_user_apply
-
-from django.db.models import Q
 from jobs.models import JobApplication
 
 @login_required
@@ -101,23 +117,21 @@ def search_jobs(request):
     # show all published jobs (no hiding)
     jobs = visible_jobs_for_user(user)
 
-    # Matching jobs
+    # Matching jobs (precomputed recommendation list, ranked by score)
     if request.GET.get("match") == "1" and profile and profile.skills:
-        skills_list = [s.strip() for s in profile.skills.split(",")]
-
-        query = Q()
-        for skill in skills_list:
-            query |= Q(skills__icontains=skill) | Q(title__icontains=skill)
-
-        jobs = jobs.filter(query)
+        jobs = recommended_jobs_queryset(user)
 
     # filters
     location = request.GET.get("location")
+    skills = request.GET.get("skills")
     job_type = request.GET.get("job_type")
     exp = request.GET.get("exp")
 
-    if location:
-        jobs = jobs.filter(location__icontains=location)
+    # location → gazetteer (aliases, typos); unknown places → full-text index
+    jobs = filter_by_location(jobs, location)
+
+    # any of the listed skills: JobSkill index; partial / unknown terms → full-text index
+    jobs = filter_by_skills(jobs, skills)
 
     if job_type:
         jobs = jobs.filter(job_type=job_type)
@@ -128,45 +142,31 @@ def search_jobs(request):
             experience_max__gte=exp
         )
 
-    paginator = Paginator(jobs.order_by("-created_at"), 6)
-    page_obj = paginator.get_page(request.GET.get("page"))
-
-    # 🔹 Attach permission to each job
-    job_list = list(page_obj.object_list)
+    # visibility / fresher / company / experience band
+    jobs = apply_facet_filters(jobs, request.GET)
 
-    # get all applied job ids in one query (FAST)
-    applied_job_ids = set(
-        JobApplication.objects.filter(user=user)
-        .values_list("job_id", flat=True)
-    )
-
-    for job in job_list:
-        job.is_applied = job.id in applied_job_ids
-        job.can_apply = can_user_apply(user, job) and not job.is_applied
-
-        # determine upgrade target
-        if job.visibility == "FREE":
-            job.required_plan = None
-        elif job.visibility == "PRO":
-            job.required_plan = "PRO"
-        elif job.visibility == "PROPLUS":
-            job.required_plan = "PROPLUS"
+    # per-facet counts over the filtered set (one grouped query)
+    facets = facet_counts(jobs, request.GET)
 
+    # keyset paging on (relevance | created_at, id) — no COUNT / OFFSET
+    field = relevance_field(jobs)
 
-
-    page_obj.object_list = job_list
+    # is_applied / can_apply / required_plan in SQL (fed from the cached applied ids)
+    page_obj = paginate_keyset(
+        request, with_apply_permission(jobs.cards(), user), per_page=6, field=field
+    )
 
     return render(
         request,
         "jobs/search_jobs.html",
         {
             "jobs": page_obj,
+            "facets": facets,
             "is_matching": request.GET.get("match") == "1"
         }
     )
 
 
-from .utils import can_user_apply
 from .models import Job
 
 # @login_required
@@ -187,28 +187,24 @@ from .models import Job
 #     })
 @login_required
 def job_detail(request, job_id):
-    job = get_object_or_404(Job, id=job_id, status="PUBLISHED")
+    # shared job body from cache (keyed by id + updated_at)
+    job = job_cache.get_job_snapshot(job_id)
+    if job is None or not job_cache.is_live(job):
+        raise Http404("Job not found")
 
-    is_applied = JobApplication.objects.filter(
-        user=request.user,
-        job=job
-    ).exists()
-
-    can_apply_permission = can_user_apply(request.user, job)
-
-    # final permission
-    can_apply = can_apply_permission and not is_applied
+    # per-user overlay: cached applied ids + the active plan
+    is_applied = job["id"] in applied_job_ids(request.user)
+    plan_allows = job["visibility"] in allowed_visibility(request.user)
 
     # show upgrade only if plan restriction (NOT applied)
-    required_plan = None
-    if not can_apply_permission and not is_applied:
-        required_plan = job.visibility
+    required_plan = None if is_applied or plan_allows else job["visibility"]
 
     return render(request, "jobs/job_detail.html", {
         "job": job,
-        "can_apply": can_apply,
+        "can_apply": plan_allows and not is_applied,
         "is_applied": is_applied,
-        "required_plan": required_plan
+        "required_plan": required_plan,
+        "detail_timeout": job_cache.DETAIL_TIMEOUT,
     })
 
 #save job
@@ -224,78 +220,242 @@ def save_job(request, job_id):
 #saved job page
 @login_required
 def saved_jobs(request):
-    jobs = SavedJob.objects.filter(user=request.user)
+    jobs = paginate_keyset(
+        request,
+        SavedJob.objects.filter(user=request.user)
+        .select_related("job")
+        .only("id", "saved_at", *job_card_fields("job")),
+        field="saved_at"
+    )
     return render(request, "jobs/saved_jobs.html", {"jobs": jobs})
 
-from accounts.models import Notification
-
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
 
 from jobs.models import Job, JobApplication, SavedJob
-from accounts.models import Notification
+from jobs.services import applications as apply_service
 
 
 @login_required
 def apply_job(request, job_id):
 
-    profile = request.user.profile
+    # quota lock + insert + counter in one short transaction;
+    # admin alert and saved-job cleanup run post-commit (jobs.tasks)
+    outcome, info = apply_service.apply_to_job(request.user, job_id)
+
+    if outcome == apply_service.NOT_FOUND:
+        raise Http404("Job not found")
 
     # PROFILE COMPLETION CHECK
-    if profile.completion_percentage() < 100:
+    if outcome == apply_service.PROFILE_INCOMPLETE:
         messages.warning(
             request,
             "Please complete your profile (100%) before applying for jobs."
         )
         return redirect("my_profile")
 
-    # MONTHLY QUOTA CHECK
-    allowed, used, limit = can_apply_quota(request.user)
+    if outcome == apply_service.PLAN_REQUIRED:
+        messages.warning(request, f"This is a {info} job. Upgrade your plan to apply.")
+        return redirect("settings")
 
-    if not allowed:
+    # MONTHLY QUOTA CHECK
+    if outcome == apply_service.QUOTA_EXCEEDED:
         messages.error(
             request,
-            f"Monthly application limit reached ({limit}). Upgrade your plan to continue applying."
+            f"Monthly application limit reached ({info}). Upgrade your plan to continue applying."
         )
         return redirect("settings")
 
-    # GET JOB
-    job = get_object_or_404(Job, id=job_id)
-
-    # APPLY (PREVENT DUPLICATE APPLICATIONS)
-    application, created = JobApplication.objects.get_or_create(
-        user=request.user,
-        job=job
-    )
-
-    if not created:
+    if outcome == apply_service.ALREADY_APPLIED:
         messages.info(request, "You have already applied for this job.")
         return redirect("applications")
 
-    # ADMIN ALERT (ONLY FIRST TIME APPLY)
-    Notification.objects.create(
-        user=None,  # admin alert
-        title="New Job Application",
-        message=f"{request.user.full_name} applied for {job.title}"
-    )
-
-    # REMOVE FROM SAVED JOBS (IF EXISTS)
-    SavedJob.objects.filter(
-        user=request.user,
-        job=job
-    ).delete()
-
     # SUCCESS MESSAGE
     messages.success(request, "Application submitted successfully.")
     return redirect("applications")
 
 
+# =========================
+# Bulk apply / save (JSON)
+# =========================
+def _posted_job_ids(request):
+    """ {"job_ids": [..]} JSON body, or job_ids=..&job_ids=.. form post. """
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or "{}")
+        except ValueError:
+            return None
+        job_ids = data.get("job_ids") if isinstance(data, dict) else None
+        return job_ids if isinstance(job_ids, list) else None
+
+    return request.POST.getlist("job_ids")
+
+
+@login_required
+@require_POST
+def bulk_apply_jobs(request):
+    job_ids = _posted_job_ids(request)
+    if job_ids is None:
+        return JsonResponse({"error": "job_ids must be a list"}, status=400)
+
+    results = apply_service.bulk_apply(request.user, job_ids)
+    used, limit, remaining = quota_status(request.user)
+
+    return JsonResponse({
+        "results": results,
+        "applied": sum(1 for r in results.values() if r == apply_service.APPLIED),
+        "quota": {"used": used, "limit": limit, "remaining": remaining},
+    })
+
+
+@login_required
+@require_POST
+def moderate_jobs(request):
+    """ Approve / reject many pending jobs: form post from the queue or JSON. """
+    is_json = request.content_type == "application/json"
+
+    # admins only; a 403, not admin_required's redirect, for API clients
+    if not request.user.is_superuser:
+        if is_json:
+            return JsonResponse({"error": "Admin access required."}, status=403)
+        return HttpResponseForbidden("Admin access required.")
+
+    job_ids = _posted_job_ids(request)
+
+    if is_json:
+        try:
+            action = json.loads(request.body or "{}").get("action")
+        except (ValueError, AttributeError):
+            action = None
+    else:
+        action = request.POST.get("action")
+
+    if (
+        not job_ids
+        or len(job_ids) > moderation.MODERATION_MAX
+        or action not in moderation.ACTION_STATUS
+    ):
+        if is_json:
+            return JsonResponse(
+                {"error": f"job_ids must be a list of 1–{moderation.MODERATION_MAX} ids and action approve|reject"},
+                status=400
+            )
+        messages.error(request, "Select jobs and an action.")
+        return redirect("review_jobs")
+
+    moved = moderation.moderate_jobs(job_ids, action, request.user)
+
+    if is_json:
+        return JsonResponse({"action": action, "moderated": moved})
+
+    verb = "approved" if action == moderation.APPROVE else "rejected"
+    messages.success(request, f"{len(moved)} job(s) {verb}.")
+    return redirect("review_jobs")
+
+
+@login_required
+@require_POST
+def bulk_save_jobs(request):
+    job_ids = _posted_job_ids(request)
+    if job_ids is None:
+        return JsonResponse({"error": "job_ids must be a list"}, status=400)
+
+    results = apply_service.bulk_save(request.user, job_ids)
+
+    return JsonResponse({
+        "results": results,
+        "saved": sum(1 for r in results.values() if r == apply_service.SAVED),
+    })
+
+
 
 #application page
 @login_required
 def applications(request):
-    applications = JobApplication.objects.filter(user=request.user)
+    applications = paginate_keyset(
+        request,
+        JobApplication.objects.filter(user=request.user)
+        .select_related("job")
+        .only("id", "status", "applied_at", *job_card_fields("job")),
+        field="applied_at",
+        count_limit=1000
+    )
     return render(request, "jobs/applications.html", {"applications": applications})
 
 
+# =========================
+# Exports (streamed, constant memory)
+# =========================
+@login_required
+def export_saved_jobs(request):
+    rows = (
+        SavedJob.objects.filter(user=request.user)
+        .order_by("-saved_at", "-id")
+        .values_list(
+            "job__title", "job__company_name", "job__location",
+            "job__job_type", "job__deadline", "saved_at",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    return stream_export(
+        rows,
+        ["Title", "Company", "Location", "Job Type", "Deadline", "Saved At"],
+        "saved_jobs",
+        request.GET.get("format"),
+    )
+
+
+@login_required
+def export_applications(request):
+    rows = (
+        JobApplication.objects.filter(user=request.user)
+        .order_by("-applied_at", "-id")
+        .values_list(
+            "job__title", "job__company_name", "job__location",
+            "status", "applied_at",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    return stream_export(
+        rows,
+        ["Title", "Company", "Location", "Status", "Applied At"],
+        "applications",
+        request.GET.get("format"),
+    )
+
+
+# =========================
+# Saved searches (alerts)
+# =========================
+@login_required
+@require_POST
+def save_search(request):
+    saved, error = alerts.create_saved_search(
+        request.user, request.POST, request.POST.get("name")
+    )
+    if error:
+        messages.error(request, error)
+    else:
+        messages.success(request, f"Search saved. We'll notify you about new jobs for “{saved.name}”.")
+
+    query = request.POST.get("query", "")
+    return redirect(f"{reverse('search_jobs')}?{query}" if query else "search_jobs")
+
+
+@login_required
+def saved_searches(request):
+    searches = SavedSearch.objects.filter(user=request.user).select_related("location_tag")
+    return render(request, "jobs/saved_searches.html", {
+        "searches": searches,
+        "limit": alerts.MAX_SAVED_SEARCHES,
+    })
+
+
+@login_required
+@require_POST
+def delete_saved_search(request, search_id):
+    search = get_object_or_404(SavedSearch, id=search_id, user=request.user)
+    search.delete()
+    messages.success(request, "Saved search removed.")
+    return redirect("saved_searches")
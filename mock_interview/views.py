@@ -4,6 +4,7 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import get_user_model
 from .models import MockInterview, InterviewFeedback
 from accounts.models import Notification
+from accounts.services.notifications import notify, notify_admins, send
 
 User = get_user_model()
 
@@ -24,12 +25,11 @@ def schedule_mock(request):
         )
 
         # 🔔 notify admins
-        Notification.objects.create(
-            user=None,
-            title="Mock Interview Request",
-            message=f"New mock interview request from {request.user.email} completed",
+        notify_admins(
+            "Mock Interview Request",
+            f"New mock interview request from {request.user.email} completed",
             type=Notification.TRAINER,
-            is_admin_alert=True
+            priority=True
         )
 
 
@@ -114,27 +114,31 @@ def admin_mock_update(request, pk):
 
         # 🔔 notify candidate when scheduled
         if interview.status == "scheduled":
-            Notification.objects.create(
-                user=interview.candidate,
-                title="Interview Scheduled",
-                message="Your mock interview has been scheduled. Check My Interview section."
-            )
-
-            # 🔔 notify admin (THIS FIXES COUNTER)
-            Notification.objects.create(
-                user=None,
-                title="Interview Scheduled",
-                message=f"Trainer Completed interview for {interview.candidate.email} and submitted report",
-                type=Notification.TRAINER
-            )
+            batch = [
+                Notification(
+                    user=interview.candidate,
+                    title="Interview Scheduled",
+                    message="Your mock interview has been scheduled. Check My Interview section."
+                ),
+
+                # 🔔 notify admin (THIS FIXES COUNTER)
+                Notification(
+                    user=None,
+                    title="Interview Scheduled",
+                    message=f"Trainer Completed interview for {interview.candidate.email} and submitted report",
+                    type=Notification.TRAINER
+                ),
+            ]
 
             # 🔔 notify trainer (NEW)
             if interview.consultant:
-                Notification.objects.create(
+                batch.append(Notification(
                     user=interview.consultant,
                     title="New Mock Interview Assigned",
                     message=f"You have been assigned a mock interview with {interview.candidate.email}"
-                )
+                ))
+
+            send(batch)
 
 
         return redirect("admin_mock_list")
@@ -169,17 +173,16 @@ def mock_feedback(request, pk):
 
         # 🔔 notify candidate feedback ready
         # 🔔 notify candidate
-        Notification.objects.create(
-            user=interview.candidate,
-            title="Interview Feedback Ready",
-            message="Your mock interview feedback has been updated. Check My Interview → Feedback."
+        notify(
+            [interview.candidate],
+            "Interview Feedback Ready",
+            "Your mock interview feedback has been updated. Check My Interview → Feedback."
         )
 
         # 🔔 notify admin (THIS FIXES COUNTER)
-        Notification.objects.create(
-            user=None,
-            title="Feedback Submitted",
-            message=f"Trainer submitted feedback for {interview.candidate.email}",
+        notify_admins(
+            "Feedback Submitted",
+            f"Trainer submitted feedback for {interview.candidate.email}",
             type=Notification.TRAINER
         )
 
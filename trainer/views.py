@@ -11,7 +11,7 @@ from django.utils.timezone import localdate
 from consultation.models import ConsultantSession
 from accounts.decorators import trainer_required
 from mock_interview.models import MockInterview
-from accounts.models import Notification
+from accounts.services.notifications import unread_count
 
 
 
@@ -59,7 +59,7 @@ def trainer_dashboard(request):
     ).count()
 
 
-    trainer_alerts = request.user.notifications.filter(is_read=False).count()
+    trainer_alerts = unread_count(request.user)
 
 
     context = {
@@ -162,7 +162,6 @@ def attend_session(request, session_id):
 
 
 from django.shortcuts import get_object_or_404, redirect
-from accounts.models import Notification
 
 
 # @trainer_required
@@ -230,7 +229,6 @@ from django.contrib import messages
 
 from accounts.decorators import trainer_required
 from consultation.models import ConsultantSession
-from accounts.models import Notification
 
 
 # ================= DASHBOARD =================
@@ -274,6 +272,7 @@ def trainer_dashboard(request):
         "completed_sessions": completed_sessions,
         "attended_sessions": attended_sessions,
         "today_date": today_start.date(),
+        "trainer_alerts": unread_count(request.user),
     })
 
 
@@ -355,10 +354,10 @@ def submit_feedback(request, session_id):
         session.save()
 
         # Notify candidate
-        Notification.objects.create(
-            user=session.user,
-            title="Consultation Completed",
-            message="Trainer has completed your consultation session. Admin will verify shortly."
+        notify_user(
+            session.user,
+            "Consultation Completed",
+            "Trainer has completed your consultation session. Admin will verify shortly."
         )
 
         messages.success(request, "Session marked attended.")
@@ -565,7 +564,6 @@ def trainer_join_mock(request, pk):
     return render(request, "trainer/mock_join.html", {
         "interview": interview
     })
-from accounts.models import Notification
 
 from accounts.utils.alerts import notify_user, admin_alert
 